@@ -0,0 +1,172 @@
+"""
+Syntax Mirror - Başsız (headless) toplu vurgulayıcı
+
+Bir dosya ağacını süreç havuzunda vurgular ve HTML, ANSI renkli metin veya
+JSON aralık dosyaları üretir. tkinter içe aktarılmaz; süreç havuzu ve komut
+satırı ayrıştırıcısı yalnızca kullanıldıklarında yüklenir, böylece işçi
+süreçleri hızlı başlar.
+
+Dil her dosya için uzantısından seçilir; `--language` verilirse tüm dosyalar o
+dille vurgulanır. Okunamayan veya yazılamayan dosyalar çalışmayı durdurmaz:
+özet satırında sayılır, stderr'e yazılır ve çıkış kodu 1 olur.
+
+Kullanım:
+    python -m src.batch KAYNAK [KAYNAK ...] -o ÇIKTI_DİZİNİ [--format html|ansi|json] [-j İŞÇİ]
+                        [--language DİL]
+"""
+import fnmatch
+import os
+import sys
+import time
+
+from src.highlighter.highlighter import SyntaxHighlighter
+from src.highlighter.render import ansi_styles, html_styles, render_ansi, render_html, render_json
+from src.language.definition import available_languages, language_for_path, load_language
+from src.lexer.lexer import Lexer
+
+FORMATS = {"html": ".html", "ansi": ".ansi", "json": ".json"}
+
+# İşçi sürecindeki çıktı biçimi, zorunlu dil (yoksa None) ve dil başına
+# derlenmiş vurgulayıcı ile çözümlenmiş stiller
+_worker = None
+
+
+def _init_worker(output_format, language=None):
+    """Her işçi süreci için ayarları bir kez kaydet; vurgulayıcılar ilk kullanımda oluşturulur"""
+    global _worker
+    _worker = (output_format, language, {})
+
+
+def _highlighter_for(path):
+    """Dosyanın diline ait (vurgulayıcı, stiller) çiftini döndür"""
+    output_format, language, highlighters = _worker
+    definition = load_language(language) if language is not None else language_for_path(path)
+    entry = highlighters.get(definition.path)
+    if entry is None:
+        highlighter = SyntaxHighlighter(language=definition)
+        if output_format == "html":
+            styles = html_styles(highlighter.highlighting_rules)
+        elif output_format == "ansi":
+            styles = ansi_styles(highlighter.highlighting_rules)
+        else:
+            styles = None
+        entry = highlighters[definition.path] = (highlighter, styles)
+    return entry
+
+
+def highlight_file(job):
+    """
+    Tek bir dosyayı vurgula ve çıktıyı yaz. (okunan bayt sayısı, hata) döndürür;
+    dosya okunamaz veya yazılamazsa bayt sayısı 0, hata ise açıklamadır.
+    """
+    source_path, output_path = job
+    output_format = _worker[0]
+    try:
+        highlighter, styles = _highlighter_for(source_path)
+        with open(source_path, "r", encoding="utf-8", errors="replace") as file:
+            text = file.read()
+        spans = highlighter.token_spans(text)
+
+        if output_format == "html":
+            content = render_html(text, spans, styles, title=os.path.basename(source_path))
+        elif output_format == "ansi":
+            content = render_ansi(text, spans, styles)
+        else:
+            content = render_json(spans, path=source_path)
+
+        os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
+        with open(output_path, "w", encoding="utf-8") as file:
+            file.write(content)
+        return os.path.getsize(source_path), None
+    except (OSError, UnicodeError) as error:
+        return 0, f"{source_path}: {error}"
+
+
+def collect_jobs(sources, output_dir, pattern, extension):
+    """
+    Kaynak dosya ve dizinlerden (kaynak, çıktı) yol çiftlerini topla. Tek dosya
+    olarak verilen kaynaklar adlarıyla, dizinlerdeki dosyalar dizine göre göreli
+    yollarıyla yazılır. İki kaynak aynı çıktı yoluna düşerse ValueError yükseltir.
+    """
+    jobs = []
+    for source in sources:
+        if not os.path.isdir(source):
+            # Dosyalar (ve bozuk bağlantılar) burada; okunamayanlar işçide hata olarak sayılır
+            name = os.path.basename(source) + extension
+            jobs.append((source, os.path.join(output_dir, name)))
+            continue
+        for directory, _, files in os.walk(source):
+            for name in sorted(files):
+                if not fnmatch.fnmatch(name, pattern):
+                    continue
+                path = os.path.join(directory, name)
+                relative = os.path.relpath(path, source)
+                jobs.append((path, os.path.join(output_dir, relative + extension)))
+
+    outputs = {}
+    for source_path, output_path in jobs:
+        key = os.path.normcase(os.path.abspath(output_path))
+        previous = outputs.setdefault(key, source_path)
+        if previous != source_path:
+            raise ValueError(f"{previous} ve {source_path} aynı çıktıya yazılır: {output_path}")
+    return jobs
+
+
+def run(jobs, output_format, workers=None, chunksize=8, language=None):
+    """
+    İşleri süreç havuzunda çalıştır. `language` verilmezse her dosyanın dili
+    uzantısından seçilir. (dosya sayısı, bayt, süre, hatalar) döndürür; hatalar
+    başarısız dosyaların açıklamalarıdır.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    start = time.perf_counter()
+    total_bytes = 0
+    failures = []
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(output_format, language)) as executor:
+        for size, failure in executor.map(highlight_file, jobs, chunksize=chunksize):
+            total_bytes += size
+            if failure is not None:
+                failures.append(failure)
+    return len(jobs), total_bytes, time.perf_counter() - start, failures
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Syntax Mirror toplu vurgulayıcı")
+    parser.add_argument("sources", nargs="+", help="vurgulanacak dosyalar veya dizinler")
+    parser.add_argument("-o", "--output", required=True, help="çıktı dizini")
+    parser.add_argument("-f", "--format", choices=sorted(FORMATS), default="html", help="çıktı biçimi")
+    parser.add_argument("-j", "--jobs", type=int, default=None, help="işçi süreç sayısı (varsayılan: çekirdek sayısı)")
+    parser.add_argument("-p", "--pattern", default="*", help="dizinlerde eşleşecek dosya adı deseni")
+    parser.add_argument("--chunksize", type=int, default=8, help="işçiye tek seferde gönderilen dosya sayısı")
+    parser.add_argument("-l", "--language", default=None,
+                        help=f"tüm dosyalar için dil adı veya tanım dosyası ({', '.join(available_languages())}); "
+                             "verilmezse dil dosya uzantısından seçilir")
+    args = parser.parse_args(argv)
+
+    try:
+        language = load_language(args.language).path if args.language is not None else None
+        jobs = collect_jobs(args.sources, args.output, args.pattern, FORMATS[args.format])
+    except ValueError as error:
+        print(error, file=sys.stderr)
+        return 2
+    if not jobs:
+        print("Vurgulanacak dosya bulunamadı", file=sys.stderr)
+        return 1
+
+    files, total_bytes, seconds, failures = run(jobs, args.format, args.jobs, args.chunksize, language)
+    for failure in failures:
+        print(failure, file=sys.stderr)
+    seconds = max(seconds, 1e-9)
+    print(
+        f"{files} dosya ({len(failures)} hatalı), {total_bytes / 1e6:.2f} MB, {seconds:.2f} s: "
+        f"{files / seconds:.1f} dosya/s, {total_bytes / 1e6 / seconds:.2f} MB/s"
+    )
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,131 @@
+"""
+Karşılaştırma testleri için belirlenimci (deterministic) sentetik kaynak kod üreteci.
+
+Aynı profil, boyut ve tohum her zaman aynı metni üretir.
+
+Kullanım:
+    python -m src.benchmarks.corpus [--profile PROFİL] [--size KARAKTER] [--seed TOHUM]
+"""
+import argparse
+import random
+import sys
+
+# Profil -> satır türü ağırlıkları
+PROFILES = {
+    "mixed": {"declaration": 4, "assignment": 4, "call": 3, "block": 2, "comment": 2,
+              "block_comment": 1, "string": 2, "long_line": 0, "error": 0},
+    "comment_heavy": {"declaration": 1, "assignment": 1, "call": 1, "block": 1, "comment": 6,
+                      "block_comment": 4, "string": 1, "long_line": 0, "error": 0},
+    "string_heavy": {"declaration": 1, "assignment": 1, "call": 2, "block": 1, "comment": 1,
+                     "block_comment": 0, "string": 8, "long_line": 0, "error": 0},
+    "long_lines": {"declaration": 1, "assignment": 1, "call": 1, "block": 0, "comment": 0,
+                   "block_comment": 0, "string": 1, "long_line": 3, "error": 0},
+    "error_dense": {"declaration": 2, "assignment": 2, "call": 2, "block": 1, "comment": 1,
+                    "block_comment": 0, "string": 1, "long_line": 0, "error": 4},
+}
+
+TYPES = ("int", "float", "string", "void")
+OPERATORS = ("+", "-", "*", "/", "<", ">", "==", "!=", "&&", "||")
+WORDS = ("count", "total", "index", "value", "result", "name", "item", "node", "left", "right")
+ERROR_CHARS = ("@", "#", "$", "`", "~", "^", "%")
+
+
+class _Generator:
+    """Tek bir rastgele sayı üreteciyle satır üreten yardımcı"""
+    def __init__(self, seed):
+        self.random = random.Random(seed)
+
+    def name(self):
+        return f"{self.random.choice(WORDS)}{self.random.randrange(100)}"
+
+    def operand(self):
+        choice = self.random.random()
+        if choice < 0.5:
+            return self.name()
+        if choice < 0.8:
+            return str(self.random.randrange(10000))
+        return f"{self.random.randrange(1000)}.{self.random.randrange(100)}"
+
+    def expression(self, terms):
+        parts = [self.operand()]
+        for _ in range(terms - 1):
+            parts.append(self.random.choice(OPERATORS))
+            parts.append(self.operand())
+        return " ".join(parts)
+
+    def string(self):
+        words = " ".join(self.random.choice(WORDS) for _ in range(self.random.randint(1, 8)))
+        return f"\"{words}\"" if self.random.random() < 0.7 else f"'{words}'"
+
+    def line(self, kind, indent):
+        pad = "    " * indent
+        if kind == "declaration":
+            return f"{pad}{self.random.choice(TYPES)} {self.name()} = {self.expression(self.random.randint(1, 4))};\n"
+        if kind == "assignment":
+            return f"{pad}{self.name()} = {self.expression(self.random.randint(2, 6))};\n"
+        if kind == "call":
+            args = ", ".join(self.operand() for _ in range(self.random.randint(0, 4)))
+            return f"{pad}{self.name()}({args});\n"
+        if kind == "comment":
+            words = " ".join(self.random.choice(WORDS) for _ in range(self.random.randint(2, 10)))
+            return f"{pad}// {words}\n"
+        if kind == "block_comment":
+            lines = [" ".join(self.random.choice(WORDS) for _ in range(6)) for _ in range(self.random.randint(1, 5))]
+            body = f"\n{pad}   ".join(lines)
+            return f"{pad}/* {body} */\n"
+        if kind == "string":
+            return f"{pad}string {self.name()} = {self.string()} + {self.string()};\n"
+        if kind == "long_line":
+            return f"{pad}{self.name()} = {self.expression(self.random.randint(200, 400))};\n"
+        if kind == "error":
+            chars = "".join(self.random.choice(ERROR_CHARS) for _ in range(self.random.randint(1, 3)))
+            return f"{pad}{self.name()} {chars} {self.expression(2)};\n"
+        raise ValueError(f"Bilinmeyen satır türü: {kind}")
+
+
+def generate(profile="mixed", size=200_000, seed=0):
+    """Verilen profilde yaklaşık `size` karakterlik belirlenimci bir kaynak metin üret"""
+    if profile not in PROFILES:
+        raise ValueError(f"Bilinmeyen profil: {profile} (seçenekler: {', '.join(sorted(PROFILES))})")
+    weights = PROFILES[profile]
+    kinds = [kind for kind, weight in weights.items() if weight]
+    kind_weights = [weights[kind] for kind in kinds]
+
+    generator = _Generator(f"{profile}:{seed}")
+    choose = generator.random.choices
+    parts = []
+    length = 0
+    indent = 0
+    while length < size:
+        kind = choose(kinds, kind_weights)[0]
+        if kind == "block":
+            # Blok aç veya (açık blok varsa) kapat
+            if indent and generator.random.random() < 0.5:
+                indent -= 1
+                line = "    " * indent + "}\n"
+            else:
+                keyword = generator.random.choice(("if", "while"))
+                line = f"{'    ' * indent}{keyword} ({generator.expression(3)}) {{\n"
+                indent += 1
+        else:
+            line = generator.line(kind, indent)
+        parts.append(line)
+        length += len(line)
+
+    while indent:
+        indent -= 1
+        parts.append("    " * indent + "}\n")
+    return "".join(parts)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Sentetik kaynak kod üreteci")
+    parser.add_argument("--profile", choices=sorted(PROFILES), default="mixed", help="token karışımı profili")
+    parser.add_argument("--size", type=int, default=200_000, help="yaklaşık karakter sayısı")
+    parser.add_argument("--seed", type=int, default=0, help="rastgele tohum")
+    args = parser.parse_args(argv)
+    sys.stdout.write(generate(args.profile, args.size, args.seed))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""
+Başsız modüller için içe aktarma süresi bütçesi.
+
+Her modül, `python -X importtime -c "import MODÜL"` ile ayrı ve temiz bir
+yorumlayıcıda birkaç kez içe aktarılır; en iyi kümülatif süre bütçeyle
+karşılaştırılır. Ayrıca yasaklı modüllerin (varsayılan olarak tkinter) hiç
+yüklenmediği denetlenir. Bütçe aşılırsa veya yasaklı bir modül yüklenirse çıkış
+kodu 1 olur. Süreler makineye bağlıdır; bütçe yavaş CI makinelerine göre
+ayarlanmalıdır. Aynı denetim tests/test_imports.py ile pytest altında da çalışır.
+
+Kullanım:
+    python -m src.benchmarks.imports [--module MODÜL ...] [--budget MS] [--repeat N] [--top N]
+"""
+import argparse
+import os
+import subprocess
+import sys
+
+# Tk olmadan ve hızlı yüklenmesi gereken modüller
+MODULES = (
+    "src.lexer.lexer",
+    "src.parser.parser",
+    "src.highlighter.highlighter",
+    "src.gui.worker",
+    "src.batch",
+)
+FORBIDDEN = ("tkinter", "_tkinter")
+
+# Modül başına varsayılan bütçe (ms)
+BUDGET_MS = 60.0
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def import_times(module):
+    """
+    Modülü yeni bir yorumlayıcıda içe aktar; (kümülatif süre ms, {modül: kendi süresi ms})
+    döndür. Kümülatif süre yorumlayıcının kendi başlangıç içe aktarmalarını içermez.
+    """
+    environment = dict(os.environ, PYTHONPATH=ROOT)
+    environment.pop("PYTHONIMPORTTIME", None)
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT, env=environment, capture_output=True, text=True, check=True,
+    )
+
+    total = 0.0
+    own = {}
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:"):].split("|")
+        try:
+            self_us, cumulative_us = int(fields[0]), int(fields[1])
+        except ValueError:
+            continue  # başlık satırı
+        name = fields[2].strip()
+        own[name] = self_us / 1000
+        if name == module:
+            total = cumulative_us / 1000
+    return total, own
+
+
+def measure(module, repeat):
+    """En iyi kümülatif süreyi ve o çalıştırmada yüklenen modülleri döndür"""
+    best = None
+    for _ in range(repeat):
+        total, own = import_times(module)
+        if best is None or total < best[0]:
+            best = (total, own)
+    return best
+
+
+def violations(module, total, own, budget=BUDGET_MS):
+    """Ölçülen bir modülün bütçe aşımı ve yasaklı içe aktarma hatalarını döndür"""
+    failures = []
+    loaded = [name for name in own if name.split(".")[0] in FORBIDDEN]
+    if loaded:
+        failures.append(f"{module}: yasaklı modül yüklendi: {', '.join(loaded)}")
+    if total > budget:
+        failures.append(f"{module}: {total:.1f} ms > bütçe {budget:.1f} ms")
+    return failures
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Başsız modüllerin içe aktarma süresi bütçesi")
+    parser.add_argument("--module", nargs="+", default=list(MODULES), help="ölçülecek modüller")
+    parser.add_argument("--budget", type=float, default=BUDGET_MS, help="modül başına izin verilen süre (ms)")
+    parser.add_argument("--repeat", type=int, default=5, help="tekrar sayısı; en iyi süre kullanılır")
+    parser.add_argument("--top", type=int, default=0, help="her modül için en pahalı N içe aktarmayı göster")
+    args = parser.parse_args(argv)
+
+    failures = []
+    for module in args.module:
+        total, own = measure(module, args.repeat)
+        print(f"{module:<32} {total:8.1f} ms  ({len(own)} modül)")
+        for name, milliseconds in sorted(own.items(), key=lambda item: -item[1])[:args.top]:
+            print(f"    {name:<40} {milliseconds:7.2f} ms")
+        failures.extend(violations(module, total, own, args.budget))
+
+    if failures:
+        for line in failures:
+            print(line, file=sys.stderr)
+        return 1
+    print(f"Bütçe içinde ({args.budget:.1f} ms)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
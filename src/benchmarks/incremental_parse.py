@@ -0,0 +1,113 @@
+"""
+Artımlı ayrıştırmanın tam ayrıştırmayla karşılaştırması.
+
+Sentetik profil metinleri ve rastgele token parçalarından oluşan kısa metinler
+rastgele düzenlemelerle (ekleme, silme, değiştirme) adım adım değiştirilir. Her
+adımda `IncrementalLexer.update` sonucu `IncrementalParser.parse`e verilir ve aynı
+token akışının `Parser.parse` ile tam ayrıştırılmasıyla karşılaştırılır: AST
+metni, hata listesi ve hata konumları (`error_spans`). Fark varsa ilk örnek
+yazdırılır ve çıkış kodu 1 olur. Yeniden ayrıştırılan ifade oranı da yazdırılır.
+
+Kullanım:
+    python -m src.benchmarks.incremental_parse [--cases N] [--steps N] [--seed N]
+"""
+import argparse
+import random
+import sys
+
+from src.benchmarks.corpus import PROFILES, generate
+from src.lexer.incremental import IncrementalLexer
+from src.lexer.lexer import TokenStream
+from src.parser.incremental import IncrementalParser
+from src.parser.parser import Parser
+
+# Düzenlemelerde eklenen parçalar: ileri bakışı ve hata kurtarmayı zorlayan yapılar
+FRAGMENTS = [
+    "if", "else", "elsx", "while", "for", "class", "return", "int", "int[]",
+    "(", ")", "{", "}", "[", "]", ";", ",", "=", "+", "-", "!", "&", "|", "<",
+    "x", "y1", "42", '"s"', " ", "\n", "/* y */", "// y\n", "(a)",
+]
+
+
+def snapshot(lexer):
+    """Artımlı lexer'ın güncel akışının bir sonraki güncellemeden etkilenmeyen kopyası"""
+    types, starts, ends = lexer.columns()
+    return TokenStream(lexer.text, types[:], starts[:], ends[:])
+
+
+def random_text(rng, pieces):
+    """Rastgele parçalardan bir metin oluştur"""
+    return "".join(rng.choice(FRAGMENTS) for _ in range(pieces))
+
+
+def compare(text, rng, steps):
+    """
+    Metni adım adım düzenleyip iki ayrıştırmayı karşılaştır.
+    (ilk farklı adımın açıklaması veya None, yeniden ayrıştırılan, toplam ifade) döndürür.
+    """
+    lexer = IncrementalLexer()
+    lexer.reset(text)
+    incremental = IncrementalParser()
+    incremental.parse(snapshot(lexer))
+    reparsed = total = 0
+
+    for _ in range(steps):
+        start = rng.randint(0, len(text))
+        old_end = min(len(text), start + rng.choice((0, 0, 1, 2, 5)))
+        inserted = random_text(rng, rng.randint(0, 2))
+        previous = text
+        text = text[:start] + inserted + text[old_end:]
+        changed = lexer.update(text, start, old_end, start + len(inserted))
+
+        tokens = snapshot(lexer)
+        root, errors = incremental.parse(tokens, changed)
+        expected_root, expected_errors = Parser(tokens).parse()
+        reparsed += incremental.last_reparsed
+        total += len(root.children)
+
+        spans = [(error.position[0], error.position[1], error.message) for error in expected_errors]
+        if str(root) != str(expected_root):
+            problem = "AST"
+        elif list(errors) != list(expected_errors):
+            problem = "hatalar"
+        elif incremental.error_spans() != spans:
+            problem = "hata konumları"
+        else:
+            continue
+        context = f"{previous!r}: " if len(previous) <= 200 else ""
+        edit = f"konum {start}, {previous[start:old_end]!r} -> {inserted!r}"
+        return f"{problem} farklı: {context}{edit}", reparsed, total
+    return None, reparsed, total
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Artımlı ve tam ayrıştırma karşılaştırması")
+    parser.add_argument("--cases", type=int, default=2000, help="rastgele metin sayısı")
+    parser.add_argument("--steps", type=int, default=8, help="metin başına düzenleme sayısı")
+    parser.add_argument("--size", type=int, default=2000, help="profil metni başına yaklaşık karakter sayısı")
+    parser.add_argument("--seed", type=int, default=0, help="rastgele tohum")
+    args = parser.parse_args(argv)
+
+    rng = random.Random(args.seed)
+    texts = [generate(profile, args.size, args.seed) for profile in sorted(PROFILES)]
+    texts += [random_text(rng, rng.randint(0, 25)) for _ in range(args.cases)]
+
+    failures = []
+    reparsed = total = 0
+    for text in texts:
+        failure, case_reparsed, case_total = compare(text, rng, args.steps)
+        reparsed += case_reparsed
+        total += case_total
+        if failure is not None:
+            failures.append(failure)
+
+    print(f"{len(texts)} metin, {len(texts) * args.steps} düzenleme, "
+          f"yeniden ayrıştırılan ifade oranı %{100 * reparsed / max(total, 1):.1f}, {len(failures)} fark")
+    if failures:
+        print(f"Artımlı ayrıştırma tam ayrıştırmadan farklı: {failures[0]}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
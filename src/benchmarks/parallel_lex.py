@@ -0,0 +1,90 @@
+"""
+Paralel sözcüksel analizin seri analizle karşılaştırması.
+
+Her profil metni ve parça sınırlarını zorlayan özel metinler (sınırı aşan blok
+yorumlar ve diziler, sona yakın kapanmamış "/*" ve tırnaklar, uzun boşluk
+dizileri) hem `Lexer.tokenize` hem `tokenize_parallel` ile taranır. Küçük
+parça boyutuyla metin çok sayıda parçaya bölünür; iki çıktının token sütunları
+bayt bayt karşılaştırılır, fark varsa çıkış kodu 1 olur. Profil metinleri için
+seri ve paralel süreler de yazdırılır.
+
+Kullanım:
+    python -m src.benchmarks.parallel_lex [--size KARAKTER] [--workers N] [--chunk KARAKTER]
+"""
+import argparse
+import os
+import sys
+import time
+
+from src.benchmarks.corpus import PROFILES, generate
+from src.lexer.lexer import Lexer
+from src.lexer.parallel import tokenize_parallel
+
+
+def adversarial_texts(size):
+    """Parça sınırlarında giriş durumunu yanıltmaya çalışan metinler"""
+    line = 'int count = 1; // "yorum" */ içinde\n'
+    lines = max(size // len(line), 8)
+    body = line * lines
+    return {
+        "long_block_comment": "int a;\n/*" + body + "*/\nint b = 2;\n",
+        "long_string": 'x = "' + body.replace('"', "") + '";\n' + body,
+        "single_quote_string": "y = '" + body.replace("'", "") + "';\n" + body,
+        "unclosed_comment": body + "/* kapanmamış\n" + body.replace("*/", ""),
+        "unclosed_string": body + 'z = "kapanmamış\n' + body.replace('"', ""),
+        "closers_in_comment": ("/* \" ' */\n" + body) * 4,
+        "whitespace_runs": ("a" + " \n" * (lines // 4) + "\t\n") * 4,
+        "no_newlines": "int a = 1; " * lines,
+        "comment_markers": ("/*\n" + body + "*/ \"\n" + body + "\"\n") * 2,
+    }
+
+
+def same_tokens(expected, actual):
+    """İki token akışının sütunları bayt bayt aynı mı"""
+    return (expected.types.tobytes() == actual.types.tobytes()
+            and expected.starts.tobytes() == actual.starts.tobytes()
+            and expected.ends.tobytes() == actual.ends.tobytes())
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Paralel ve seri sözcüksel analiz karşılaştırması")
+    parser.add_argument("--size", type=int, default=2_000_000, help="profil başına yaklaşık karakter sayısı")
+    parser.add_argument("--seed", type=int, default=0, help="sentetik metin tohumu")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="işçi süreç sayısı")
+    parser.add_argument("--chunk", type=int, default=4096,
+                        help="en küçük parça boyutu (küçük değerler daha çok sınır üretir)")
+    parser.add_argument("--language", default=None, help="dil adı veya tanım dosyası")
+    args = parser.parse_args(argv)
+
+    lexer = Lexer(language=args.language)
+    workers = max(args.workers, 2)
+    mismatched = []
+
+    texts = {profile: generate(profile, args.size, args.seed) for profile in sorted(PROFILES)}
+    texts.update(adversarial_texts(args.size // 10))
+    for name, text in texts.items():
+        start = time.perf_counter()
+        expected = lexer.tokenize(text)
+        serial = time.perf_counter() - start
+
+        start = time.perf_counter()
+        actual = tokenize_parallel(lexer, text, workers, args.chunk)
+        parallel = time.perf_counter() - start
+
+        matches = same_tokens(expected, actual)
+        if not matches:
+            mismatched.append(name)
+        print(
+            f"{name:<20} {len(expected):>9} token  seri {serial * 1000:8.1f} ms  "
+            f"paralel {parallel * 1000:8.1f} ms  x{serial / max(parallel, 1e-12):.2f}  "
+            f"{'aynı' if matches else 'FARKLI'}"
+        )
+
+    if mismatched:
+        print(f"Paralel çıktı seri çıktıdan farklı: {', '.join(mismatched)}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
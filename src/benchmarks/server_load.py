@@ -0,0 +1,237 @@
+"""
+Vurgulama sunucusu için yerel yük testi.
+
+Aynı süreçte yerel bir TCP portunda bir HighlightServer başlatılır ve tek bir
+istemci bağlantısı üzerinden çok sayıda belge birlikte açılır. Ardından sabit
+bir hızda (--rate düzenleme/s) rastgele belgelere artımlı değişiklikler
+gönderilir ve her değişikliğin çevresindeki görünür alan için semantic tokens
+(range) istenir. İstek gecikmelerinin yüzdelikleri ve son değişiklikten sonra
+tanıların yerleşme süresi raporlanır.
+Son olarak her belgenin sunucudaki tam token verisi, istemcideki metnin baştan
+taranmasıyla karşılaştırılır; fark varsa veya p95 gecikmesi --max-p95'i aşarsa
+çıkış kodu 1 olur. Gecikmeler istemcinin aynı olay döngüsündeki payını da içerir.
+
+Kullanım:
+    python -m src.benchmarks.server_load [--documents 200] [--size 20000] [--edits 2000]
+                                         [--rate 50] [--workers N] [--no-parse]
+                                         [--max-p95 MS]
+"""
+import argparse
+import asyncio
+import random
+import sys
+import time
+
+from src.benchmarks.corpus import PROFILES, generate
+from src.lexer.lexer import Lexer
+from src.lexer.line_index import LineIndex
+from src.server.document import Document
+from src.server.protocol import encode_message, read_message
+from src.server.server import HighlightServer
+
+# Düzenlemelerde eklenen parçalar (yazmaya benzer); arada bir eklenen kapanmamış yorum ve
+# dizi açıcıları belgenin geri kalanını yeniden taratan en kötü durumu sınar
+SNIPPETS = ("x", "x", " ", "1", "\n", "foo(a, b);", "/* not */", "\"text\"", "// note\n",
+            "if (a) { b = 1; }\n", "int value = 42;")
+OPENERS = ("/*", "*/", "\"")
+OPENER_RATE = 0.02
+
+# Range isteğinde istenen görünür satır sayısı
+VIEWPORT_LINES = 60
+
+
+class LoadClient:
+    """İstekleri kimlikleriyle eşleyen ve yayınlanan tanıları kaydeden basit JSON-RPC istemcisi"""
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+        self.diagnostics = {}  # uri -> son yayınlanan sürüm
+        self._next_id = 0
+        self._pending = {}
+        self._task = asyncio.create_task(self._read_loop())
+
+    async def _read_loop(self):
+        while True:
+            message = await read_message(self.reader)
+            if message is None:
+                break
+            if "id" in message and "method" not in message:
+                future = self._pending.pop(message["id"], None)
+                if future is not None and not future.done():
+                    future.set_result(message)
+            elif message.get("method") == "textDocument/publishDiagnostics":
+                params = message["params"]
+                self.diagnostics[params["uri"]] = params.get("version")
+
+    async def request(self, method, params):
+        self._next_id += 1
+        future = asyncio.get_running_loop().create_future()
+        self._pending[self._next_id] = future
+        self.writer.write(encode_message({"jsonrpc": "2.0", "id": self._next_id, "method": method, "params": params}))
+        message = await future
+        if "error" in message:
+            raise RuntimeError(f"{method}: {message['error']['message']}")
+        return message["result"]
+
+    async def notify(self, method, params):
+        self.writer.write(encode_message({"jsonrpc": "2.0", "method": method, "params": params}))
+
+    async def closed(self):
+        """Sunucu bağlantıyı kapatana kadar bekle"""
+        await self._task
+
+    async def close(self):
+        self._task.cancel()
+        self.writer.close()
+
+
+def _position(lines, offset):
+    line, character = lines.line_col(offset)
+    return {"line": line, "character": character}
+
+
+async def _settle(client, versions, timeout=60):
+    """Tüm belgelerin son sürümünün tanıları yayınlanana kadar bekle"""
+    started = time.perf_counter()
+    while any(client.diagnostics.get(uri) != version for uri, version in versions.items()):
+        if time.perf_counter() - started > timeout:
+            raise RuntimeError(f"Tanılar {timeout} saniyede yerleşmedi")
+        await asyncio.sleep(0.005)
+
+
+def _percentiles(samples):
+    ordered = sorted(samples)
+    if not ordered:
+        return {"p50": 0.0, "p95": 0.0, "p99": 0.0, "max": 0.0}
+
+    def pick(fraction):
+        return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))] * 1000
+
+    return {"p50": pick(0.50), "p95": pick(0.95), "p99": pick(0.99), "max": ordered[-1] * 1000}
+
+
+async def run_load(documents, size, edits, rate, profile="mixed", seed=0, workers=None, parse=True):
+    """Yük senaryosunu çalıştır; (aşama -> yüzdelikler, yerleşme süresi, farklı belgeler) döndür"""
+    server = HighlightServer(parse=parse, workers=workers)
+    tcp = await server.serve_tcp("127.0.0.1", 0)
+    host, port = tcp.sockets[0].getsockname()[:2]
+    reader, writer = await asyncio.open_connection(host, port)
+    client = LoadClient(reader, writer)
+    rng = random.Random(seed)
+    timings = {"open": [], "range": [], "full": []}
+
+    try:
+        # Konumlar karakterlerle sayılır; istemci LineIndex ile dönüştürür
+        await client.request("initialize", {"capabilities": {"general": {"positionEncodings": ["utf-32"]}}})
+        await client.notify("initialized", {})
+
+        texts = {f"file:///load/doc{index}.sm": generate(profile, size, seed + index) for index in range(documents)}
+        versions = dict.fromkeys(texts, 1)
+
+        async def open_document(uri):
+            started = time.perf_counter()
+            await client.notify("textDocument/didOpen", {"textDocument": {
+                "uri": uri, "languageId": "default", "version": 1, "text": texts[uri]}})
+            await client.request("textDocument/semanticTokens/full", {"textDocument": {"uri": uri}})
+            timings["open"].append(time.perf_counter() - started)
+
+        await asyncio.gather(*(open_document(uri) for uri in texts))
+        await _settle(client, versions)
+
+        async def edit_document(uri):
+            text = texts[uri]
+            lines = LineIndex(text)
+            start = rng.randrange(len(text) + 1)
+            end = min(len(text), start + rng.choice((0, 0, 1, 3, 20)))
+            if rng.random() < OPENER_RATE:
+                snippet = rng.choice(OPENERS)
+            else:
+                snippet = rng.choice(SNIPPETS) if rng.random() < 0.8 else ""
+            change = {"range": {"start": _position(lines, start), "end": _position(lines, end)}, "text": snippet}
+            texts[uri] = text[:start] + snippet + text[end:]
+            versions[uri] += 1
+
+            started = time.perf_counter()
+            await client.notify("textDocument/didChange", {
+                "textDocument": {"uri": uri, "version": versions[uri]}, "contentChanges": [change]})
+            line = lines.line_of(start)
+            first = max(0, line - VIEWPORT_LINES // 2)
+            await client.request("textDocument/semanticTokens/range", {
+                "textDocument": {"uri": uri},
+                "range": {"start": {"line": first, "character": 0},
+                          "end": {"line": first + VIEWPORT_LINES, "character": 0}}})
+            timings["range"].append(time.perf_counter() - started)
+
+        # Düzenlemeler sabit hızda rastgele belgelere gönderilir; yanıtlar beklenmeden
+        # sonraki düzenleme zamanı gelince gönderilir
+        uris = list(texts)
+        tasks = []
+        began = time.perf_counter()
+        for index in range(edits):
+            delay = began + index / rate - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            tasks.append(asyncio.create_task(edit_document(rng.choice(uris))))
+        await asyncio.gather(*tasks)
+        edited = time.perf_counter()
+
+        await _settle(client, versions)
+        settle = time.perf_counter() - edited
+
+        # Sunucunun artımlı durumu baştan taramayla aynı olmalı
+        reference_lexer = Lexer()
+        mismatched = []
+        for uri, text in texts.items():
+            started = time.perf_counter()
+            result = await client.request("textDocument/semanticTokens/full", {"textDocument": {"uri": uri}})
+            timings["full"].append(time.perf_counter() - started)
+            reference = Document(uri, text, 0, reference_lexer, parse=False, utf16=False).semantic_tokens()
+            if result["data"] != reference:
+                mismatched.append(uri)
+
+        await client.request("shutdown", None)
+        await client.notify("exit", None)
+        await client.closed()
+    finally:
+        await client.close()
+        tcp.close()
+        await tcp.wait_closed()
+        server.close()
+
+    return {stage: _percentiles(samples) for stage, samples in timings.items()}, settle, mismatched
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Vurgulama sunucusu yük testi")
+    parser.add_argument("--documents", type=int, default=200, help="açık belge sayısı")
+    parser.add_argument("--size", type=int, default=20_000, help="belge başına yaklaşık karakter sayısı")
+    parser.add_argument("--edits", type=int, default=2000, help="toplam düzenleme sayısı")
+    parser.add_argument("--rate", type=float, default=50.0, help="saniyedeki düzenleme sayısı (tüm belgelerde)")
+    parser.add_argument("--profile", choices=sorted(PROFILES), default="mixed", help="sentetik metin profili")
+    parser.add_argument("--seed", type=int, default=0, help="rastgelelik tohumu")
+    parser.add_argument("--workers", type=int, default=None, help="sunucunun analiz iş parçacığı sayısı")
+    parser.add_argument("--no-parse", action="store_true", help="sunucuda ayrıştırmayı kapat")
+    parser.add_argument("--max-p95", type=float, default=None, help="range isteklerinin izin verilen p95 gecikmesi (ms)")
+    args = parser.parse_args(argv)
+
+    stages, settle, mismatched = asyncio.run(run_load(
+        args.documents, args.size, args.edits, args.rate, args.profile, args.seed, args.workers,
+        not args.no_parse
+    ))
+    for stage, result in stages.items():
+        print(f"{stage:<6} p50 {result['p50']:7.2f} ms  p95 {result['p95']:7.2f} ms  "
+              f"p99 {result['p99']:7.2f} ms  en çok {result['max']:7.2f} ms")
+    print(f"Tanıların yerleşmesi: {settle * 1000:.1f} ms")
+
+    status = 0
+    if mismatched:
+        print(f"{len(mismatched)} belgede token verisi baştan taramadan farklı: {mismatched[0]} ...", file=sys.stderr)
+        status = 1
+    if args.max_p95 is not None and stages["range"]["p95"] > args.max_p95:
+        print(f"range p95 {stages['range']['p95']:.2f} ms > {args.max_p95:.2f} ms", file=sys.stderr)
+        status = 1
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,120 @@
+"""
+Vurgulama çıktısı biçimlerinin boyut ve hız karşılaştırması.
+
+Her profil için `SyntaxHighlighter.highlight` sonucu olan (başlangıç, bitiş,
+stil sözlüğü) listesi ile `highlight_encoded` sonucu olan sıkıştırılmış ikili
+veri karşılaştırılır: oluşturma süresi, bellekte tutulan boyut, süreçler arası
+aktarım boyutu (pickle) ve aktarılan verinin alıcıda stilleriyle birlikte
+geri çözülmesi. Token akışı ve satır dizini ölçüm dışında hazırlanır. Çözülen
+aralıklar token_spans ile karşılaştırılır; fark varsa çıkış kodu 1 olur.
+
+Kullanım:
+    python -m src.benchmarks.spans [--size KARAKTER] [--profile PROFİL ...] [--repeat N]
+"""
+import argparse
+import pickle
+import sys
+import time
+import tracemalloc
+
+from src.benchmarks.corpus import PROFILES, generate
+from src.highlighter.highlighter import SyntaxHighlighter
+from src.highlighter.spans import decode_spans, span_view, style_table
+
+
+def best_time(function, repeat):
+    """En iyi süreyi ve son çalıştırmanın sonucunu döndür"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def retained(function):
+    """Sonucun bellekte tuttuğu bayt sayısı"""
+    tracemalloc.start()
+    result = function()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return current
+
+
+def run_profile(profile, size, seed, repeat):
+    """Bir profil için iki biçimi ölç; biçim adı -> sonuç sözlüğü ve eşleşme durumunu döndür"""
+    text = generate(profile, size, seed)
+    highlighter = SyntaxHighlighter()
+    lines = highlighter.line_index(text)
+    highlighter.set_tokens(text, highlighter.lexer.tokenize(text), lines)
+    table = style_table(highlighter.highlighting_rules)
+
+    def tuples_receive(payload):
+        return pickle.loads(payload)
+
+    def encoded_receive(payload):
+        # Alıcı bayt tamponunu kopyalamadan görüntüler ve stilleri tür başına çözer
+        return decode_spans(span_view(payload), lines.starts, table)
+
+    results = {}
+    formats = (
+        ("tuples", lambda: highlighter.highlight(text), lambda result: pickle.dumps(result, pickle.HIGHEST_PROTOCOL),
+         tuples_receive),
+        ("encoded", lambda: highlighter.highlight_encoded(text), lambda result: result.tobytes(),
+         encoded_receive),
+    )
+    for name, build, serialize, receive in formats:
+        build_seconds, result = best_time(build, repeat)
+        memory = retained(build)
+        send_seconds, payload = best_time(lambda: serialize(result), repeat)
+        receive_seconds, _ = best_time(lambda: receive(payload), repeat)
+        results[name] = {
+            "build": build_seconds,
+            "bytes": memory,
+            "payload": len(payload),
+            "send": send_seconds,
+            "receive": receive_seconds,
+        }
+
+    spans = highlighter.token_spans(text)
+    matches = decode_spans(highlighter.highlight_encoded(text), lines.starts) == spans
+    return len(spans), results, matches
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Vurgulama çıktısı biçimleri karşılaştırması")
+    parser.add_argument("--size", type=int, default=200_000, help="profil başına yaklaşık karakter sayısı")
+    parser.add_argument("--seed", type=int, default=0, help="sentetik metin tohumu")
+    parser.add_argument("--profile", nargs="+", choices=sorted(PROFILES), default=sorted(PROFILES),
+                        help="ölçülecek profiller")
+    parser.add_argument("--repeat", type=int, default=3, help="zamanlama tekrar sayısı")
+    args = parser.parse_args(argv)
+
+    mismatched = []
+    for profile in args.profile:
+        count, results, matches = run_profile(profile, args.size, args.seed, args.repeat)
+        if not matches:
+            mismatched.append(profile)
+        print(f"{profile} ({count} aralık)")
+        for name, result in results.items():
+            print(
+                f"  {name:<8} oluşturma {result['build'] * 1000:7.1f} ms  "
+                f"bellek {result['bytes'] / 1e6:7.2f} MB  aktarım {result['payload'] / 1e6:6.2f} MB  "
+                f"gönderme {result['send'] * 1000:6.1f} ms  alma {result['receive'] * 1000:6.1f} ms"
+            )
+        tuples, encoded = results["tuples"], results["encoded"]
+        print(
+            f"  oran     oluşturma x{tuples['build'] / max(encoded['build'], 1e-12):.1f}  "
+            f"bellek x{tuples['bytes'] / max(encoded['bytes'], 1):.1f}  "
+            f"aktarım x{tuples['payload'] / max(encoded['payload'], 1):.1f}"
+        )
+
+    if mismatched:
+        print(f"Çözülen aralıklar token_spans'tan farklı: {', '.join(mismatched)}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,256 @@
+"""
+Lexer, vurgulayıcı, widget etiketleme ve ayrıştırıcı aşamaları için karşılaştırma
+testi paketi. Her profil için sentetik bir metin üretilir; her aşamanın en iyi
+süresi, token/s hızı ve tepe belleği ölçülür. Sonuçlar JSON temel çizgisi olarak
+kaydedilebilir; bir temel çizgiyle karşılaştırıldığında eşiği aşan gerileme varsa
+çıkış kodu 1 olur.
+
+Widget aşaması, bir ekran varsa (ör. `xvfb-run` altında) gerçek bir Tk Text
+widget'ı, yoksa Tk çağrılarını kaydeden sahte bir widget kullanır. `widget`
+tüm belgeyi etiketler; `widget_edit` belgenin ortasındaki tek karakterlik bir
+düzenlemeden sonra yalnızca değişen aralıkları etiketler ve sahte widget'ta
+düzenleme başına Tk çağrısı sayısını raporlar.
+
+Kullanım:
+    python -m src.benchmarks.suite [--size KARAKTER] [--profile PROFİL ...] [--stage AŞAMA ...]
+                                   [--save TEMEL.json] [--baseline TEMEL.json] [--threshold 0.25]
+                                   [--widget auto|tk|mock]
+"""
+import argparse
+import json
+import platform
+import sys
+import time
+import tracemalloc
+
+from src.benchmarks.corpus import PROFILES, generate
+from src.highlighter.highlighter import SyntaxHighlighter
+from src.lexer.lexer import Lexer
+from src.parser.parser import Parser
+
+STAGES = ("lex", "highlight", "widget", "widget_edit", "parse")
+
+
+class MockTextWidget:
+    """Vurgulayıcının kullandığı Text widget çağrılarını yalnızca sayan sahte widget"""
+    def __init__(self):
+        self.tag_calls = 0
+        self.tagged_ranges = 0
+
+    def __str__(self):
+        return ".mock_text"
+
+    def tag_configure(self, tag, **options):
+        pass
+
+    def tag_raise(self, tag):
+        pass
+
+    def tag_remove(self, tag, first, last):
+        self.tag_calls += 1
+
+    def tag_add(self, tag, *indices):
+        self.tag_calls += 1
+        self.tagged_ranges += len(indices) // 2
+
+
+def _mock_widget(highlighter):
+    """Sahte widget oluştur; Tk yazı tipi nesneleri yerine yer tutucular kullan"""
+    adapter = highlighter.widget_adapter
+    adapter.normal_font = adapter.bold_font = "mock"
+    adapter.italic_font = adapter.bold_italic_font = "mock"
+    return MockTextWidget(), None
+
+
+def _tk_widget(text):
+    """Metni içeren gerçek bir Tk Text widget'ı oluştur; ekran yoksa TclError yükselir"""
+    import tkinter as tk
+    root = tk.Tk()
+    root.withdraw()
+    widget = tk.Text(root)
+    widget.insert("1.0", text)
+    return widget, root
+
+
+def make_widget(mode, highlighter, text):
+    """(widget, tk_kökü, kullanılan_mod) döndür"""
+    if mode in ("auto", "tk"):
+        try:
+            widget, root = _tk_widget(text)
+            return widget, root, "tk"
+        except Exception:
+            if mode == "tk":
+                raise
+    widget, root = _mock_widget(highlighter)
+    return widget, root, "mock"
+
+
+def measure(function, repeat):
+    """En iyi süreyi ve tek bir çalıştırmanın tepe belleğini ölç"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+
+    tracemalloc.start()
+    function()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best, peak
+
+
+def run_profile(profile, size, seed, stages, repeat, widget_mode):
+    """Bir profil için seçilen aşamaları ölç; aşama adı -> sonuç sözlüğü döndür"""
+    text = generate(profile, size, seed)
+    lexer = Lexer()
+    tokens = lexer.tokenize(text)
+    token_count = len(tokens)
+    results = {}
+
+    def record(stage, function, **extra):
+        seconds, peak = measure(function, repeat)
+        results[stage] = {
+            "seconds": seconds,
+            "tokens": token_count,
+            "tokens_per_s": token_count / max(seconds, 1e-12),
+            "peak_bytes": peak,
+            **extra,
+        }
+
+    if "lex" in stages:
+        record("lex", lambda: lexer.tokenize(text))
+
+    if "highlight" in stages:
+        # Her çalıştırmada yeni bir vurgulayıcı kullanılır; önceki çalıştırmanın akışı yeniden kullanılmaz
+        record("highlight", lambda: SyntaxHighlighter().highlight(text))
+
+    if "widget" in stages:
+        highlighter = SyntaxHighlighter()
+        widget, root, mode = make_widget(widget_mode, highlighter, text)
+        try:
+            # Token akışı ve satır dizini ölçüm dışında hazırlanır; yalnızca etiketleme ölçülür
+            highlighter.set_tokens(text, tokens, highlighter.line_index(text))
+
+            def tag_all():
+                # Uygulanan aralıkların kaydı bırakılır; her çalıştırma tüm belgeyi etiketler
+                highlighter.forget_widget(widget)
+                highlighter.apply_highlighting_to_widget(widget, text)
+
+            record("widget", tag_all, widget=mode)
+        finally:
+            if root is not None:
+                root.destroy()
+
+    if "widget_edit" in stages:
+        highlighter = SyntaxHighlighter()
+        widget, root, mode = make_widget(widget_mode, highlighter, text)
+        try:
+            # Belgenin ortasındaki bir tanımlayıcı karakteri hata karakteriyle değiştirilir;
+            # çalıştırmalar iki sürüm arasında gidip gelir, yalnızca değişen aralıklar etiketlenir
+            position = len(text) // 2
+            while position < len(text) and not text[position].isalpha():
+                position += 1
+            edited = text[:position] + "@" + text[position + 1:]
+            versions = [(text, tokens), (edited, lexer.tokenize(edited))]
+            lines = {id(version): highlighter.line_index(version).copy() for version, _ in versions}
+            highlighter.set_tokens(text, tokens, lines[id(text)])
+            highlighter.apply_highlighting_to_widget(widget, text)
+            calls_before = getattr(widget, "tag_calls", 0)
+            state = {"current": 0, "cycles": 0}
+
+            def keystroke():
+                state["current"] ^= 1
+                state["cycles"] += 1
+                version, version_tokens = versions[state["current"]]
+                highlighter.set_tokens(version, version_tokens, lines[id(version)])
+                highlighter.apply_highlighting_to_widget(
+                    widget, version, edit=(position, position + 1, position + 1)
+                )
+
+            record("widget_edit", keystroke, widget=mode)
+            if hasattr(widget, "tag_calls"):
+                results["widget_edit"]["tag_calls"] = (widget.tag_calls - calls_before) / state["cycles"]
+        finally:
+            if root is not None:
+                root.destroy()
+
+    if "parse" in stages:
+        record("parse", lambda: Parser(tokens).parse())
+
+    return results
+
+
+def compare(results, baseline, threshold):
+    """Temel çizgiye göre süre veya bellekte eşiği aşan gerilemelerin listesini döndür"""
+    regressions = []
+    for key, result in results.items():
+        base = baseline.get("results", {}).get(key)
+        if base is None:
+            continue
+        for metric in ("seconds", "peak_bytes"):
+            if base[metric] and result[metric] > base[metric] * (1 + threshold):
+                regressions.append(
+                    f"{key} {metric}: {base[metric]:.6g} -> {result[metric]:.6g} "
+                    f"(+{(result[metric] / base[metric] - 1) * 100:.1f}%)"
+                )
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Syntax Mirror karşılaştırma testi paketi")
+    parser.add_argument("--size", type=int, default=200_000, help="profil başına yaklaşık karakter sayısı")
+    parser.add_argument("--seed", type=int, default=0, help="sentetik metin tohumu")
+    parser.add_argument("--profile", nargs="+", choices=sorted(PROFILES), default=sorted(PROFILES),
+                        help="ölçülecek profiller")
+    parser.add_argument("--stage", nargs="+", choices=STAGES, default=list(STAGES), help="ölçülecek aşamalar")
+    parser.add_argument("--repeat", type=int, default=3, help="zamanlama tekrar sayısı")
+    parser.add_argument("--widget", choices=("auto", "tk", "mock"), default="auto", help="widget aşaması için widget türü")
+    parser.add_argument("--save", help="sonuçları bu JSON dosyasına temel çizgi olarak kaydet")
+    parser.add_argument("--baseline", help="karşılaştırılacak JSON temel çizgisi")
+    parser.add_argument("--threshold", type=float, default=0.25, help="izin verilen göreli gerileme (0.25 = %%25)")
+    args = parser.parse_args(argv)
+
+    results = {}
+    for profile in args.profile:
+        for stage, result in run_profile(profile, args.size, args.seed, args.stage,
+                                         args.repeat, args.widget).items():
+            key = f"{stage}/{profile}"
+            results[key] = result
+            print(
+                f"{key:<26} {result['seconds'] * 1000:9.1f} ms  "
+                f"{result['tokens_per_s'] / 1e6:6.2f} M token/s  tepe {result['peak_bytes'] / 1e6:8.1f} MB"
+                + (f"  ({result['widget']})" if "widget" in result else "")
+                + (f"  {result['tag_calls']:.1f} Tk çağrısı/düzenleme" if "tag_calls" in result else "")
+            )
+
+    report = {
+        "size": args.size,
+        "seed": args.seed,
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "results": results,
+    }
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as file:
+            json.dump(report, file, indent=2)
+        print(f"Temel çizgi kaydedildi: {args.save}")
+
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as file:
+            baseline = json.load(file)
+        if (baseline.get("size"), baseline.get("seed")) != (args.size, args.seed):
+            print("Uyarı: temel çizgi farklı boyut veya tohumla oluşturulmuş", file=sys.stderr)
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"Gerileme (eşik %{args.threshold * 100:.0f}):", file=sys.stderr)
+            for line in regressions:
+                print(f"  {line}", file=sys.stderr)
+            return 1
+        print(f"Gerileme yok (eşik %{args.threshold * 100:.0f})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,79 @@
+"""
+TokenStream ile eski Token nesnesi listesinin bellek ve süre karşılaştırması.
+
+Kullanım:
+    python -m src.benchmarks.token_stream [--repeat N] [--size KOPYA]
+"""
+import argparse
+import os
+import time
+import tracemalloc
+
+from src.lexer.lexer import Lexer, Token, TokenType
+
+SAMPLE_PATH = os.path.join(os.path.dirname(__file__), "..", "..", "tests", "sample_code.txt")
+
+
+def tokenize_to_list(lexer, text):
+    """Eski davranış: her lexeme için bir Token nesnesi içeren liste"""
+    tokens = []
+    position = 0
+    for match in lexer.regex.finditer(text):
+        if match.start() > position:
+            tokens.append(Token(TokenType.ERROR, text[position:match.start()], (position, match.start())))
+        token_type = None
+        for group_name, group_value in match.groupdict().items():
+            if group_value is not None:
+                token_type = lexer.group_to_type[group_name]
+                break
+        tokens.append(Token(token_type, match.group(0), (match.start(), match.end())))
+        position = match.end()
+    if position < len(text):
+        tokens.append(Token(TokenType.ERROR, text[position:], (position, len(text))))
+    return tokens
+
+
+def measure(function, text, repeat):
+    """En iyi süreyi ve sonucun tuttuğu tepe belleği ölç"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function(text)
+        best = min(best, time.perf_counter() - start)
+
+    tracemalloc.start()
+    result = function(text)
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best, current, peak, len(result)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="TokenStream ve Token listesi karşılaştırması")
+    parser.add_argument("--repeat", type=int, default=5, help="zamanlama tekrar sayısı")
+    parser.add_argument("--size", type=int, default=2000, help="örnek kodun kaç kez çoğaltılacağı")
+    args = parser.parse_args(argv)
+
+    with open(SAMPLE_PATH, "r") as file:
+        text = file.read() * args.size
+
+    lexer = Lexer()
+    results = {
+        "Token listesi": measure(lambda t: tokenize_to_list(lexer, t), text, args.repeat),
+        "TokenStream": measure(lexer.tokenize, text, args.repeat),
+    }
+
+    print(f"Girdi: {len(text) / 1e6:.1f} MB")
+    for name, (seconds, retained, peak, count) in results.items():
+        print(
+            f"{name:<14} {seconds * 1000:9.1f} ms  {count / seconds / 1e6:6.2f} M token/s  "
+            f"tutulan {retained / 1e6:8.1f} MB  tepe {peak / 1e6:8.1f} MB  "
+            f"({retained / count:6.1f} bayt/token)"
+        )
+
+    old, new = results["Token listesi"], results["TokenStream"]
+    print(f"Hızlanma: {old[0] / new[0]:.2f}x, bellek azalması: {old[1] / new[1]:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
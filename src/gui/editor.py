@@ -1,12 +1,23 @@
 import tkinter as tk
-from tkinter import scrolledtext, filedialog, messagebox, font
+from tkinter import ttk, filedialog, messagebox, font
 import os
 
+from src import instrumentation
 from src.highlighter.highlighter import SyntaxHighlighter
+from src.highlighter.cache import HighlightCache
+from src.gui.tab import EditorTab
+from src.gui.worker import AnalysisWorker
+from src.lexer.lexer import TokenType
 
 class SyntaxHighlighterGUI:
-    """GUI application for Syntax Mirror"""
-    def __init__(self, root):
+    """
+    GUI application for Syntax Mirror. Belgeler sekmelerde açılır; tüm sekmeler
+    tek bir derlenmiş lexer'ı, vurgulama yapılandırmasını ve analiz işçisini
+    paylaşır, her sekme kendi metin ve vurgulama durumunu tutar (src.gui.tab).
+    """
+    def __init__(self, root, highlight_delay=30, viewport_only=True, viewport_margin=None,
+                 analyze_syntax=False, cache_bytes=32 * 1024 * 1024, show_metrics=False, language=None,
+                 background_delay=500):
         self.root = root
         self.root.title("Syntax Mirror")
         self.root.geometry("900x600")
@@ -15,19 +26,56 @@ class SyntaxHighlighterGUI:
         default_font = font.nametofont("TkFixedFont")
         default_font.configure(family="Courier New", size=12)
         
-        # Vurgulayıcıyı oluştur
-        self.highlighter = SyntaxHighlighter()
+        # Vurgulayıcıyı oluştur; token'lar arka plan işçisinden gelir. Yazı tipleri,
+        # etiket stilleri ve derlenmiş lexer tüm sekmelerce paylaşılır; vurgulayıcı her
+        # işlemden önce ilgili sekmenin token akışına yönlendirilir.
+        self.highlighter = SyntaxHighlighter(language=language)
+        self.highlighter_document = None  # Vurgulayıcıya token akışı verilmiş sekme
         
-        # Dosya yolu değişkenini oluştur
-        self.current_file = None
+        # Sözcüksel analiz (ve isteğe bağlı ayrıştırma) arka plan iş parçacığında yapılır;
+        # yalnızca etiketleme UI iş parçacığına after_idle ile geri aktarılır. Daha önce
+        # görülmüş metin durumları (cache_bytes > 0 ise) önbellekten alınır; etkin olmayan
+        # sekmelerin bıraktığı token akışları da oradan geri yüklenir.
+        self.worker = AnalysisWorker(
+            lambda result: self.root.after_idle(self.apply_analysis, result),
+            parse=analyze_syntax,
+            cache=HighlightCache(cache_bytes) if cache_bytes else None,
+            lexer=self.highlighter.lexer
+        )
+        
+        # Olay güdümlü vurgulama: son düzenlemeden sonraki bekleme süresi (ms) ve
+        # sekmeler arasında tekil içerik nesli sayacı
+        self.highlight_delay = highlight_delay
+        self._generation = 0
+        
+        # Görünüm alanı modu: yalnızca görünen satırlar ve bir kenar payı etiketlenir.
+        # Kenar payı verilmezse görünen satır sayısı kadardır.
+        self.viewport_only = viewport_only
+        self.viewport_margin = viewport_margin
+        self.visible_line_count = 40  # Gizli sekmelerin görünüm alanı tahmini için
+        
+        # Etkin olmayan sekmeler, etkin sekme boştayken ve background_delay (ms) aralıklarla
+        # birer birer vurgulanır
+        self.background_delay = background_delay
+        self._background_job = None
+        self._background_tab = None
+        
+        # İsteğe bağlı aşama ölçümleri ve durum çubuğundaki özetleri
+        self.show_metrics = tk.BooleanVar(value=show_metrics)
+        if show_metrics and instrumentation.active is None:
+            instrumentation.enable()
+        
+        # Açık sekmeler (notebook sırasıyla) ve seçili sekme
+        self.tabs = []
+        self.active_tab = None
         
         # GUI bileşenlerini oluştur
         self.create_menu()
         self.create_editor()
         self.create_status_bar()
         
-        # İlk güncellemeyi zamanla
-        self.update_highlighting()
+        # İlk (boş) sekmeyi aç
+        self.new_file()
     
     def create_menu(self):
         """Menü çubuğunu oluştur"""
@@ -39,6 +87,7 @@ class SyntaxHighlighterGUI:
         file_menu.add_command(label="Aç", command=self.open_file, accelerator="Ctrl+O")
         file_menu.add_command(label="Kaydet", command=self.save_file, accelerator="Ctrl+S")
         file_menu.add_command(label="Farklı Kaydet", command=self.save_as_file, accelerator="Ctrl+Shift+S")
+        file_menu.add_command(label="Sekmeyi Kapat", command=self.close_tab, accelerator="Ctrl+W")
         file_menu.add_separator()
         file_menu.add_command(label="Çıkış", command=self.root.quit, accelerator="Alt+F4")
         menubar.add_cascade(label="Dosya", menu=file_menu)
@@ -53,6 +102,18 @@ class SyntaxHighlighterGUI:
         edit_menu.add_command(label="Yapıştır", command=lambda: self.editor.event_generate("<<Paste>>"), accelerator="Ctrl+V")
         menubar.add_cascade(label="Düzenle", menu=edit_menu)
         
+        # Görünüm menüsü
+        view_menu = tk.Menu(menubar, tearoff=0)
+        view_menu.add_command(label="Katla/Aç", command=lambda: self.active_tab.toggle_fold(),
+                              accelerator="Ctrl+[")
+        view_menu.add_command(label="Tümünü Katla", command=lambda: self.active_tab.fold_all())
+        view_menu.add_command(label="Tümünü Aç", command=lambda: self.active_tab.unfold_all(),
+                              accelerator="Ctrl+]")
+        view_menu.add_separator()
+        view_menu.add_checkbutton(label="Performans Ölçümleri", variable=self.show_metrics,
+                                  command=self.toggle_metrics)
+        menubar.add_cascade(label="Görünüm", menu=view_menu)
+        
         # Yardım menüsü
         help_menu = tk.Menu(menubar, tearoff=0)
         help_menu.add_command(label="Hakkında", command=self.show_about)
@@ -65,24 +126,101 @@ class SyntaxHighlighterGUI:
         self.root.bind("<Control-o>", lambda e: self.open_file())
         self.root.bind("<Control-s>", lambda e: self.save_file())
         self.root.bind("<Control-S>", lambda e: self.save_as_file())
+        self.root.bind("<Control-w>", lambda e: self.close_tab())
+        self.root.bind("<Control-bracketleft>", lambda e: self.active_tab.toggle_fold())
+        self.root.bind("<Control-bracketright>", lambda e: self.active_tab.unfold_all())
     
     def create_editor(self):
-        """Metin editörü bileşenini oluştur"""
-        # Editör çerçevesini oluştur
-        editor_frame = tk.Frame(self.root)
-        editor_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
-        
-        # Satır numaralarıyla kaydırılabilir metin widget'ı oluştur
-        self.editor = scrolledtext.ScrolledText(
-            editor_frame,
-            wrap=tk.WORD,
-            undo=True,
-            font="TkFixedFont"
-        )
-        self.editor.pack(fill=tk.BOTH, expand=True)
+        """Belge sekmelerini tutan notebook bileşenini oluştur"""
+        self.notebook = ttk.Notebook(self.root)
+        self.notebook.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        self.notebook.bind("<<NotebookTabChanged>>", self.on_tab_changed)
+        self.notebook.bind("<Destroy>", lambda e: self.worker.stop())
+    
+    @property
+    def editor(self):
+        """Seçili sekmenin Text widget'ı"""
+        return self.active_tab.editor
+    
+    @property
+    def current_file(self):
+        """Seçili sekmenin dosya yolu"""
+        return self.active_tab.path
+    
+    def next_generation(self):
+        """Sekmeler arasında tekil yeni bir içerik nesli döndür"""
+        self._generation += 1
+        return self._generation
+    
+    def add_tab(self, select=True):
+        """Yeni bir belge sekmesi ekle"""
+        tab = EditorTab(self, self.notebook)
+        self.tabs.append(tab)
+        self.notebook.add(tab.frame, text=tab.title)
+        if select:
+            self.notebook.select(tab.frame)
+            self.on_tab_changed()
+        tab.schedule_highlighting()
+        return tab
+    
+    def _tab_for_frame(self, frame_name):
+        for tab in self.tabs:
+            if str(tab.frame) == frame_name:
+                return tab
+        return None
+    
+    def on_tab_changed(self, event=None):
+        """Seçili sekme değişti: öncekinin token akışını bırak, yenisini etkinleştir"""
+        tab = self._tab_for_frame(str(self.notebook.select()))
+        if tab is None or tab is self.active_tab:
+            return
+        previous, self.active_tab = self.active_tab, tab
+        if previous is not None and not previous.closed:
+            previous.release()
+        tab.activate()
+        self.update_title()
+        self.update_status_bar()
+    
+    def update_title(self):
+        """Pencere başlığını ve seçili sekmenin etiketini güncelle"""
+        tab = self.active_tab
+        self.notebook.tab(tab.frame, text=tab.title)
+        if tab.path:
+            self.root.title(f"Syntax Mirror - {os.path.basename(tab.path)}")
+        else:
+            self.root.title("Syntax Mirror")
+    
+    def apply_analysis(self, result):
+        """Arka plan işçisinin sonucunu, işi gönderen sekmeye ilet"""
+        result.document.apply_analysis(result)
+    
+    def schedule_background(self):
+        """Etkin olmayan sekmelerin vurgulamasını düşük öncelikle zamanla"""
+        if self._background_job is None:
+            self._background_job = self.root.after(self.background_delay, self._highlight_background)
+    
+    def _highlight_background(self):
+        """
+        Etkin sekme boştaysa ve işçide başka bir arka plan işi yoksa, vurgulaması
+        güncel olmayan bir sonraki etkin olmayan sekmeyi işçiye gönder
+        """
+        self._background_job = None
+        active = self.active_tab
+        pending = [
+            tab for tab in self.tabs
+            if tab is not active and tab.loading is None and tab.needs_highlighting()
+        ]
+        if not pending:
+            return
+        
+        running = self._background_tab
+        if not active.is_idle() or (running is not None and running.is_analyzing()):
+            # Etkin sekmenin işleri ve süren arka plan işi önce biter
+            self.schedule_background()
+            return
         
-        # Olayları bağla
-        self.editor.bind("<KeyRelease>", self.on_text_change)
+        self._background_tab = pending[0]
+        pending[0].submit()
     
     def create_status_bar(self):
         """Alt kısımda durum çubuğunu oluştur"""
@@ -95,45 +233,55 @@ class SyntaxHighlighterGUI:
         )
         self.status_bar.pack(side=tk.BOTTOM, fill=tk.X)
     
-    def update_highlighting(self):
-        """Editör içeriğine sözdizimi vurgulaması uygula"""
-        text_content = self.editor.get("1.0", tk.END)
-        self.highlighter.apply_highlighting_to_widget(self.editor, text_content)
-        
-        # Sonraki güncellemeyi zamanla
-        self.root.after(500, self.update_highlighting)
-    
     def on_text_change(self, event=None):
-        """Metin değişikliği olaylarını işle"""
-        # Durum çubuğundaki imleç konumunu güncelle
-        cursor_position = self.editor.index(tk.INSERT)
+        """Metin değişikliği ve imleç hareketi olaylarını işle"""
+        self.update_status_bar()
+        if self.active_tab is not None:
+            self.active_tab.update_bracket_match()
+    
+    def update_status_bar(self):
+        """Durum çubuğundaki imleç konumunu güncelle"""
+        tab = self.active_tab
+        if tab is None:
+            return
+        cursor_position = tab.editor.index(tk.INSERT)
         line, column = cursor_position.split(".")
-        self.status_bar.config(text=f"Satır: {line} | Sütun: {column}")
+        status = f"Satır: {line} | Sütun: {column}"
         
-    def new_file(self):
-        """Yeni dosya oluştur"""
-        if self.editor.edit_modified():
-            save_prompt = messagebox.askyesnocancel("Değişiklikleri Kaydet", "Mevcut dosyadaki değişiklikleri kaydetmek istiyor musunuz?")
-            if save_prompt is None:  # İptal
-                return
-            elif save_prompt:  # Evet
-                self.save_file()
+        # Karakter konumu ve imleçteki token, sekmenin son vurgulanan metninin satır
+        # dizininden ve token akışından ikili aramayla bulunur
+        if tab.use_tokens():
+            text = tab.highlighted_text
+            offset = tab.line_index.offset(int(line) - 1, int(column))
+            status += f" | Konum: {offset}"
+            token = self.highlighter.get_token_at_position(text, offset)
+            if token is not None and token.type != TokenType.WHITESPACE:
+                status += f" | Token: {token.type.name}"
+        if tab.parse_errors:
+            status += f" | Sözdizimi hataları: {len(tab.parse_errors)}"
         
-        self.editor.delete("1.0", tk.END)
-        self.editor.edit_modified(False)
-        self.current_file = None
-        self.root.title("Gerçek Zamanlı Sözdizimi Vurgulayıcı")
+        # Ölçümler açıksa son/p95 aşama süreleri
+        metrics = instrumentation.active
+        if metrics is not None and self.show_metrics.get():
+            status += f" | {metrics.summary()}"
+        self.status_bar.config(text=status)
     
-    def open_file(self):
-        """Dosya aç"""
-        if self.editor.edit_modified():
-            save_prompt = messagebox.askyesnocancel("Değişiklikleri Kaydet", "Mevcut dosyadaki değişiklikleri kaydetmek istiyor musunuz?")
-            if save_prompt is None:  # İptal
-                return
-            elif save_prompt:  # Evet
-                self.save_file()
+    def toggle_metrics(self):
+        """Görünüm menüsünden aşama ölçümlerini ve durum çubuğu özetini aç/kapat"""
+        if self.show_metrics.get():
+            if instrumentation.active is None:
+                instrumentation.enable()
+        else:
+            instrumentation.disable()
+        self.update_status_bar()
         
-        file_path = filedialog.askopenfilename(
+    def new_file(self):
+        """Yeni bir boş sekme aç"""
+        return self.add_tab()
+    
+    def open_file(self):
+        """Bir veya birden çok dosyayı yeni sekmelerde aç"""
+        file_paths = filedialog.askopenfilenames(
             filetypes=[
                 ("Metin Dosyaları", "*.txt"),
                 ("Python Dosyaları", "*.py"),
@@ -141,31 +289,55 @@ class SyntaxHighlighterGUI:
             ]
         )
         
-        if file_path:
-            try:
-                with open(file_path, "r") as file:
-                    content = file.read()
-                    self.editor.delete("1.0", tk.END)
-                    self.editor.insert("1.0", content)
-                    self.editor.edit_modified(False)
-                    self.current_file = file_path
-                    self.root.title(f"Gerçek Zamanlı Sözdizimi Vurgulayıcı - {os.path.basename(file_path)}")
-            except Exception as e:
-                messagebox.showerror("Hata", f"Dosya açılamadı: {str(e)}")
+        # İlk dosya seçilir; diğerleri arka planda yüklenir ve vurgulanır
+        for index, file_path in enumerate(file_paths):
+            self.load_file(file_path, select=index == 0)
+    
+    def load_file(self, file_path, chunk_size=1 << 20, select=True):
+        """
+        Dosyayı yeni bir sekmede (seçili sekme boşsa onda) mmap ile eşleyerek parça
+        parça yükle. UI yükleme boyunca yanıt verir; ilerleme durum çubuğunda gösterilir.
+        """
+        tab = self.active_tab
+        if tab is None or not tab.is_empty() or not select:
+            tab = self.add_tab(select=select)
+        if not tab.load_file(file_path, chunk_size):
+            return None
+        self.notebook.tab(tab.frame, text=tab.title)
+        if tab.is_active:
+            self.update_title()
+        return tab
+    
+    def close_tab(self):
+        """Seçili sekmeyi kapat; kaydedilmemiş değişiklikler için sor"""
+        tab = self.active_tab
+        if tab.loading is None and tab.editor.edit_modified():
+            save_prompt = messagebox.askyesnocancel("Değişiklikleri Kaydet", "Mevcut dosyadaki değişiklikleri kaydetmek istiyor musunuz?")
+            if save_prompt is None:  # İptal
+                return
+            elif save_prompt and not self.save_file():  # Evet
+                return
+        
+        self.tabs.remove(tab)
+        self.active_tab = None
+        tab.close()
+        if not self.tabs:
+            self.new_file()
+        else:
+            self.on_tab_changed()
     
     def save_file(self):
-        """Mevcut dosyayı kaydet"""
-        if self.current_file:
-            try:
-                content = self.editor.get("1.0", tk.END)
-                with open(self.current_file, "w") as file:
-                    file.write(content)
-                self.editor.edit_modified(False)
-                self.status_bar.config(text=f"Dosya kaydedildi: {self.current_file}")
-                return True
-            except Exception as e:
-                messagebox.showerror("Hata", f"Dosya kaydedilemedi: {str(e)}")
+        """Seçili sekmedeki dosyayı kaydet"""
+        tab = self.active_tab
+        if tab.loading is not None:
+            # Yarım yüklenmiş içerik dosyanın üzerine yazılmamalı
+            self.status_bar.config(text="Dosya yükleniyor; kaydetmek için yüklemenin bitmesini bekleyin")
+            return False
+        if tab.path:
+            if not tab.save():
                 return False
+            self.status_bar.config(text=f"Dosya kaydedildi: {tab.path}")
+            return True
         else:
             return self.save_as_file()
     
@@ -181,8 +353,8 @@ class SyntaxHighlighterGUI:
         )
         
         if file_path:
-            self.current_file = file_path
-            self.root.title(f"Syntax Mirror - {os.path.basename(file_path)}")
+            self.active_tab.path = file_path
+            self.update_title()
             return self.save_file()
         
         return False
@@ -0,0 +1,28 @@
+import mmap
+import os
+
+
+def read_mapped_text(path, encoding="utf-8", final_newline=False):
+    """
+    Dosyayı salt okunur mmap ile eşle ve tek seferde metne çöz; eşleme çözmeden
+    sonra kapatılır. Satır sonları (\\r\\n, \\r) yalnızca dosyada varsa '\\n'
+    olarak çevrilir (bu durumda metin kopyalanır). final_newline verilirse metnin
+    sonuna Text widget'ının içeriğiyle aynı olması için bir '\\n' daha eklenir.
+
+    Bellek: özel (anonim) bellek en fazla çözülmüş metnin bir kopyasıdır; editör bu
+    metni parçalar halinde widget'a ekler ve aynı nesneyi analiz işçisine verir.
+    Çözme sırasında dosyanın eşlenmiş sayfaları da RSS'te görünür; bunlar paylaşılan
+    ve geri alınabilen sayfa önbelleğidir, ama tepe RSS yine de yaklaşık dosya boyutu
+    artı metin boyutudur. Lexer eşlenmiş baytları değil, çözülmüş metni tarar.
+    """
+    with open(path, "rb") as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            return "\n" if final_newline else ""
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            text = str(mapped, encoding, "replace")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    if final_newline:
+        # Tek başvurulu dize CPython'da yerinde büyütülür; metin ikinci kez kopyalanmaz
+        text += "\n"
+    return text
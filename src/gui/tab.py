@@ -0,0 +1,619 @@
+import tkinter as tk
+from tkinter import scrolledtext, messagebox
+import os
+from time import perf_counter
+
+from src import instrumentation
+from src.gui.file_loader import read_mapped_text
+from src.lexer.incremental import IncrementalLexer
+
+
+class EditorTab:
+    """
+    Editördeki tek bir belge sekmesi: Text widget'ı, dosya yolu ve belgenin
+    vurgulama durumu (içerik nesli, kirli satırlar, token akışı, satır dizini,
+    etiketlenmiş satırlar). Lexer, vurgulama kuralları ve analiz işçisi
+    uygulamadaki tüm sekmelerce paylaşılır. Etkin olmayan bir sekme token
+    akışını ve satır dizinini bırakır; widget etiketleri ve son vurgulanan
+    metin kalır, böylece sekmeye dönüldüğünde önceki vurgulama hemen görünür.
+
+    Etkin olmayan sekmenin Python tarafındaki maliyeti: son vurgulanan metin
+    (bir kopya) ve widget'a uygulanan aralıkların sıkıştırılmış kaydı (boşluk
+    dışındaki token başına 16 bayt). Tk widget'ı metni ve etiketleri ayrıca tutar.
+    """
+    # Metni değiştiren Text widget komutları
+    EDIT_COMMANDS = ("insert", "delete", "replace")
+
+    def __init__(self, app, notebook):
+        self.app = app
+        self.root = app.root
+        self.closed = False
+
+        # Dosya yolu ve yüklenen, henüz düzenlenmemiş dosyanın widget'a eklenen metni;
+        # ilk analiz widget içeriği geri kopyalanmadan bu metinle yapılır
+        self.path = None
+        self._loaded_text = None
+
+        # Olay güdümlü vurgulama durumu: içerik nesli (tüm sekmelerde tekildir), son
+        # vurgulanan ve gönderilen nesil ve kirli satır aralığı (ilk, son)
+        self.generation = app.next_generation()
+        self.highlighted_generation = -1
+        self.submitted_generation = -1
+        self.dirty_lines = None
+        self._highlight_job = None
+        self._submitted_at = None
+
+        # Son vurgulanan metin ve onun analiz sonucu; token akışı ve satır dizini
+        # yalnızca sekme etkinken tutulur
+        self.highlighted_text = ""
+        self.tokens = None
+        self.line_index = None
+        self.brackets = None
+        self.parse_errors = []
+
+        # Görünüm alanı modunda etiketlenmiş satır aralıkları
+        self._tagged_lines = []
+        self._viewport_job = None
+
+        # Parça parça dosya yükleme durumu: (çözülmüş metin, eklenen karakter sayısı, parça boyutu),
+        # after_idle işi ve yükleme sırasında kullanıcı düzenlemesi yapılıp yapılmadığı
+        self.loading = None
+        self._load_job = None
+        self._loader_inserting = False
+        self._edited_while_loading = False
+
+        self.frame = tk.Frame(notebook)
+        self.create_editor()
+
+    def create_editor(self):
+        """Metin editörü bileşenini oluştur"""
+        # Satır numaralarıyla kaydırılabilir metin widget'ı oluştur
+        self.editor = scrolledtext.ScrolledText(
+            self.frame,
+            wrap=tk.WORD,
+            undo=True,
+            font="TkFixedFont"
+        )
+        self.editor.pack(fill=tk.BOTH, expand=True)
+
+        # Parantez eşi işaretleri vurgulamanın üzerinde, katlanan satırlar gizli
+        self.editor.tag_configure("bracket_match", background="#D0E8FF")
+        self.editor.tag_configure("bracket_mismatch", background="#FFC0C0")
+        self.editor.tag_configure("folded", elide=True)
+
+        # Olayları bağla
+        self.editor.bind("<KeyRelease>", self.app.on_text_change)
+        self.editor.bind("<ButtonRelease-1>", self.app.on_text_change)
+        self.editor.bind("<<Modified>>", self.on_modified)
+        self.editor.bind("<Configure>", lambda e: self.schedule_viewport_highlighting())
+
+        # Kaydırmalarda yeni görünen bölgeleri etiketle
+        self.editor.configure(yscrollcommand=self._on_yscroll)
+
+        # Metni değiştiren widget komutlarını yakala
+        self._install_edit_proxy()
+
+    @property
+    def title(self):
+        """Sekme etiketi"""
+        return os.path.basename(self.path) if self.path else "Adsız"
+
+    @property
+    def is_active(self):
+        """Sekme şu anda seçili mi?"""
+        return self.app.active_tab is self
+
+    def is_empty(self):
+        """Düzenlenmemiş, boş ve dosyaya bağlı olmayan bir sekme mi?"""
+        return (self.path is None and self.loading is None and not self.editor.edit_modified()
+                and self.editor.compare("end-1c", "==", "1.0"))
+
+    def _install_edit_proxy(self):
+        """Text widget komutunu, düzenlemeleri kaydeden bir vekil komutla sar"""
+        widget = str(self.editor)
+        self._editor_command = widget + "_orig"
+        self.root.tk.call("rename", widget, self._editor_command)
+        self.root.tk.createcommand(widget, self._on_editor_command)
+
+    def _on_editor_command(self, command, *args):
+        """Widget komutunu çalıştır; metin değiştiyse kirli aralığı işaretle"""
+        call = self.root.tk.call
+        if command in self.EDIT_COMMANDS:
+            if command == "insert":
+                bounds, texts = args[:1], args[1::2]
+            elif command == "delete":
+                bounds, texts = (args if len(args) > 1 else (args[0], args[0] + "+1c")), ()
+            else:
+                bounds, texts = args[:2], args[2::2]
+            lines = [int(str(call(self._editor_command, "index", index)).split(".")[0]) for index in bounds]
+            first, removed_lines = min(lines), max(lines) - min(lines)
+
+        result = call(self._editor_command, command, *args)
+
+        if command in self.EDIT_COMMANDS:
+            inserted_lines = sum(str(text).count("\n") for text in texts)
+            self.mark_dirty(first, first + inserted_lines, inserted_lines - removed_lines)
+        elif command == "edit" and args and args[0] in ("undo", "redo"):
+            # Geri alma işlemleri widget komutundan geçmez; tüm belge kirli sayılır
+            last = int(str(call(self._editor_command, "index", "end")).split(".")[0])
+            self.mark_dirty(1, last, 0)
+
+        return result
+
+    def mark_dirty(self, first_line, last_line, line_delta):
+        """Kirli satır aralığını genişlet ve vurgulamayı zamanla"""
+        if self.loading is not None and not self._loader_inserting:
+            self._edited_while_loading = True
+        if not self._loader_inserting:
+            self._loaded_text = None
+        if self.dirty_lines is None:
+            self.dirty_lines = (first_line, last_line)
+        else:
+            old_first, old_last = self.dirty_lines
+            # Düzenlemeden sonraki satırlar kayar
+            if old_last > first_line:
+                old_last += line_delta
+            self.dirty_lines = (min(old_first, first_line), max(old_last, last_line))
+
+        self.generation = self.app.next_generation()
+        self.schedule_highlighting()
+
+    def on_modified(self, event=None):
+        """<<Modified>> olayı: içerik değiştiyse vurgulamayı zamanla"""
+        if self.editor.edit_modified():
+            self.generation = self.app.next_generation()
+            self.schedule_highlighting()
+
+    def schedule_highlighting(self):
+        """Vurgulamayı, düzenlemeler durulduktan sonra çalışacak şekilde (yeniden) zamanla"""
+        if self._highlight_job is not None:
+            self.root.after_cancel(self._highlight_job)
+        self._highlight_job = self.root.after(self.app.highlight_delay, self.update_highlighting)
+
+    def is_analyzing(self):
+        """İşçide bu sekmenin güncel sürümü için bekleyen (yerine başkası geçmemiş) bir iş var mı?"""
+        return (not self.closed and self.submitted_generation == self.generation != self.highlighted_generation
+                and not self.app.worker.is_stale(self.submitted_generation))
+
+    def needs_highlighting(self):
+        """Vurgulama güncel değil ve işçide bekleyen bir iş yok mu?"""
+        return self.generation != self.highlighted_generation and not self.is_analyzing()
+
+    def is_idle(self):
+        """Bekleyen düzenleme, yükleme veya analiz işi yok mu?"""
+        return (self.loading is None and self._highlight_job is None and self.tokens is not None
+                and self.highlighted_generation == self.generation)
+
+    def update_highlighting(self):
+        """Editör içeriğine sözdizimi vurgulaması uygula"""
+        self._highlight_job = None
+
+        # Dosya yüklenirken vurgulama yapılmaz; yükleme bitince ilk analiz gönderilir
+        if self.loading is not None:
+            return
+
+        # Etkin olmayan sekmeler düşük öncelikle, uygulama boştayken vurgulanır
+        if not self.is_active:
+            self.app.schedule_background()
+            return
+
+        # İçerik son vurgulamadan (veya son gönderilen işten) beri değişmediyse
+        # yapılacak bir şey yok
+        if self.needs_highlighting():
+            self.submit()
+
+    def submit(self):
+        """Belgenin güncel sürümünü analiz işçisine gönder; daha eski bekleyen işler iptal edilir"""
+        self.submitted_generation = self.generation
+        self._submitted_at = perf_counter()
+        if self._loaded_text is not None:
+            # İlk tarama yüklenirken widget'a eklenen metinle yapılır; widget içeriği kopyalanmaz
+            self.app.worker.submit(self.generation, self._loaded_text, self, reset=True)
+        else:
+            self.app.worker.submit(self.generation, self.editor.get("1.0", tk.END), self)
+
+    def activate(self):
+        """
+        Sekme etkinleştiğinde çağrılır. Widget etiketleri yerinde kaldığı için önceki
+        vurgulama hemen görünür; bırakılan token akışı son vurgulanan metinden işçide
+        (çoğunlukla önbellekten) geri yüklenir, içerik değiştiyse yeniden analiz edilir.
+        """
+        if self.needs_highlighting():
+            self.schedule_highlighting()
+        elif self.tokens is None and self.highlighted_generation == self.generation:
+            self.submitted_generation = self.generation
+            self._submitted_at = None
+            self.app.worker.submit(self.generation, self.highlighted_text, self)
+        else:
+            self.schedule_viewport_highlighting()
+
+    def release(self):
+        """
+        Etkin olmayan sekmenin token akışını, satır dizinini ve parantez dizinini bırak;
+        widget'a uygulanan aralıkların kaydını sıkıştır
+        """
+        self.tokens = self.line_index = self.brackets = None
+        self.app.highlighter.compact_widget(self.editor)
+        if self.app.highlighter_document is self:
+            self.app.highlighter.clear_tokens()
+            self.app.highlighter_document = None
+
+    def use_tokens(self):
+        """Paylaşılan vurgulayıcıyı bu sekmenin token akışına yönlendir; akış yoksa False"""
+        if self.tokens is None:
+            return False
+        app = self.app
+        if app.highlighter_document is not self:
+            app.highlighter.set_tokens(self.highlighted_text, self.tokens, self.line_index)
+            app.highlighter_document = self
+        return True
+
+    def apply_analysis(self, result):
+        """Arka plan işçisinin sonucunu (hâlâ güncelse) widget'a uygula"""
+        if self.closed or result.generation != self.generation:
+            return
+
+        # Aynı nesil zaten vurgulandıysa bu, bırakılmış token akışının geri yüklenmesidir;
+        # widget etiketleri geçerlidir
+        restored = result.generation == self.highlighted_generation
+        text_content = result.text
+        old_text = self.highlighted_text
+        edit = None if restored else self._highlight_edit(old_text, text_content, result.line_index)
+        self.highlighted_text = text_content
+        self.tokens, self.line_index = result.tokens, result.line_index
+        self.brackets = result.brackets
+        self.app.highlighter_document = None  # Yeni akış paylaşılan vurgulayıcıya yeniden verilir
+        self.use_tokens()
+        self.highlighted_generation = result.generation
+        self.dirty_lines = None
+        self._loaded_text = None
+        self.parse_errors = result.errors
+
+        highlighter = self.app.highlighter
+        if self.app.viewport_only:
+            # Etiketli satırlar düzenlemeyle kayar; bunlar yalnızca değişen aralıklar
+            # için yeniden etiketlenir, ardından görünüm alanının eksikleri tamamlanır
+            if not restored:
+                self._tagged_lines = self._shift_lines(self._tagged_lines, old_text, edit, result.line_index)
+                for first, last in self._tagged_lines:
+                    highlighter.apply_highlighting_to_widget(self.editor, text_content, first, last, edit)
+            self.update_viewport_highlighting()
+        elif not restored:
+            highlighter.apply_highlighting_to_widget(self.editor, text_content, edit=edit)
+
+        # Gönderimden etiketlemenin bitişine kadar geçen vurgulama döngüsü süresi
+        metrics = instrumentation.active
+        if metrics is not None and self._submitted_at is not None:
+            metrics.record("cycle", perf_counter() - self._submitted_at, len(result.tokens))
+
+        if self.is_active:
+            self.app.update_status_bar()
+            self.update_bracket_match()
+        else:
+            # Arka planda vurgulanan sekme yalnızca metnini ve etiketlerini tutar
+            self.release()
+            self.app.schedule_background()
+
+    def _highlight_edit(self, old_text, new_text, line_index):
+        """
+        Son vurgulanan metinden yeni metne giden düzenlemeyi (başlangıç, eski_bitiş,
+        yeni_bitiş) bul: metin farkının ve kirli satırların birleşimi. Kirli satırlar,
+        aynı metin geri yazılsa bile widget'ta karakterleri değişen bölgeyi kapsar.
+        """
+        delta = len(new_text) - len(old_text)
+        regions = []
+        edit = IncrementalLexer.find_edit(old_text, new_text)
+        if edit is not None:
+            regions.append(edit)
+        if self.dirty_lines is not None:
+            first, last = self.dirty_lines
+            start, new_end = line_index.offset(first - 1, 0), line_index.offset(last, 0)
+            regions.append((start, new_end - delta, new_end))
+        if not regions:
+            return (0, 0, 0)
+
+        start = min(region[0] for region in regions)
+        new_end = max(region[2] for region in regions)
+        old_end = new_end - delta
+        if not 0 <= start <= old_end <= len(old_text):
+            # Kirli satırlar metinle tutarsız; tüm belge yeniden etiketlenir
+            return 0, len(old_text), len(new_text)
+        return start, old_end, new_end
+
+    @staticmethod
+    def _shift_lines(ranges, old_text, edit, line_index):
+        """
+        Eski metne göre etiketli satır aralıklarını (1 tabanlı, dahil) düzenlemeden
+        sonraki satır numaralarına taşı; düzenlenen satırlarla kesişen aralıklar onları da kapsar
+        """
+        start, old_end, new_end = edit
+        first_line = line_index.line_of(start) + 1
+        old_last_line = first_line + old_text.count("\n", start, old_end)
+        new_last_line = line_index.line_of(new_end) + 1
+        delta = new_last_line - old_last_line
+        line_count = len(line_index)
+
+        shifted = []
+        for first, last in ranges:
+            if last < first_line:
+                shifted.append((first, last))
+            elif first > old_last_line:
+                shifted.append((first + delta, last + delta))
+            else:
+                shifted.append((min(first, first_line), last + delta if last > old_last_line else new_last_line))
+        return EditorTab._merge_ranges([
+            (first, min(last, line_count)) for first, last in shifted if first <= min(last, line_count)
+        ])
+
+    def _cursor_offset(self):
+        """
+        İmlecin son vurgulanan metindeki karakter konumu; parantez dizini güncel
+        değilse (bekleyen düzenleme veya bırakılmış dizin) None
+        """
+        if self.brackets is None or self.line_index is None or self.highlighted_generation != self.generation:
+            return None
+        line, column = self.editor.index(tk.INSERT).split(".")
+        return self.line_index.offset(int(line) - 1, int(column))
+
+    def _tk_index(self, offset):
+        """Son vurgulanan metindeki karakter konumunu Tk "satır.sütun" indeksine dönüştür"""
+        line, column = self.line_index.line_col(offset)
+        return f"{line + 1}.{column}"
+
+    def update_bracket_match(self):
+        """
+        İmlecin yanındaki parantezi ve eşini (eşsizse yalnızca kendisini) işaretle.
+        Eş, parantez dizininden ikili arama ve O(1) eş aramasıyla bulunur; metin taranmaz.
+        """
+        editor = self.editor
+        for tag in ("bracket_match", "bracket_mismatch"):
+            editor.tag_remove(tag, "1.0", tk.END)
+
+        offset = self._cursor_offset()
+        if offset is None:
+            return
+        match = self.brackets.match_at(offset)
+        if match is None:
+            return
+        position, partner = match
+        tag = "bracket_match" if partner >= 0 else "bracket_mismatch"
+        indices = [self._tk_index(position)] + ([self._tk_index(partner)] if partner >= 0 else [])
+        for index in indices:
+            editor.tag_add(tag, index, f"{index}+1c")
+        editor.tag_raise(tag)
+        editor.tag_raise("sel")
+
+    def toggle_fold(self):
+        """
+        İmlecin satırı katlanmış bir aralığın başlığıysa aç; değilse satırda açılan
+        bloğu, imleci içeren yorumu veya imleci çevreleyen bloğu katla. Başlık ve
+        kapanış satırı görünür kalır, aradakiler gizlenir.
+        """
+        editor = self.editor
+        line_end = editor.index("insert lineend")
+        if "folded" in editor.tag_names(line_end):
+            folded = editor.tag_prevrange("folded", f"{line_end}+1c")
+            if folded:
+                editor.tag_remove("folded", *folded)
+            return
+
+        offset = self._cursor_offset()
+        if offset is None:
+            return
+        fold = self.brackets.fold_at(offset, self.line_index)
+        if fold is not None:
+            self._fold_lines(*fold)
+            self._reveal_cursor()
+
+    def fold_all(self):
+        """Tüm çok satırlı blokları ve yorumları katla"""
+        if self._cursor_offset() is None:
+            return
+        for first, last in self.brackets.fold_ranges(self.line_index):
+            self._fold_lines(first, last)
+        self._reveal_cursor()
+
+    def unfold_all(self):
+        """Tüm katlamaları aç"""
+        self.editor.tag_remove("folded", "1.0", tk.END)
+
+    def _fold_lines(self, first, last):
+        """0 tabanlı first satırının sonundan last satırının başına kadar olan metni gizle"""
+        self.editor.tag_add("folded", f"{first + 1}.0 lineend", f"{last + 1}.0")
+
+    def _reveal_cursor(self):
+        """İmleç gizlenen bir aralıktaysa onu aralığın başlık satırının sonuna taşı"""
+        editor = self.editor
+        if "folded" in editor.tag_names(tk.INSERT):
+            folded = editor.tag_prevrange("folded", f"{tk.INSERT}+1c")
+            if folded:
+                editor.mark_set(tk.INSERT, folded[0])
+
+    def _on_yscroll(self, first, last):
+        """Kaydırma çubuğunu güncelle ve görünüm alanı vurgulamasını zamanla"""
+        self.editor.vbar.set(first, last)
+        self.schedule_viewport_highlighting()
+
+    def schedule_viewport_highlighting(self):
+        """Görünüm alanı vurgulamasını boşta kalındığında çalışacak şekilde zamanla"""
+        if self.app.viewport_only and self._viewport_job is None and not self.closed:
+            self._viewport_job = self.root.after_idle(self.update_viewport_highlighting)
+
+    def visible_lines(self):
+        """
+        Ekranda görünen ilk ve son satırın numaralarını (1 tabanlı) döndür. Gizli bir
+        sekmede kaydırma konumundan ve etkin sekmenin görünen satır sayısından tahmin edilir.
+        """
+        if not self.editor.winfo_ismapped():
+            line_count = len(self.line_index)
+            first = int(self.editor.yview()[0] * line_count) + 1
+            return first, first + self.app.visible_line_count - 1
+        first = int(self.editor.index("@0,0").split(".")[0])
+        last = int(self.editor.index(f"@0,{self.editor.winfo_height()}").split(".")[0])
+        self.app.visible_line_count = last - first + 1
+        return first, last
+
+    def update_viewport_highlighting(self):
+        """Görünüm alanının henüz etiketlenmemiş kısımlarını etiketle, uzaktakileri bırak"""
+        self._viewport_job = None
+
+        # Bekleyen bir düzenleme varsa tam güncelleme bunu zaten yapacak
+        if not self.app.viewport_only or self.highlighted_generation != self.generation:
+            return
+        if self.closed or not self.use_tokens():
+            return
+
+        highlighter = self.app.highlighter
+        text_content = self.highlighted_text
+        line_count = len(self.line_index)
+        first, last = self.visible_lines()
+        margin = self.app.viewport_margin if self.app.viewport_margin is not None else last - first + 1
+        wanted = (max(1, first - margin), min(line_count, last + margin))
+
+        # Yeni görünen bölgeleri etiketle
+        for missing_first, missing_last in self._subtract_ranges(wanted, self._tagged_lines):
+            highlighter.apply_highlighting_to_widget(
+                self.editor, text_content, missing_first, missing_last
+            )
+
+        # Görünüm alanından çok uzaktaki etiketleri kaldır
+        keep = (first - 4 * margin, last + 4 * margin)
+        tagged = []
+        for tagged_first, tagged_last in self._tagged_lines:
+            for drop_first, drop_last in self._subtract_ranges((tagged_first, tagged_last), [keep]):
+                highlighter.clear_highlighting(self.editor, drop_first, drop_last, text_content)
+            kept_first, kept_last = max(tagged_first, keep[0]), min(tagged_last, keep[1])
+            if kept_first <= kept_last:
+                tagged.append((kept_first, kept_last))
+        self._tagged_lines = self._merge_ranges(tagged + [wanted])
+
+    @staticmethod
+    def _subtract_ranges(wanted, ranges):
+        """wanted aralığının sıralı, ayrık ranges aralıklarıyla örtülmeyen kısımlarını döndür"""
+        first, last = wanted
+        missing = []
+        for range_first, range_last in ranges:
+            if range_last < first:
+                continue
+            if range_first > last:
+                break
+            if range_first > first:
+                missing.append((first, range_first - 1))
+            first = max(first, range_last + 1)
+        if first <= last:
+            missing.append((first, last))
+        return missing
+
+    @staticmethod
+    def _merge_ranges(ranges):
+        """Satır aralıklarını sırala ve bitişik ya da çakışanları birleştir"""
+        merged = []
+        for first, last in sorted(ranges):
+            if merged and first <= merged[-1][1] + 1:
+                merged[-1] = (merged[-1][0], max(merged[-1][1], last))
+            else:
+                merged.append((first, last))
+        return merged
+
+    def load_file(self, file_path, chunk_size=1 << 20):
+        """
+        Dosyayı salt okunur mmap ile eşleyip bir kez metne çöz ve metni parçalar
+        halinde, her boşta kalışta bir parça olmak üzere widget'a ekle. UI yükleme
+        boyunca yanıt verir; ilerleme durum çubuğunda gösterilir. Aynı metin ilk
+        analiz için işçiye verilir; dosya ikinci kez okunup çözülmez.
+        """
+        self.cancel_loading()
+        try:
+            # Text widget'ının sona eklediği satır sonu metne de eklenir; widget'a eklenmez
+            text = read_mapped_text(file_path, final_newline=True)
+        except OSError as e:
+            messagebox.showerror("Hata", f"Dosya açılamadı: {str(e)}")
+            return False
+
+        # Yükleme ekleri geri alma geçmişine yazılmaz
+        self.editor.configure(undo=False)
+        self.editor.delete("1.0", tk.END)
+        self.loading = (text, 0, chunk_size)
+        self._edited_while_loading = False
+        self.path = file_path
+        self._load_job = self.root.after_idle(self._load_next_chunk)
+        return True
+
+    def _load_next_chunk(self):
+        """Bir sonraki metin parçasını widget'ın sonuna ekle ve ilerlemeyi göster"""
+        self._load_job = None
+        text, position, chunk_size = self.loading
+        size = len(text) - 1
+        if position >= size:
+            self._finish_loading()
+            return
+
+        end = min(position + chunk_size, size)
+        self._loader_inserting = True
+        try:
+            self.editor.insert("end-1c", text[position:end])
+        finally:
+            self._loader_inserting = False
+        self.loading = (text, end, chunk_size)
+        if self.is_active:
+            self.app.status_bar.config(
+                text=f"Yükleniyor: %{end * 100 / size:.0f} "
+                     f"({end / 1e6:.1f} / {size / 1e6:.1f} M karakter)"
+            )
+        self._load_job = self.root.after_idle(self._load_next_chunk)
+
+    def _finish_loading(self):
+        """Yüklemeyi bitir ve ilk analizi gönder"""
+        text = self.loading[0]
+        self.loading = None
+        self.editor.configure(undo=True)
+        self.editor.edit_reset()
+        self.editor.edit_modified(False)
+        self.editor.mark_set(tk.INSERT, "1.0")
+        self.editor.see("1.0")
+
+        # Widget içeriği yüklenen metinden farklıysa olağan yoldan vurgulanır
+        self._loaded_text = None if self._edited_while_loading else text
+        self.generation = self.app.next_generation()
+        if self.is_active:
+            self.update_highlighting()
+            self.app.update_status_bar()
+        else:
+            self.app.schedule_background()
+
+    def cancel_loading(self):
+        """Süren bir dosya yüklemesini durdur; yarım içerik değiştirilmemiş sayılır"""
+        if self.loading is None:
+            return
+        if self._load_job is not None:
+            self.root.after_cancel(self._load_job)
+            self._load_job = None
+        self.loading = None
+        self.editor.configure(undo=True)
+        self.editor.edit_reset()
+        self.editor.edit_modified(False)
+
+    def save(self):
+        """Sekmenin içeriğini dosyasına yaz; başarılıysa True döndür"""
+        try:
+            content = self.editor.get("1.0", tk.END)
+            with open(self.path, "w") as file:
+                file.write(content)
+        except Exception as e:
+            messagebox.showerror("Hata", f"Dosya kaydedilemedi: {str(e)}")
+            return False
+        self.editor.edit_modified(False)
+        return True
+
+    def close(self):
+        """Bekleyen işleri iptal et ve widget'ı yok et"""
+        self.cancel_loading()
+        for job in (self._highlight_job, self._viewport_job):
+            if job is not None:
+                self.root.after_cancel(job)
+        self._highlight_job = self._viewport_job = None
+        # Kayıt önce bırakılır; kapanan sekmenin aralıkları sıkıştırılmaz
+        self.app.highlighter.forget_widget(self.editor)
+        self.release()
+        self.closed = True
+        self.frame.destroy()
@@ -0,0 +1,160 @@
+import threading
+from time import perf_counter
+
+from src import instrumentation
+from src.highlighter.highlighter import SyntaxHighlighter
+from src.lexer.brackets import BracketIndex
+from src.lexer.lexer import TokenStream
+from src.lexer.line_index import LineIndex
+from src.parser.incremental import IncrementalParser
+
+
+class AnalysisResult:
+    """Bir metin sürümü için arka planda üretilen sözcüksel ve sözdizimsel analiz sonucu"""
+    def __init__(self, generation, text, tokens, line_index, ast=None, errors=None, document=None,
+                 brackets=None):
+        self.generation = generation  # Analiz edilen içerik nesli
+        self.document = document  # İşi gönderenin verdiği belge anahtarı (ör. editör sekmesi)
+        self.text = text  # Analiz edilen metin
+        self.tokens = tokens  # TokenStream (işçinin durumundan bağımsız kopya)
+        self.line_index = line_index  # LineIndex kopyası
+        self.brackets = brackets  # BracketIndex kopyası (parantez eşleri ve katlama aralıkları)
+        self.ast = ast  # Ayrıştırma yapıldıysa AST kökü
+        self.errors = errors or []  # Ayrıştırma hataları
+
+
+class AnalysisWorker:
+    """
+    Sözcüksel analizi (ve isteğe bağlı ayrıştırmayı) arka plan iş parçacığında
+    çalıştıran işçi. Her iş bir içerik nesliyle gönderilir; daha yeni bir iş
+    geldiğinde bekleyen iş atılır, çalışan iş aşamalar arasında iptal edilir.
+    Sonuçlar on_result geri çağrısına verilir; geri çağrı sonucu UI iş
+    parçacığına (ör. after_idle ile) aktarmaktan sorumludur.
+    
+    Birden çok belge tek işçiyi paylaşabilir: her iş bir belge anahtarıyla
+    gönderilir ve sonuçta geri verilir. Artımlı lexer ve ayrıştırıcı yalnızca son
+    analiz edilen belgenin durumunu tutar; belge değiştiğinde baştan başlanır
+    (önbellekteki metinler yeniden taranmaz).
+    """
+    def __init__(self, on_result, parse=False, cache=None, language=None, lexer=None):
+        self.on_result = on_result
+        self.parse = parse
+
+        # İsteğe bağlı HighlightCache: daha önce analiz edilmiş metin durumları
+        # (geri alma/yineleme, geri alınan yapıştırma) yeniden taranmaz
+        self.cache = cache
+        self._lexer_behind = False  # Son sonuç önbellekten geldiyse lexer'ın değişiklik aralığı geçersizdir
+
+        # İşçinin kendi artımlı lexer'ı yalnızca bu iş parçacığında kullanılır; derlenmiş
+        # lexer ise UI ile paylaşılabilir
+        self.highlighter = SyntaxHighlighter(incremental=True, language=language, lexer=lexer)
+        self.parser = IncrementalParser(language=self.highlighter.lexer.language)
+        self.brackets = BracketIndex()  # Artımlı lexer'ın metniyle birlikte güncellenir
+        self._document = None  # Artımlı durumun ait olduğu belge
+
+        self._condition = threading.Condition()
+        self._pending = None  # (nesil, metin, belge, baştan tarama)
+        self._latest_generation = -1
+        self._running = True
+
+        self._thread = threading.Thread(target=self._run, name="analysis-worker", daemon=True)
+        self._thread.start()
+
+    def submit(self, generation, text, document=None, reset=False):
+        """
+        Yeni bir metin sürümünü analiz için kuyruğa al; bekleyen eski işin yerini alır.
+        reset verilirse (ör. yeni açılan dosya) lexer önceki metinle karşılaştırmadan
+        baştan tarar.
+        """
+        with self._condition:
+            self._pending = (generation, text, document, reset)
+            self._latest_generation = generation
+            self._condition.notify()
+
+    def is_stale(self, generation):
+        """Verilen nesilden daha yeni bir iş gönderildi mi?"""
+        return generation != self._latest_generation
+
+    def stop(self):
+        """İşçi iş parçacığını durdur"""
+        with self._condition:
+            self._running = False
+            self._pending = None
+            self._condition.notify()
+
+    def _run(self):
+        """İşleri sırayla al ve analiz et"""
+        while True:
+            with self._condition:
+                while self._running and self._pending is None:
+                    self._condition.wait()
+                if not self._running:
+                    return
+                generation, text, document, reset = self._pending
+                self._pending = None
+
+            reset = reset or document is not self._document
+            self._document = document
+            result = self._analyze(generation, text, reset=reset)
+            if result is not None and not self.is_stale(generation):
+                result.document = document
+                self.on_result(result)
+
+    def _analyze(self, generation, text, reset=False):
+        """
+        Metni token'lara ayır, isteğe bağlı olarak ayrıştır; iş eskidiyse None döndür.
+        reset verilirse (yeni açılan dosya veya başka bir belge) önceki durumla karşılaştırma yapılmaz.
+        """
+        if reset:
+            self.parser.reset()
+        tokens = self.cache.get(text) if self.cache is not None else None
+        if tokens is not None:
+            # Önbellekten gelen akış değişmez; artımlı lexer bir sonraki düzenlemede
+            # kendi son metninden itibaren güncellenir
+            brackets = BracketIndex()
+            brackets.build(text, tokens.types, tokens.starts, tokens.ends)
+            result = AnalysisResult(generation, text, tokens, LineIndex(text), brackets=brackets)
+            changed = None
+            self._lexer_behind = True
+        else:
+            lexer = self.highlighter.incremental_lexer
+            changed = lexer.reset(text) if reset else lexer.update(text)
+            if self._lexer_behind:
+                changed = None
+                self._lexer_behind = False
+
+            # Parantez dizini, iş eskimiş olsa da lexer'la aynı metinde kalmalıdır
+            metrics = instrumentation.active
+            if metrics is not None:
+                started = perf_counter()
+            if changed is None or reset:
+                self.brackets.build(text, *lexer.columns())
+            else:
+                self.brackets.update(text, *lexer.columns(), *changed)
+            if metrics is not None:
+                metrics.record("brackets", perf_counter() - started, len(self.brackets))
+            if self.is_stale(generation):
+                # Atlanan değişiklik aralığı artımlı ayrıştırıcının ağacını geçersiz kılar
+                self.parser.reset()
+                return None
+
+            # UI iş parçacığı, işçi sonraki işe geçerken de okuyabileceği için kopyalar gönderilir
+            types, starts, ends = lexer.columns()
+            tokens = TokenStream(text, types[:], starts[:], ends[:])
+            result = AnalysisResult(generation, text, tokens, lexer.lines.copy(), brackets=self.brackets.copy())
+            if self.cache is not None:
+                self.cache.put(text, tokens)
+
+        if self.parse:
+            if self.is_stale(generation):
+                self.parser.reset()
+                return None
+            # Yalnızca değişen token aralığıyla çakışan ifadeler yeniden ayrıştırılır;
+            # aralık bilinmiyorsa eski ve yeni akış karşılaştırılır
+            metrics = instrumentation.active
+            if metrics is not None:
+                started = perf_counter()
+            result.ast, result.errors = self.parser.parse(tokens, changed)
+            if metrics is not None:
+                metrics.record("parse", perf_counter() - started, self.parser.last_reparsed)
+        return result
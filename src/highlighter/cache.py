@@ -0,0 +1,300 @@
+import sys
+from array import array
+from bisect import bisect_left
+from collections import OrderedDict
+from hashlib import blake2b
+from typing import List, Optional
+
+from src.lexer.lexer import TokenStream, TokenType, TOKEN_TYPES
+
+# Bir (başlangıç, bitiş, token_türü) aralığının yaklaşık bellek maliyeti (bayt)
+_SPAN_BYTES = 128
+
+# Her girdinin sabit ek maliyeti (anahtar, sözlük yuvası, nesne başlıkları)
+_ENTRY_BYTES = 200
+
+
+def content_key(text: str) -> bytes:
+    """Metin için hızlı içerik özeti (BLAKE2b, 128 bit)"""
+    return blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+
+
+class _Entry:
+    """Önbellek girdisi: belge için token akışı ve aralıklar, blok için göreli sütunlar"""
+    __slots__ = ("tokens", "spans", "size")
+
+    def __init__(self, tokens, size):
+        self.tokens = tokens
+        self.spans = None
+        self.size = size
+
+
+class HighlightCache:
+    """
+    Token akışlarını ve vurgulama aralığı listelerini içerik özetiyle saklayan LRU
+    önbellek. Belge düzeyinde tam metin, blok düzeyinde içerik tanımlı satır blokları
+    anahtarlanır; böylece yalnızca bir kısmı değişmiş bir metinde değişmeyen bloklar
+    yeniden taranmaz. Toplam boyut max_bytes ile sınırlıdır. Anahtarlar yalnızca
+    metinden oluşur; bir önbellek tek bir dil tanımıyla kullanılmalıdır. İş parçacığı
+    güvenli değildir; tek bir iş parçacığından kullanılmalıdır.
+    """
+    def __init__(self, max_bytes: int = 32 * 1024 * 1024, block_mask: int = 31,
+                 min_block_lines: int = 8, max_block_lines: int = 256):
+        self.max_bytes = max_bytes
+        self.size = 0
+
+        # Blok sınırları: hash(satır) & block_mask == 0 olan satırlardan sonra kesilir
+        self.block_mask = block_mask
+        self.min_block_lines = min_block_lines
+        self.max_block_lines = max_block_lines
+
+        self._entries = OrderedDict()  # ("d" | "b", özet) -> _Entry
+
+        # Son özetlenen metin (aynı sürüm için özet yeniden hesaplanmaz)
+        self._last_text = None
+        self._last_key = None
+
+        # Sayaçlar
+        self.hits = 0
+        self.misses = 0
+        self.block_hits = 0
+        self.block_misses = 0
+
+    def stats(self) -> dict:
+        """İsabet/ıska sayaçları ve boyut bilgisi"""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "block_hits": self.block_hits,
+            "block_misses": self.block_misses,
+            "entries": len(self._entries),
+            "bytes": self.size,
+            "max_bytes": self.max_bytes,
+        }
+
+    def clear(self):
+        """Tüm girdileri ve sayaçları sıfırla"""
+        self._entries.clear()
+        self.size = 0
+        self._last_text = self._last_key = None
+        self.hits = self.misses = self.block_hits = self.block_misses = 0
+
+    def _key(self, text: str) -> bytes:
+        if self._last_text is not text:
+            self._last_key = content_key(text)
+            self._last_text = text
+        return self._last_key
+
+    def _get(self, key) -> Optional[_Entry]:
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    def _put(self, key, entry: _Entry):
+        if entry.size > self.max_bytes or key in self._entries:
+            return
+        self._entries[key] = entry
+        self.size += entry.size
+        self._evict()
+
+    def _grow(self, entry: _Entry, size: int):
+        """Var olan bir girdinin boyutunu artır"""
+        entry.size += size
+        self.size += size
+        self._evict()
+
+    def _evict(self):
+        """Sınır aşıldıysa en uzun süredir kullanılmayan girdileri at"""
+        entries = self._entries
+        while self.size > self.max_bytes and entries:
+            _, entry = entries.popitem(last=False)
+            self.size -= entry.size
+
+    def get(self, text: str) -> Optional[TokenStream]:
+        """Metin önbellekteyse token akışını döndür; metni taramaz"""
+        entry = self._get(("d", self._key(text)))
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return entry.tokens
+
+    def put(self, text: str, tokens: TokenStream):
+        """
+        Başka bir yerde üretilmiş token akışını belge düzeyinde sakla. Akış daha sonra
+        değiştirilmemelidir (ör. artımlı lexer'ın dizileri değil, kopyaları verilir).
+        """
+        self._put(("d", self._key(text)), _Entry(tokens, self._stream_size(tokens)))
+
+    def tokenize(self, text: str, lexer) -> TokenStream:
+        """
+        Metnin token akışını döndür. Belge önbellekte yoksa, önbellekteki bloklar
+        yeniden kullanılır ve yalnızca kalan kısımlar verilen lexer ile taranır.
+        """
+        key = ("d", self._key(text))
+        entry = self._get(key)
+        if entry is not None:
+            self.hits += 1
+            return entry.tokens
+        self.misses += 1
+
+        bounds = self._block_bounds(text)
+        block_keys = [content_key(text[bounds[i]:bounds[i + 1]]) for i in range(len(bounds) - 1)]
+        tokens = self._assemble(text, lexer, bounds, block_keys)
+        self._put(key, _Entry(tokens, self._stream_size(tokens)))
+        self._store_blocks(text, tokens, bounds, block_keys, lexer)
+        return tokens
+
+    def spans(self, text: str, lexer) -> List[tuple]:
+        """
+        Boşluklar dışındaki token'lar için (başlangıç, bitiş, token_türü) listesini
+        döndür. Liste önbellekle paylaşılır; değiştirilmemelidir.
+        """
+        tokens = self.tokenize(text, lexer)
+        entry = self._entries.get(("d", self._last_key))
+        if entry is not None and entry.spans is not None:
+            return entry.spans
+
+        whitespace = TokenType.WHITESPACE.value
+        spans = [
+            (start_pos, end_pos, TOKEN_TYPES[code])
+            for code, start_pos, end_pos in zip(tokens.types, tokens.starts, tokens.ends)
+            if code != whitespace
+        ]
+        if entry is not None:
+            entry.spans = spans
+            self._grow(entry, len(spans) * _SPAN_BYTES)
+        return spans
+
+    def _block_bounds(self, text: str) -> List[int]:
+        """
+        İçerik tanımlı blok sınırlarını döndür. Bir satırdan sonra kesilip kesilmeyeceği
+        yalnızca o satırın içeriğine bağlıdır; böylece bir ekleme sonraki sınırları kaydırmaz.
+        """
+        bounds = [0]
+        find = text.find
+        mask = self.block_mask
+        min_lines, max_lines = self.min_block_lines, self.max_block_lines
+        line_start = 0
+        lines = 0
+        newline = find("\n")
+        while newline != -1:
+            next_start = newline + 1
+            lines += 1
+            if lines >= min_lines and (lines >= max_lines or hash(text[line_start:next_start]) & mask == 0):
+                bounds.append(next_start)
+                lines = 0
+            line_start = next_start
+            newline = find("\n", next_start)
+        if bounds[-1] != len(text):
+            bounds.append(len(text))
+        return bounds
+
+    def _assemble(self, text, lexer, bounds, block_keys) -> TokenStream:
+        """Önbellekteki blokları birleştir, aradaki bölgeleri bağlamı içinde tara"""
+        types, starts, ends = array('B'), array('l'), array('l')
+        whitespace = TokenType.WHITESPACE.value
+        length = len(text)
+        position = 0
+        block = 0
+
+        while position < length:
+            while bounds[block + 1] <= position:
+                block += 1
+
+            if position == bounds[block]:
+                entry = self._get(("b", block_keys[block]))
+                if entry is None:
+                    self.block_misses += 1
+                else:
+                    self.block_hits += 1
+                    block_types, block_starts, block_ends = entry.tokens
+                    count = len(block_types)
+                    end = bounds[block + 1]
+                    # Sondaki boşluk token'ı sonraki bloğun baştaki boşluğuyla birleşir
+                    if end < length and block_types[-1] == whitespace and text[end].isspace():
+                        count -= 1
+                    if count:
+                        types.extend(block_types[:count])
+                        starts.extend(array('l', [start + position for start in block_starts[:count]]))
+                        ends.extend(array('l', [block_end + position for block_end in block_ends[:count]]))
+                        position += block_ends[count - 1]
+                        continue
+
+            position = self._scan(text, lexer, position, bounds, block, types, starts, ends)
+
+        return TokenStream(text, types, starts, ends)
+
+    @staticmethod
+    def _scan(text, lexer, position, bounds, block, types, starts, ends) -> int:
+        """Konumdan itibaren, bir token tam olarak bir blok sınırında bitene kadar tara"""
+        group_to_code = lexer.group_to_code
+        error_code = TokenType.ERROR.value
+        length = len(text)
+
+        for match in lexer.regex.finditer(text, position):
+            start_pos, end_pos = match.span()
+            if start_pos > position:
+                types.append(error_code)
+                starts.append(position)
+                ends.append(start_pos)
+            types.append(group_to_code[match.lastgroup])
+            starts.append(start_pos)
+            ends.append(end_pos)
+            position = end_pos
+
+            while bounds[block + 1] < end_pos:
+                block += 1
+            if bounds[block + 1] == end_pos:
+                return position
+
+        # Kalan metin hata token'i olarak eklenir
+        if position < length:
+            types.append(error_code)
+            starts.append(position)
+            ends.append(length)
+        return length
+
+    def _store_blocks(self, text, tokens, bounds, block_keys, lexer):
+        """
+        Her iki sınırı da token sınırına denk gelen blokların token'larını sakla.
+        Sonraki metne bakan (kapanmamış dizi veya blok yorum denemesi içeren) bloklar
+        başka bir bağlamda farklı taranabileceği için saklanmaz.
+        """
+        types, starts, ends = tokens.types, tokens.starts, tokens.ends
+        error_code = TokenType.ERROR.value
+        operator_code = TokenType.OPERATOR.value
+        quotes = lexer.quotes
+        comment_start = lexer.block_comment_start
+
+        for block in range(len(bounds) - 1):
+            key = ("b", block_keys[block])
+            if key in self._entries:
+                continue
+            block_start, block_end = bounds[block], bounds[block + 1]
+            first = bisect_left(starts, block_start)
+            last = bisect_left(starts, block_end, first)
+            if first == last or starts[first] != block_start or ends[last - 1] != block_end:
+                continue
+            block_types = types[first:last]
+            opens_comment = comment_start is not None and comment_start in text[block_start:block_end]
+            if (error_code in block_types or opens_comment) and any(
+                (code == error_code and any(quote in text[start:end] for quote in quotes))
+                or (code == operator_code and comment_start and text.startswith(comment_start, start))
+                for code, start, end in zip(block_types, starts[first:last], ends[first:last])
+            ):
+                continue
+
+            block_starts = array('l', [start - block_start for start in starts[first:last]])
+            block_ends = array('l', [end - block_start for end in ends[first:last]])
+            size = _ENTRY_BYTES + len(block_types) * (
+                block_types.itemsize + block_starts.itemsize + block_ends.itemsize
+            )
+            self._put(key, _Entry((block_types, block_starts, block_ends), size))
+
+    @staticmethod
+    def _stream_size(tokens: TokenStream) -> int:
+        """Token akışının (ve tuttuğu metnin) yaklaşık bellek maliyeti"""
+        columns = len(tokens) * (tokens.types.itemsize + tokens.starts.itemsize + tokens.ends.itemsize)
+        return _ENTRY_BYTES + columns + sys.getsizeof(tokens.text)
@@ -1,28 +1,48 @@
-import tkinter as tk
-from tkinter import font
-from typing import List, Dict, Any
-from src.lexer.lexer import Lexer, TokenType
+from bisect import bisect_left, bisect_right
+from time import perf_counter
+from src import instrumentation
+from src.lexer.lexer import Lexer, TokenType, TOKEN_TYPES
+from src.lexer.incremental import IncrementalLexer
+from src.lexer.line_index import LineIndex
+from src.highlighter.spans import SPAN_WIDTH, encode_spans
 
 class SyntaxHighlighter:
-    """Metni token'lara ayıran ve vurgulama kurallarını uygulayan sözdizimi vurgulayıcısı"""
-    def __init__(self):
-        self.lexer = Lexer()
+    """
+    Metni token'lara ayıran ve vurgulama kurallarını çözümleyen sözdizimi vurgulayıcısı.
+    tkinter içe aktarılmaz; widget işlemleri src.highlighter.widget bağdaştırıcısına
+    devredilir ve bu modül yalnızca ilk widget işleminde yüklenir.
+    """
+    def __init__(self, incremental=False, cache=None, language=None, lexer=None):
+        # Derlenmiş lexer birden çok vurgulayıcı arasında paylaşılabilir (ör. editör
+        # sekmeleri ve analiz işçisi); verilirse language yok sayılır
+        self.lexer = lexer if lexer is not None else Lexer(language=language)
         
-        # Temel yazı tiplerini tanımla
-        self.normal_font = None
-        self.bold_font = None
-        self.italic_font = None
-        self.bold_italic_font = None
+        # Artımlı modda yalnızca düzenlenen bölge yeniden taranır
+        self.incremental_lexer = IncrementalLexer(self.lexer) if incremental else None
         
-        # Token türünden renk ve stil eşleştirmesini tanımla
+        # İsteğe bağlı içerik adresli önbellek (HighlightCache); daha önce görülmüş
+        # metin durumları yeniden taranmaz
+        self.cache = cache
+        
+        # Tk bağdaştırıcısı (yazı tipleri ve widget etiketleri); ilk kullanımda oluşturulur
+        self._widget_adapter = None
+        
+        # Son işlenen metin sürümü için satır dizini
+        self._line_index = None
+        self._line_index_text = None
+        
+        # set_tokens ile verilen, dışarıda üretilmiş token akışı
+        self._snapshot_text = None
+        self._snapshot_tokens = None
+        
+        # Son taranan metin sürümünün token akışı; konum sorguları yeniden tarama yapmaz
+        self._cached_text = None
+        self._cached_tokens = None
+        
+        # Token türünden renk ve stil eşleştirmesi dil tanımından gelir
         self.highlighting_rules = {
-            TokenType.KEYWORD: {"foreground": "#0000FF", "font_style": "bold"},         # Mavi, kalın
-            TokenType.OPERATOR: {"foreground": "#FF00FF"},                              # Mor
-            TokenType.IDENTIFIER: {"foreground": "#000000"},                            # Siyah
-            TokenType.NUMBER: {"foreground": "#008000"},                                # Yeşil
-            TokenType.STRING: {"foreground": "#A31515"},                                # Koyu kırmızı
-            TokenType.COMMENT: {"foreground": "#008000", "font_style": "italic"},       # Yeşil, italik
-            TokenType.ERROR: {"foreground": "#FF0000", "background": "#FFEEEE"},        # Açık kırmızı arka plan üzerinde kırmızı
+            TokenType[type_name]: dict(style)
+            for type_name, style in self.lexer.language.styles.items()
         }
     
     def highlight(self, text):
@@ -30,97 +50,210 @@ class SyntaxHighlighter:
         Metni işle ve vurgulama talimatlarının bir listesini döndür
         Her talimat (başlangıç_konumu, bitiş_konumu, biçim_sözlüğü) şeklindedir
         """
-        tokens = self.lexer.tokenize(text)
-        highlighting = []
+        metrics = instrumentation.active
+        if metrics is not None:
+            started = perf_counter()
         
-        for token in tokens:
-            # Boşluk token'larını atla
-            if token.type == TokenType.WHITESPACE:
-                continue
-            
-            # Bu token türü için vurgulama kuralını al
-            format_dict = self.highlighting_rules.get(token.type, {}).copy()
-            
-            # Vurgulama talimatını ekle
-            start_pos, end_pos = token.position
-            highlighting.append((start_pos, end_pos, format_dict))
+        rules = self.highlighting_rules
+        instructions = [
+            (start_pos, end_pos, rules.get(token_type, {}).copy())
+            for start_pos, end_pos, token_type in self.token_spans(text)
+        ]
         
-        return highlighting
+        if metrics is not None:
+            metrics.record("highlight", perf_counter() - started, len(instructions))
+        return instructions
     
-    def get_token_at_position(self, text, position):
-        """Metindeki belirtilen konumdaki token'i al"""
-        tokens = self.lexer.tokenize(text)
+    def highlight_encoded(self, text):
+        """
+        Vurgulama aralıklarını sıkıştırılmış ikili biçimde (src.highlighter.spans)
+        döndür: token başına (satır farkı, başlangıç farkı, uzunluk, tür kodu)
+        dörtlüsü içeren array('I'). Stiller token başına kopyalanmaz; okuyan taraf
+        onları style_table ile tür başına bir kez çözer.
+        """
+        metrics = instrumentation.active
+        if metrics is not None:
+            started = perf_counter()
         
-        for token in tokens:
-            start_pos, end_pos = token.position
-            if start_pos <= position < end_pos:
-                return token
+        types, starts, ends = self._token_columns(text)
+        data = encode_spans(types, starts, ends, self.line_index(text).starts)
         
-        return None
+        if metrics is not None:
+            metrics.record("highlight_encoded", perf_counter() - started, len(data) // SPAN_WIDTH)
+        return data
+    
+    def set_tokens(self, text, tokens, line_index=None):
+        """
+        Başka bir yerde (ör. arka plan iş parçacığında) üretilmiş token akışını ve
+        satır dizinini bu metin sürümü için kullan; böylece metin yeniden taranmaz
+        """
+        self._snapshot_text = text
+        self._snapshot_tokens = tokens
+        if line_index is not None:
+            self._line_index = line_index
+            self._line_index_text = text
+    
+    def clear_tokens(self):
+        """set_tokens ile verilen token akışını ve satır dizinini bırak"""
+        self._snapshot_text = self._snapshot_tokens = None
+        self._line_index = self._line_index_text = None
     
-    def _setup_fonts(self, text_widget):
-        """Mevcut metin widget'ının yazı tipine dayalı olarak yazı tipi nesnelerini başlat"""
-        if self.normal_font is None:
-            # Mevcut yazı tipini al
-            current_font = font.Font(font=text_widget['font'])
-            family = current_font.actual('family')
-            size = current_font.actual('size')
-            
-            # Yazı tipi varyantlarını oluştur
-            self.normal_font = font.Font(family=family, size=size)
-            self.bold_font = font.Font(family=family, size=size, weight="bold")
-            self.italic_font = font.Font(family=family, size=size, slant="italic")
-            self.bold_italic_font = font.Font(family=family, size=size, weight="bold", slant="italic")
-        
-    def apply_highlighting_to_widget(self, text_widget, text):
-        """Bir tkinter Metin widget'ına vurgulama uygula"""
-        # Yazı tipleri başlatılmamışsa ayarla
-        self._setup_fonts(text_widget)
-        
-        # Önceki vurgulamaları temizle
-        for tag in text_widget.tag_names():
-            if tag != "sel":  # Seçim etiketini kaldırma
-                text_widget.tag_remove(tag, "1.0", "end")
-            
-        # Vurgulama talimatlarını al
-        highlighting = self.highlight(text)
-        
-        # Vurgulamayı uygula
-        for start_pos, end_pos, format_dict in highlighting:
-            # Karakter konumlarını satır.sütun biçimine dönüştür
-            start_line, start_col = self._index_to_line_col(text, start_pos)
-            end_line, end_col = self._index_to_line_col(text, end_pos)
-            
-            # Tkinter indeks biçimine dönüştür
-            start_index = f"{start_line+1}.{start_col}"
-            end_index = f"{end_line+1}.{end_col}"
-            
-            # Konuma dayalı benzersiz bir etiket adı oluştur
-            tag_name = f"highlight_{start_pos}_{end_pos}"
-            
-            # Yazı tipi stilini diğer özelliklerden farklı şekilde ele al
-            font_style = format_dict.pop("font_style", None)
-            if font_style == "bold":
-                format_dict["font"] = self.bold_font
-            elif font_style == "italic":
-                format_dict["font"] = self.italic_font
-            elif font_style == "bold_italic":
-                format_dict["font"] = self.bold_italic_font
+    def token_stream(self, text):
+        """
+        Metnin bu sürümü için token akışını döndür. Aynı metin için son akış yeniden
+        kullanılır; metin yalnızca değiştiğinde taranır.
+        """
+        if self._snapshot_text is text:
+            return self._snapshot_tokens
+        if self.incremental_lexer is not None:
+            # Artımlı lexer güncel sütunlu veriyi tutar
+            self.incremental_lexer.update(text)
+            return self.incremental_lexer.tokens
+        if self._cached_text is not text and self._cached_text != text:
+            if self.cache is not None:
+                self._cached_tokens = self.cache.tokenize(text, self.lexer)
             else:
-                format_dict["font"] = self.normal_font
-                
-            # Etiketi biçim ayarlarıyla yapılandır
-            text_widget.tag_configure(tag_name, **format_dict)
-            
-            # Etiketi uygula
-            text_widget.tag_add(tag_name, start_index, end_index)
-    
-    def _index_to_line_col(self, text, index):
-        """Karakter indeksini satır ve sütuna dönüştür"""
-        if index >= len(text):
-            index = len(text) - 1
-            
-        lines = text[:index+1].split('\n')
-        line_count = len(lines) - 1
-        col = len(lines[-1]) - 1
-        return line_count, col 
\ No newline at end of file
+                self._cached_tokens = self.lexer.tokenize(text)
+        self._cached_text = text
+        return self._cached_tokens
+    
+    def _token_columns(self, text):
+        """Metnin bu sürümü için (tür kodları, başlangıçlar, bitişler) dizilerini döndür"""
+        stream = self.token_stream(text)
+        return stream.types, stream.starts, stream.ends
+    
+    def token_spans(self, text):
+        """Boşluklar dışındaki token'lar için (başlangıç, bitiş, token_türü) listesini döndür"""
+        if self.cache is not None and self.incremental_lexer is None and self._snapshot_text is not text:
+            # Aralık listesi de önbellektedir
+            return list(self.cache.spans(text, self.lexer))
+        
+        types, starts, ends = self._token_columns(text)
+        
+        # Boşluk token'larını atla
+        whitespace = TokenType.WHITESPACE.value
+        return [
+            (start_pos, end_pos, TOKEN_TYPES[code])
+            for code, start_pos, end_pos in zip(types, starts, ends)
+            if code != whitespace
+        ]
+    
+    def token_spans_in_range(self, text, start, end):
+        """
+        [start, end) karakter aralığıyla kesişen token'lar için aralığa kırpılmış
+        (başlangıç, bitiş, token_türü) listesini döndür
+        """
+        if self.incremental_lexer is not None and self._snapshot_text is not text:
+            # Aralığın başındaki lexer durumu satır kontrol noktasından alınır; böylece
+            # aralıktan önce başlayan bir blok yorum da doğru vurgulanır
+            lexer = self.incremental_lexer
+            lexer.update(text)
+            _, index, _ = lexer.checkpoint(lexer.line_of(start))
+            types, starts, ends = lexer.columns()
+        else:
+            types, starts, ends = self._token_columns(text)
+            index = max(bisect_right(starts, start) - 1, 0)
+        
+        whitespace = TokenType.WHITESPACE.value
+        count = len(starts)
+        spans = []
+        while index < count and starts[index] < end:
+            code = types[index]
+            if ends[index] > start and code != whitespace:
+                spans.append((max(starts[index], start), min(ends[index], end), TOKEN_TYPES[code]))
+            index += 1
+        
+        return spans
+    
+    def line_index(self, text):
+        """Metnin bu sürümü için satır dizinini döndür; gerekirse oluştur veya artımlı güncelle"""
+        if self._line_index is not None and self._line_index_text is text:
+            return self._line_index
+        
+        if self.incremental_lexer is not None:
+            # Artımlı lexer satır dizinini zaten güncel tutar
+            self.incremental_lexer.update(text)
+            return self.incremental_lexer.lines
+        
+        if self._line_index is None:
+            self._line_index = LineIndex(text)
+        elif self._line_index_text is not text:
+            edit = IncrementalLexer.find_edit(self._line_index_text, text)
+            if edit is not None:
+                self._line_index.update(text, *edit)
+        self._line_index_text = text
+        return self._line_index
+    
+    def _offset(self, text, position):
+        """Karakter indeksini veya tkinter "satır.sütun" indeksini karakter konumuna dönüştür"""
+        if isinstance(position, str):
+            line, col = position.split(".")
+            return self.line_index(text).offset(int(line) - 1, int(col))
+        return position
+    
+    def get_token_at_position(self, text, position):
+        """
+        Metindeki belirtilen konumdaki token'i al.
+        Konum bir karakter indeksi ya da tkinter "satır.sütun" indeksi olabilir.
+        Token başlangıçları üzerinde ikili arama yapılır; metin yeniden taranmaz.
+        """
+        stream = self.token_stream(text)
+        position = self._offset(text, position)
+        index = bisect_right(stream.starts, position) - 1
+        if index >= 0 and position < stream.ends[index]:
+            return stream[index]
+        return None
+    
+    def get_tokens_at_positions(self, text, positions):
+        """Birden çok konum için token'ları (bulunamayanlar için None) tek akış üzerinden döndür"""
+        stream = self.token_stream(text)
+        starts, ends = stream.starts, stream.ends
+        tokens = []
+        for position in positions:
+            position = self._offset(text, position)
+            index = bisect_right(starts, position) - 1
+            tokens.append(stream[index] if index >= 0 and position < ends[index] else None)
+        return tokens
+    
+    def tokens_in_range(self, text, start, end):
+        """[start, end) karakter aralığıyla kesişen token'ları (kırpılmadan) döndür"""
+        stream = self.token_stream(text)
+        start, end = self._offset(text, start), self._offset(text, end)
+        first = max(bisect_right(stream.starts, start) - 1, 0)
+        if first < len(stream) and stream.ends[first] <= start:
+            first += 1
+        return list(stream[first:bisect_left(stream.starts, end, first)])
+    
+    @property
+    def widget_adapter(self):
+        """Tk bağdaştırıcısı (WidgetHighlighter); ilk widget işleminde yüklenir"""
+        if self._widget_adapter is None:
+            from src.highlighter.widget import WidgetHighlighter
+            self._widget_adapter = WidgetHighlighter(self)
+        return self._widget_adapter
+    
+    def apply_highlighting_to_widget(self, text_widget, text, first_line=None, last_line=None, edit=None):
+        """
+        Bir tkinter Metin widget'ına vurgulama uygula.
+        first_line/last_line (1 tabanlı, dahil) verilirse yalnızca o satırlar etiketlenir.
+        Yalnızca son uygulamadan beri değişen aralıklar yeniden etiketlenir; metin
+        değiştiyse `edit` (başlangıç, eski_bitiş, yeni_bitiş) düzenlenen bölgeyi verir.
+        """
+        self.widget_adapter.apply(text_widget, text, first_line, last_line, edit)
+    
+    def clear_highlighting(self, text_widget, first_line=None, last_line=None, text=None):
+        """
+        Vurgulama etiketlerini tüm widget'tan veya verilen satırlardan (1 tabanlı, dahil)
+        kaldır; satırlar widget'a son uygulanan metne (`text`) göredir
+        """
+        self.widget_adapter.clear(text_widget, first_line, last_line, text)
+    
+    def compact_widget(self, text_widget):
+        """Widget'a uygulanan aralıkların kaydını sıkıştır (ör. sekme etkin değilken)"""
+        if self._widget_adapter is not None:
+            self._widget_adapter.compact(text_widget)
+    
+    def forget_widget(self, text_widget):
+        """Widget'a uygulanan aralıkların kaydını bırak (ör. widget yok edildiğinde)"""
+        if self._widget_adapter is not None:
+            self._widget_adapter.forget(text_widget)
@@ -0,0 +1,86 @@
+import html
+import json
+
+
+def _hex_to_rgb(color):
+    """'#RRGGBB' biçimindeki rengi (r, g, b) üçlüsüne dönüştür"""
+    color = color.lstrip("#")
+    return tuple(int(color[i:i + 2], 16) for i in (0, 2, 4))
+
+
+def html_styles(highlighting_rules):
+    """Her token türü için CSS stil dizesini bir kez oluştur"""
+    styles = {}
+    for token_type, rule in highlighting_rules.items():
+        parts = []
+        if "foreground" in rule:
+            parts.append(f"color:{rule['foreground']}")
+        if "background" in rule:
+            parts.append(f"background-color:{rule['background']}")
+        font_style = rule.get("font_style", "")
+        if "bold" in font_style:
+            parts.append("font-weight:bold")
+        if "italic" in font_style:
+            parts.append("font-style:italic")
+        styles[token_type] = ";".join(parts)
+    return styles
+
+
+def ansi_styles(highlighting_rules):
+    """Her token türü için ANSI (24 bit renk) başlangıç dizisini bir kez oluştur"""
+    styles = {}
+    for token_type, rule in highlighting_rules.items():
+        codes = []
+        font_style = rule.get("font_style", "")
+        if "bold" in font_style:
+            codes.append("1")
+        if "italic" in font_style:
+            codes.append("3")
+        if "foreground" in rule:
+            codes.append("38;2;%d;%d;%d" % _hex_to_rgb(rule["foreground"]))
+        if "background" in rule:
+            codes.append("48;2;%d;%d;%d" % _hex_to_rgb(rule["background"]))
+        styles[token_type] = f"\x1b[{';'.join(codes)}m" if codes else ""
+    return styles
+
+
+def render_html(text, spans, styles, title=""):
+    """(başlangıç, bitiş, token_türü) aralıklarından bağımsız bir HTML belgesi oluştur"""
+    parts = [
+        "<!DOCTYPE html>\n<html><head><meta charset=\"utf-8\">",
+        f"<title>{html.escape(title)}</title></head>\n<body><pre>",
+    ]
+    position = 0
+    for start, end, token_type in spans:
+        if start > position:
+            parts.append(html.escape(text[position:start]))
+        style = styles.get(token_type)
+        value = html.escape(text[start:end])
+        parts.append(f"<span style=\"{style}\">{value}</span>" if style else value)
+        position = end
+    parts.append(html.escape(text[position:]))
+    parts.append("</pre></body></html>\n")
+    return "".join(parts)
+
+
+def render_ansi(text, spans, styles):
+    """(başlangıç, bitiş, token_türü) aralıklarından ANSI renkli metin oluştur"""
+    reset = "\x1b[0m"
+    parts = []
+    position = 0
+    for start, end, token_type in spans:
+        if start > position:
+            parts.append(text[position:start])
+        style = styles.get(token_type)
+        parts.append(f"{style}{text[start:end]}{reset}" if style else text[start:end])
+        position = end
+    parts.append(text[position:])
+    return "".join(parts)
+
+
+def render_json(spans, path=None):
+    """Aralıkları [başlangıç, bitiş, "TÜR"] listesi olarak JSON'a dönüştür"""
+    return json.dumps({
+        "path": path,
+        "spans": [[start, end, token_type.name] for start, end, token_type in spans],
+    })
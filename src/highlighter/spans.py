@@ -0,0 +1,105 @@
+"""
+Vurgulama aralıkları için sıkıştırılmış ikili biçim.
+
+Boşluklar dışındaki her token, LSP semantic tokens biçimine benzer şekilde
+dört işaretsiz tamsayıyla kodlanır:
+
+    (satır farkı, başlangıç farkı, uzunluk, tür kodu)
+
+Satır farkı önceki token'ın satırına göredir; başlangıç farkı aynı satırdaysa
+önceki token'ın sütununa, değilse satır başına göredir. Tür kodu
+TokenType.value'dur. LSP'den farklı olarak çok satırlı token'lar (blok
+yorumlar) bölünmez; uzunluk satır sonlarını da sayar, böylece kod çözme
+karakter konumlarını tam olarak geri verir. Mutlak konumlar kodlanmadığı için
+metin boyutu sınırsızdır; yalnızca satır farkı, sütun ve uzunluk 2**32'den küçük
+olmalıdır, aşılırsa encode_spans OverflowError yükseltir.
+
+Veri array('I') içinde, yerel bayt sırasıyla tutulur. Tampon protokolü
+sayesinde kopyalanmadan paylaşılabilir (ör. multiprocessing.shared_memory veya
+mmap üzerine yazılıp `span_view` ile okunabilir). Farklı bayt sıralı bir
+makineye gönderilecekse array.byteswap() kullanılmalıdır.
+"""
+from array import array
+from bisect import bisect_right
+from sys import maxsize
+
+from src.lexer.lexer import TokenType, TOKEN_TYPES
+
+# Token başına tamsayı sayısı
+SPAN_WIDTH = 4
+SPAN_TYPECODE = 'I'
+
+
+def encode_spans(types, starts, ends, line_starts):
+    """
+    Sütunlu token dizilerini ve satır başlangıçlarını (LineIndex.starts)
+    göreli dörtlülerden oluşan array('I') verisine kodla
+    """
+    whitespace = TokenType.WHITESPACE.value
+    last_line = len(line_starts) - 1
+    data = array(SPAN_TYPECODE)
+    add = data.extend
+    line = previous_line = previous_column = line_start = 0
+    next_line_start = line_starts[1] if last_line else maxsize
+
+    for code, start, end in zip(types, starts, ends):
+        if code == whitespace:
+            continue
+        if start >= next_line_start:
+            line = bisect_right(line_starts, start, line + 1) - 1
+            line_start = line_starts[line]
+            next_line_start = line_starts[line + 1] if line < last_line else maxsize
+            column = start - line_start
+            add((line - previous_line, column, end - start, code))
+            previous_line = line
+        else:
+            column = start - line_start
+            add((0, column - previous_column, end - start, code))
+        previous_column = column
+    return data
+
+
+def decode_spans(data, line_starts, table=TOKEN_TYPES):
+    """
+    Kodlanmış veriyi (array, memoryview veya `span_view` sonucu) satır
+    başlangıçlarıyla (başlangıç, bitiş, table[tür_kodu]) listesine çöz. Varsayılan
+    tablo token türlerini verir; `style_table` sonucu verilirse doğrudan stiller döner.
+    """
+    spans = []
+    add = spans.append
+    line = column = line_start = 0
+    columns = (data[field::SPAN_WIDTH] for field in range(SPAN_WIDTH))
+    for delta_line, delta_start, length, code in zip(*columns):
+        if delta_line:
+            line += delta_line
+            line_start = line_starts[line]
+            column = delta_start
+        else:
+            column += delta_start
+        start = line_start + column
+        add((start, start + length, table[code]))
+    return spans
+
+
+def span_view(buffer):
+    """
+    Bayt tamponunu (bytes, bytearray, mmap, shared_memory.buf) kopyalamadan
+    kodlanmış veri olarak görüntüle
+    """
+    view = memoryview(buffer)
+    if view.format != SPAN_TYPECODE:
+        view = view.cast('B').cast(SPAN_TYPECODE)
+    if len(view) % SPAN_WIDTH:
+        raise ValueError(f"Aralık verisi {SPAN_WIDTH} tamsayının katı olmalı: {len(view)}")
+    return view
+
+
+def style_table(highlighting_rules):
+    """
+    Vurgulama kurallarını tür koduna göre indekslenmiş bir listeye çöz. `decode_spans`
+    tablosu olarak verildiğinde stiller token başına değil, tür başına bir kez çözülür.
+    """
+    table = [None] * len(TOKEN_TYPES)
+    for token_type, rule in highlighting_rules.items():
+        table[token_type.value] = rule
+    return table
@@ -0,0 +1,362 @@
+"""
+Vurgulayıcının tkinter bağdaştırıcısı.
+
+Çekirdek vurgulayıcı (SyntaxHighlighter) yalnızca token'ları, aralıkları ve
+stilleri hesaplar; bu modül bunları bir Text widget'ının etiketlerine uygular.
+Modül, ilk widget işleminde SyntaxHighlighter tarafından yüklenir; tkinter ise
+ancak yazı tipleri ilk kez oluşturulurken içe aktarılır. Böylece başsız işçiler
+ve toplu vurgulayıcı Tk kütüphaneleri olmadan çalışır.
+"""
+from array import array
+from bisect import bisect_left
+from time import perf_counter
+
+from src import instrumentation
+from src.highlighter.spans import decode_spans, encode_spans
+from src.lexer.line_index import LineIndex
+
+
+class WidgetHighlighter:
+    """Bir SyntaxHighlighter'ın aralıklarını Tk Text widget etiketlerine uygulayan bağdaştırıcı"""
+    # Bir türün bu kadardan çok aralığı kaldırılacaksa etiket bölgeden tek çağrıda kaldırılır
+    REMOVE_BATCH = 64
+
+    # Ortak önek/sonek aramasında tek seferde karşılaştırılan aralık sayısı
+    DIFF_CHUNK = 1024
+
+    def __init__(self, highlighter):
+        self.highlighter = highlighter
+
+        # Temel yazı tiplerini tanımla
+        self.normal_font = None
+        self.bold_font = None
+        self.italic_font = None
+        self.bold_italic_font = None
+
+        # Etiketleri yapılandırılmış widget'lar
+        self._configured_widgets = set()
+
+        # Widget adı -> (uygulandığı metin, widget'ta etiketli (başlangıç, bitiş, tür) aralıkları).
+        # Etkin olmayan widget'ların aralıkları compact() ile src.highlighter.spans biçiminde
+        # (aralık başına 16 bayt) tutulur ve ilk kullanımda listeye açılır
+        self._applied = {}
+
+    def _setup_fonts(self, text_widget):
+        """Mevcut metin widget'ının yazı tipine dayalı olarak yazı tipi nesnelerini başlat"""
+        if self.normal_font is None:
+            from tkinter import font
+
+            # Mevcut yazı tipini al
+            current_font = font.Font(font=text_widget['font'])
+            family = current_font.actual('family')
+            size = current_font.actual('size')
+
+            # Yazı tipi varyantlarını oluştur
+            self.normal_font = font.Font(family=family, size=size)
+            self.bold_font = font.Font(family=family, size=size, weight="bold")
+            self.italic_font = font.Font(family=family, size=size, slant="italic")
+            self.bold_italic_font = font.Font(family=family, size=size, weight="bold", slant="italic")
+
+    @staticmethod
+    def tag_name(token_type):
+        """Bir token türü için paylaşılan widget etiketinin adı"""
+        return f"token_{token_type.name.lower()}"
+
+    def _setup_tags(self, text_widget):
+        """Her token türü için tek bir etiketi, stilleri bir kez çözümleyerek yapılandır"""
+        if str(text_widget) in self._configured_widgets:
+            return
+
+        fonts = {
+            "bold": self.bold_font,
+            "italic": self.italic_font,
+            "bold_italic": self.bold_italic_font,
+        }
+        for token_type, rule in self.highlighter.highlighting_rules.items():
+            options = {key: value for key, value in rule.items() if key != "font_style"}
+            options["font"] = fonts.get(rule.get("font_style"), self.normal_font)
+            text_widget.tag_configure(self.tag_name(token_type), **options)
+
+        # Seçim etiketi vurgulamanın üzerinde kalsın
+        text_widget.tag_raise("sel")
+        self._configured_widgets.add(str(text_widget))
+
+    def apply(self, text_widget, text, first_line=None, last_line=None, edit=None):
+        """
+        Bir tkinter Metin widget'ına vurgulama uygula.
+        first_line/last_line (1 tabanlı, dahil) verilirse yalnızca o satırlar etiketlenir.
+        Widget'a son uygulanan aralıklar hatırlanır; yeni aralıklarla doğrusal bir
+        birleştirmeyle karşılaştırılır ve yalnızca eklenen, kaldırılan veya türü
+        değişen aralıklar için Tk çağrısı yapılır. Metin son uygulamadan beri
+        değiştiyse `edit` (başlangıç, eski_bitiş, yeni_bitiş) düzenlenen bölgeyi verir;
+        verilmezse tüm eski etiketler kaldırılır.
+        """
+        metrics = instrumentation.active
+        if metrics is not None:
+            started = perf_counter()
+
+        # Yazı tipleri ve etiketler başlatılmamışsa ayarla
+        self._setup_fonts(text_widget)
+        self._setup_tags(text_widget)
+
+        highlighter = self.highlighter
+        line_index = highlighter.line_index(text)
+        if first_line is None:
+            spans = highlighter.token_spans(text)
+            first, last = 0, line_index.length
+        else:
+            first = line_index.offset(first_line - 1, 0)
+            last = line_index.offset(last_line, 0)
+            spans = highlighter.token_spans_in_range(text, first, last)
+
+        if metrics is not None:
+            spans_done = perf_counter()
+            metrics.record("spans", spans_done - started, len(spans))
+
+        # Widget'taki etiketlerin yeni metindeki konumları; bilinmeyen bölgeler temizlenir
+        applied = self._applied_spans(text_widget, text, line_index, edit)
+
+        # Uygulanan aralıkları hedef bölgenin önü, içi ve arkası olarak ayır
+        head, inside, tail = self._split_spans(applied, first, last)
+        removed, added = self._diff_spans(inside, spans)
+
+        # Kaldırılacak aralık sayısı çoksa tür etiketi bölgeden tek çağrıda kaldırılır
+        # ve o türün tüm yeni aralıkları yeniden eklenir
+        removed_by_type = {}
+        for span in removed:
+            removed_by_type.setdefault(span[2], []).append(span)
+        cleared = {
+            token_type for token_type, items in removed_by_type.items()
+            if len(items) > self.REMOVE_BATCH
+        }
+        if cleared:
+            added = [span for span in added if span[2] not in cleared]
+            added += [span for span in spans if span[2] in cleared]
+            added.sort(key=lambda span: span[0])
+
+        # Karakter konumlarını tek geçişte satır.sütun biçimine dönüştür
+        removed_positions = line_index.convert_spans(removed)
+        added_positions = line_index.convert_spans(added)
+
+        if metrics is not None:
+            convert_done = perf_counter()
+            metrics.record("convert", convert_done - spans_done, len(removed) + len(added))
+
+        if cleared:
+            first_index, last_index = self._index(line_index, first), self._index(line_index, last)
+            for token_type in cleared:
+                text_widget.tag_remove(self.tag_name(token_type), first_index, last_index)
+        for (_, _, token_type), (start_line, start_col, end_line, end_col) in zip(removed, removed_positions):
+            if token_type not in cleared:
+                text_widget.tag_remove(
+                    self.tag_name(token_type), f"{start_line+1}.{start_col}", f"{end_line+1}.{end_col}"
+                )
+
+        # Eklenen aralıkları türe göre grupla ve her tür için tek çağrıda ekle
+        ranges = {}
+        for (_, _, token_type), (start_line, start_col, end_line, end_col) in zip(added, added_positions):
+            indices = ranges.setdefault(token_type, [])
+            indices.append(f"{start_line+1}.{start_col}")
+            indices.append(f"{end_line+1}.{end_col}")
+        for token_type, indices in ranges.items():
+            if token_type in highlighter.highlighting_rules:
+                text_widget.tag_add(self.tag_name(token_type), *indices)
+
+        self._applied[str(text_widget)] = (text, head + spans + tail if head or tail else spans)
+
+        if metrics is not None:
+            finished = perf_counter()
+            tagged = len(removed) + len(added)
+            metrics.record("tag", finished - convert_done, tagged)
+            metrics.record("widget", finished - started, tagged)
+
+    def _applied_spans(self, text_widget, text, line_index, edit):
+        """
+        Widget'a son uygulanan aralıkları yeni metnin konumlarına taşı. Düzenlenen
+        bölgedeki etiketler (araya giren karakterler komşu etiketleri alabilir)
+        bilinmediği için widget'tan kaldırılır; önceki durum bilinmiyorsa tüm
+        etiketler kaldırılır.
+        """
+        state = self._state(str(text_widget))
+        if state is not None:
+            if state[0] is text:
+                # Bu metin sürümü için zaten taşındı (ör. görünüm alanının önceki bir aralığında)
+                return state[1]
+            if not state[1]:
+                # Hiç etiket yok; bu her metin için geçerlidir
+                return []
+            if edit is None and state[0] == text:
+                return state[1]
+
+        if state is None or edit is None:
+            for token_type in self.highlighter.highlighting_rules:
+                text_widget.tag_remove(self.tag_name(token_type), "1.0", "end")
+            return []
+
+        start, old_end, new_end = edit
+        spans = state[1]
+        if new_end > start:
+            # Bölgede yalnızca orada zaten olan ya da iki komşusundan miras alınan etiketler olabilir
+            first = max(bisect_left(spans, (start,)) - 1, 0)
+            last = bisect_left(spans, (old_end + 1,))
+            token_types = {
+                token_type for span_start, span_end, token_type in spans[first:last]
+                if span_end >= start and span_start <= old_end
+            }
+            first_index, last_index = self._index(line_index, start), self._index(line_index, new_end)
+            for token_type in token_types:
+                text_widget.tag_remove(self.tag_name(token_type), first_index, last_index)
+        return self._shift_spans(spans, start, old_end, new_end)
+
+    @staticmethod
+    def _index(line_index, offset):
+        """Karakter konumunu Tk "satır.sütun" indeksine dönüştür"""
+        line, column = line_index.line_col(offset)
+        return f"{line+1}.{column}"
+
+    @staticmethod
+    def _shift_spans(spans, start, old_end, new_end):
+        """
+        Sıralı aralıkları [start, old_end) bölgesinin [start, new_end) ile değiştirildiği
+        düzenlemeden sonraki konumlarına taşı; bölgeyle kesişen kısımlar atılır
+        """
+        delta = new_end - old_end
+        first = bisect_left(spans, (start,))
+        if first and spans[first - 1][1] > start:
+            first -= 1
+        last = max(bisect_left(spans, (old_end,)), first)
+
+        shifted = spans[:first]
+        for span_start, span_end, token_type in spans[first:last]:
+            if span_start < start:
+                shifted.append((span_start, start, token_type))
+            if span_end > old_end:
+                shifted.append((new_end, span_end + delta, token_type))
+        if delta:
+            shifted += [(span_start + delta, span_end + delta, token_type)
+                        for span_start, span_end, token_type in spans[last:]]
+        else:
+            shifted += spans[last:]
+        return shifted
+
+    @staticmethod
+    def _split_spans(spans, first, last):
+        """Sıralı aralıkları [first, last) bölgesinin önü, içi (bölgeye kırpılmış) ve arkası olarak ayır"""
+        head_end = bisect_left(spans, (first,))
+        if head_end and spans[head_end - 1][1] > first:
+            head_end -= 1
+        tail_start = max(bisect_left(spans, (last,)), head_end)
+
+        head, tail = spans[:head_end], spans[tail_start:]
+        inside = []
+        for span_start, span_end, token_type in spans[head_end:tail_start]:
+            if span_start < first:
+                head.append((span_start, first, token_type))
+            if span_end > last:
+                tail.insert(0, (last, span_end, token_type))
+            inside.append((max(span_start, first), min(span_end, last), token_type))
+        return head, inside, tail
+
+    @staticmethod
+    def _diff_spans(old, new):
+        """
+        Başlangıca göre sıralı iki aralık listesini doğrusal bir birleştirmeyle
+        karşılaştır; (kaldırılan, eklenen) aralık listelerini döndür
+        """
+        removed, added = [], []
+
+        # Ortak önek ve sonek, liste dilimleri bloklar halinde karşılaştırılarak atlanır
+        chunk = WidgetHighlighter.DIFF_CHUNK
+        limit = min(len(old), len(new))
+        prefix = 0
+        while prefix + chunk <= limit and old[prefix:prefix + chunk] == new[prefix:prefix + chunk]:
+            prefix += chunk
+        while prefix < limit and old[prefix] == new[prefix]:
+            prefix += 1
+        limit -= prefix
+        suffix = 0
+        old_count, new_count = len(old), len(new)
+        while (suffix + chunk <= limit
+               and old[old_count - suffix - chunk:old_count - suffix] == new[new_count - suffix - chunk:new_count - suffix]):
+            suffix += chunk
+        while suffix < limit and old[old_count - suffix - 1] == new[new_count - suffix - 1]:
+            suffix += 1
+
+        # Aradaki bölge doğrusal birleştirmeyle karşılaştırılır
+        old_count -= suffix
+        new_count -= suffix
+        i = j = prefix
+        while i < old_count and j < new_count:
+            old_span, new_span = old[i], new[j]
+            if old_span == new_span:
+                i += 1
+                j += 1
+            elif old_span[:2] == new_span[:2]:
+                # Aynı aralığın türü değişti
+                removed.append(old_span)
+                added.append(new_span)
+                i += 1
+                j += 1
+            elif old_span[:2] < new_span[:2]:
+                removed.append(old_span)
+                i += 1
+            else:
+                added.append(new_span)
+                j += 1
+        removed += old[i:old_count]
+        added += new[j:new_count]
+        return removed, added
+
+    def clear(self, text_widget, first_line=None, last_line=None, text=None):
+        """
+        Vurgulama etiketlerini tüm widget'tan veya verilen satırlardan (1 tabanlı, dahil)
+        kaldır. Satırlar, widget'a son uygulanan metne (`text`) göredir.
+        """
+        first_index = "1.0" if first_line is None else f"{first_line}.0"
+        last_index = "end" if last_line is None else f"{last_line + 1}.0"
+        for token_type in self.highlighter.highlighting_rules:
+            text_widget.tag_remove(self.tag_name(token_type), first_index, last_index)
+
+        name = str(text_widget)
+        state = self._state(name)
+        if first_line is None:
+            self._applied[name] = (text, [])
+        elif state is not None and state[1]:
+            if text is None or state[0] is not text:
+                # Satırların hangi metne göre olduğu bilinmiyor; sonraki uygulama her şeyi yeniler
+                del self._applied[name]
+                return
+            line_index = self.highlighter.line_index(text)
+            head, _, tail = self._split_spans(
+                state[1], line_index.offset(first_line - 1, 0), line_index.offset(last_line, 0)
+            )
+            self._applied[name] = (text, head + tail)
+
+    def _state(self, name):
+        """Widget'ın (metin, aralıklar) durumu; sıkıştırılmışsa aralık listesine açılır"""
+        state = self._applied.get(name)
+        if state is not None and isinstance(state[1], array):
+            text = state[0]
+            state = self._applied[name] = (text, decode_spans(state[1], LineIndex(text).starts))
+        return state
+
+    def compact(self, text_widget):
+        """
+        Widget için hatırlanan aralıkları sıkıştırılmış ikili biçimde tut (ör. sekme
+        etkin değilken). Aralık başına yaklaşık 130 bayt (liste yuvası, demet ve
+        tamsayılar) yerine 16 bayt kalır; sonraki uygulama veya temizleme aralıkları
+        bir kez çözer.
+        """
+        name = str(text_widget)
+        state = self._applied.get(name)
+        if state is None or not state[1] or isinstance(state[1], array):
+            return
+        text, spans = state
+        codes = array('B', [token_type.value for _, _, token_type in spans])
+        starts = array('q', [span[0] for span in spans])
+        ends = array('q', [span[1] for span in spans])
+        self._applied[name] = (text, encode_spans(codes, starts, ends, LineIndex(text).starts))
+
+    def forget(self, text_widget):
+        """Widget için hatırlanan aralıkları bırak (ör. widget yok edildiğinde)"""
+        self._applied.pop(str(text_widget), None)
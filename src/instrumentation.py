@@ -0,0 +1,161 @@
+"""
+İsteğe bağlı aşama zamanlaması ve sayaçları.
+
+Ölçüm kapalıyken (varsayılan) `active` None'dır; ölçülen kod yalnızca bu değeri
+denetler. enable() ile açıldığında her aşama için süre, işlenen öğe sayısı (token,
+aralık, etiket), gecikme histogramı ve yüzdelikler (p50/p95/p99) tutulur.
+
+Kullanım (uygulamada SYNTAX_MIRROR_METRICS=dosya.jsonl ortam değişkeni de ölçümü
+açar ve dökümleri bu dosyaya yazar):
+    from src import instrumentation
+    metrics = instrumentation.enable(dump_path="olcumler.jsonl", dump_interval=10)
+    ...
+    print(metrics.snapshot())
+"""
+import json
+import threading
+import time
+from bisect import bisect_left
+from collections import deque
+
+# Etkin ölçüm nesnesi; None ise ölçüm kapalıdır
+active = None
+
+# Histogram kova üst sınırları (ms); son kova bunların üstündeki her şeyi sayar
+BUCKETS_MS = (0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000)
+
+
+class PhaseStats:
+    """Tek bir aşamanın sayaçları ve son örneklerin süreleri"""
+    __slots__ = ("count", "total", "items", "last", "samples", "buckets")
+
+    def __init__(self, window):
+        self.count = 0
+        self.total = 0.0
+        self.items = 0
+        self.last = 0.0
+        self.samples = deque(maxlen=window)
+        self.buckets = [0] * (len(BUCKETS_MS) + 1)
+
+    def add(self, seconds, items):
+        self.count += 1
+        self.total += seconds
+        self.items += items
+        self.last = seconds
+        self.samples.append(seconds)
+        self.buckets[bisect_left(BUCKETS_MS, seconds * 1000)] += 1
+
+    def percentile(self, fraction, ordered):
+        """Sıralı örneklerden verilen yüzdeliği (ms) döndür"""
+        if not ordered:
+            return 0.0
+        return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))] * 1000
+
+    def summary(self):
+        ordered = sorted(self.samples)
+        return {
+            "count": self.count,
+            "total_ms": self.total * 1000,
+            "mean_ms": self.total * 1000 / self.count if self.count else 0.0,
+            "last_ms": self.last * 1000,
+            "p50_ms": self.percentile(0.50, ordered),
+            "p95_ms": self.percentile(0.95, ordered),
+            "p99_ms": self.percentile(0.99, ordered),
+            "items": self.items,
+            "items_per_s": self.items / self.total if self.total else 0.0,
+            "histogram_ms": dict(zip([str(bound) for bound in BUCKETS_MS] + ["inf"], self.buckets)),
+        }
+
+
+class Instrumentation:
+    """
+    Aşama sürelerini ve sayaçlarını toplar. Birden çok iş parçacığından (UI ve analiz
+    işçisi) kaydedilebilir. dump_path verilirse en az dump_interval saniyede bir
+    anlık görüntü JSON satırı olarak dosyaya eklenir; bu periyodik dökümler kayıt
+    yapan iş parçacığını bekletmemek için ayrı bir iş parçacığında yazılır.
+    """
+    def __init__(self, window=1000, dump_path=None, dump_interval=10.0):
+        self.window = window
+        self.dump_path = dump_path
+        self.dump_interval = dump_interval
+        self.phases = {}
+        self._lock = threading.Lock()
+        self._last_dump = time.monotonic()
+        self._dump_lock = threading.Lock()  # Dosyaya eklemeleri sıralar
+        self._dump_thread = None
+
+    def record(self, phase, seconds, items=0):
+        """Bir aşama çalışmasının süresini (saniye) ve işlenen öğe sayısını kaydet"""
+        due = False
+        with self._lock:
+            stats = self.phases.get(phase)
+            if stats is None:
+                stats = self.phases[phase] = PhaseStats(self.window)
+            stats.add(seconds, items)
+            # Denetim ve güncelleme aynı kilit altında: aynı aralıkta yalnızca bir döküm başlar
+            if self.dump_path is not None:
+                now = time.monotonic()
+                if now - self._last_dump >= self.dump_interval:
+                    self._last_dump = now
+                    due = True
+        if due:
+            # Anlık görüntü ve dosya yazımı UI iş parçacığında yapılmaz
+            self._dump_thread = threading.Thread(
+                target=self._write, args=(self.dump_path, True), name="metrics-dump", daemon=True
+            )
+            self._dump_thread.start()
+
+    def snapshot(self):
+        """Aşama adı -> özet sözlüğü"""
+        with self._lock:
+            return {phase: stats.summary() for phase, stats in self.phases.items()}
+
+    def summary(self, phases=("lex", "lex_incremental", "tag", "cycle")):
+        """Durum çubuğu için kısa özet: her aşamanın son ve p95 süreleri"""
+        with self._lock:
+            parts = []
+            for phase in phases:
+                stats = self.phases.get(phase)
+                if stats is not None:
+                    ordered = sorted(stats.samples)
+                    parts.append(f"{phase} {stats.last * 1000:.1f}/{stats.percentile(0.95, ordered):.1f} ms")
+        return " ".join(parts)
+
+    def dump(self, path=None):
+        """Anlık görüntüyü bir JSON satırı olarak dosyaya ekle; süren periyodik dökümü bekle"""
+        with self._lock:
+            self._last_dump = time.monotonic()
+        thread = self._dump_thread
+        if thread is not None:
+            thread.join()
+        self._write(path or self.dump_path)
+
+    def _write(self, path, background=False):
+        line = json.dumps({"time": time.time(), "phases": self.snapshot()})
+        try:
+            with self._dump_lock, open(path, "a", encoding="utf-8") as file:
+                file.write(line + "\n")
+        except OSError:
+            # Arka plandaki döküm hatası ölçülen uygulamayı durdurmaz
+            if not background:
+                raise
+
+    def reset(self):
+        """Tüm aşama istatistiklerini sil"""
+        with self._lock:
+            self.phases.clear()
+
+
+def enable(window=1000, dump_path=None, dump_interval=10.0):
+    """Ölçümü aç ve etkin Instrumentation nesnesini döndür"""
+    global active
+    active = Instrumentation(window, dump_path, dump_interval)
+    return active
+
+
+def disable():
+    """Ölçümü kapat; bekleyen bir döküm yolu varsa son anlık görüntüyü yaz"""
+    global active
+    metrics, active = active, None
+    if metrics is not None and metrics.dump_path is not None:
+        metrics.dump()
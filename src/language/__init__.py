@@ -0,0 +1 @@
+# Language package initialization
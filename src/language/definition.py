@@ -0,0 +1,119 @@
+"""
+Dil tanımları.
+
+Bir dil; anahtar kelimeleri, token desenlerini, vurgulama stillerini ve
+dilbilgisi giriş noktalarını içeren bir JSON dosyasıyla tanımlanır. Yerleşik
+tanımlar `definitions/` dizinindedir; herhangi bir dosya yolu da verilebilir.
+
+Tanım alanları:
+    name          dil adı
+    extensions    dosya uzantıları (ör. [".sm"])
+    keywords      anahtar kelimeler; desenlerde {keywords} olarak kullanılır
+    token_specs   [[grup_adı, desen, token_türü], ...]; sıra önceliktir
+    quotes        dizi açan karakterler (kapanmamış dizi denemelerini bulmak için)
+    block_comment [açılış, kapanış] veya null
+    styles        token_türü -> {"foreground", "background", "font_style"}
+    grammar       statements: anahtar kelime -> kural (if, while, for, class, return),
+                  declarations: tanımlama başlatan tür anahtar kelimeleri,
+                  else: if kuralının else anahtar kelimesi
+
+Token türü adları lexer.TokenType üyeleridir (KEYWORD, STRING, ...).
+"""
+import json
+import os
+import re
+import threading
+
+DEFINITIONS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "definitions")
+DEFAULT_LANGUAGE = "default"
+
+# Tanımların kullanabileceği token türleri ve dilbilgisi kuralları
+TOKEN_TYPE_NAMES = ("KEYWORD", "OPERATOR", "IDENTIFIER", "NUMBER", "STRING", "COMMENT", "WHITESPACE", "ERROR")
+STATEMENT_RULES = ("if", "while", "for", "class", "return")
+
+# Yol -> yüklenmiş tanım; her süreçte bir tanım dosyası bir kez okunur
+_loaded = {}
+_lock = threading.Lock()
+
+
+class LanguageDefinition:
+    """Doğrulanmış bir dil tanımı"""
+    def __init__(self, data, path=None):
+        self.path = path
+        self.name = data["name"]
+        self.extensions = tuple(extension.lower() for extension in data.get("extensions", ()))
+        self.keywords = tuple(data.get("keywords", ()))
+        self.quotes = tuple(data.get("quotes", ()))
+        block_comment = data.get("block_comment")
+        self.block_comment = tuple(block_comment) if block_comment else None
+
+        keywords = "|".join(re.escape(keyword) for keyword in self.keywords)
+        self.token_specs = []
+        for name, pattern, type_name in data["token_specs"]:
+            self._check_type(type_name)
+            self.token_specs.append((name, pattern.replace("{keywords}", keywords), type_name))
+
+        self.styles = {}
+        for type_name, style in data.get("styles", {}).items():
+            self._check_type(type_name)
+            self.styles[type_name] = dict(style)
+
+        grammar = data.get("grammar", {})
+        self.statements = dict(grammar.get("statements", {}))
+        for keyword, rule in self.statements.items():
+            if rule not in STATEMENT_RULES:
+                raise ValueError(f"{self.name}: bilinmeyen dilbilgisi kuralı '{rule}' ({keyword})")
+        self.declarations = tuple(grammar.get("declarations", ()))
+        self.else_keyword = grammar.get("else")
+
+    def _check_type(self, type_name):
+        if type_name not in TOKEN_TYPE_NAMES:
+            raise ValueError(f"{self.name}: bilinmeyen token türü '{type_name}'")
+
+    def __repr__(self):
+        return f"LanguageDefinition({self.name!r}, {self.path!r})"
+
+
+def definition_path(name):
+    """Yerleşik bir dil adını tanım dosyasının yoluna çevir"""
+    return os.path.join(DEFINITIONS_DIR, f"{name}.json")
+
+
+def available_languages():
+    """Yerleşik dil adları"""
+    return sorted(name[:-5] for name in os.listdir(DEFINITIONS_DIR) if name.endswith(".json"))
+
+
+def load_language(language=None):
+    """
+    Dil tanımını yükle. `language` bir LanguageDefinition, yerleşik bir dil adı
+    veya bir JSON dosyası yolu olabilir; None varsayılan dildir.
+    """
+    if isinstance(language, LanguageDefinition):
+        return language
+    name = language or DEFAULT_LANGUAGE
+    path = name if os.path.isfile(name) else definition_path(name)
+    path = os.path.abspath(path)
+
+    with _lock:
+        definition = _loaded.get(path)
+        if definition is None:
+            try:
+                with open(path, "r", encoding="utf-8") as file:
+                    data = json.load(file)
+            except FileNotFoundError:
+                raise ValueError(
+                    f"Bilinmeyen dil: {name} (seçenekler: {', '.join(available_languages())})"
+                ) from None
+            definition = _loaded[path] = LanguageDefinition(data, path)
+    return definition
+
+
+def language_for_path(path, default=None):
+    """Dosya uzantısına göre yerleşik bir dil tanımı bul; bulunamazsa varsayılanı yükle"""
+    extension = os.path.splitext(path)[1].lower()
+    for name in available_languages():
+        definition = load_language(name)
+        if extension in definition.extensions:
+            return definition
+    return load_language(default)
@@ -0,0 +1,314 @@
+"""
+Token akışından parantez eşleri ve katlama aralıkları dizini.
+
+Tek karakterlik OPERATOR token'larından `(`, `)`, `[`, `]`, `{`, `}` tek bir
+yığın geçişiyle eşlenir. Parantezler konumlarına göre sıralı sütunlarda tutulur:
+
+    positions  karakter konumu
+    kinds      BRACKETS içindeki indeks (< 3 açılış, kapanış = açılış + 3)
+    partners   eş parantezin indeksi; eşsizse -1
+    parents    parantezi çevreleyen açık parantezin indeksi; en dıştaysa -1
+
+Bir kapanış, yığının tepesindeki açılış aynı türdense onunla eşlenir; değilse
+eşsiz kalır ve yığını değiştirmez. Eş araması indeksle O(1), konumdan parantez
+bulma ikili aramayla O(log n)'dir; imleç hareketlerinde metin yeniden taranmaz.
+Çok satırlı blok yorumlar da ayrı sütunlarda tutulur; katlama aralıkları çok
+satırlı `{ }` bloklarından ve bu yorumlardan oluşur.
+
+Düzenlemelerde yalnızca artımlı lexer'ın yeniden taradığı token aralığındaki
+parantezler yeniden okunur. Eşleme düzenlemeden önceki yığından yeniden
+başlatılır ve yeni yığın eski eşlemenin aynı noktadaki yığınına eşit olduğu anda
+durur; geri kalan eşler eski dizinden kaydırılarak kopyalanır.
+"""
+from array import array
+from bisect import bisect_left, bisect_right
+from itertools import compress
+
+from src.lexer.lexer import TokenType
+
+# Parantez karakterleri; tür kodu indekstir, kapanış kodu = açılış kodu + 3
+BRACKETS = "([{)]}"
+_OPENERS = 3
+_BRACE = BRACKETS.index("{")
+_KINDS = {char: kind for kind, char in enumerate(BRACKETS)}
+
+
+class BracketIndex:
+    """Bir metin sürümünün parantez eşleri, iç içelik ve çok satırlı yorum dizini"""
+    def __init__(self):
+        self.length = 0
+        self.positions = array('l')
+        self.kinds = array('B')
+        self.partners = array('l')
+        self.parents = array('l')
+
+        # Çok satırlı yorum token'larının başlangıç ve bitişleri
+        self.comment_starts = array('l')
+        self.comment_ends = array('l')
+
+    def __len__(self):
+        """Parantez sayısı"""
+        return len(self.positions)
+
+    def copy(self):
+        """Bağımsız olarak güncellenebilen bir kopya döndür"""
+        clone = BracketIndex()
+        clone.length = self.length
+        clone.positions, clone.kinds = self.positions[:], self.kinds[:]
+        clone.partners, clone.parents = self.partners[:], self.parents[:]
+        clone.comment_starts, clone.comment_ends = self.comment_starts[:], self.comment_ends[:]
+        return clone
+
+    # --- Oluşturma ve güncelleme ---
+
+    def build(self, text, types, starts, ends):
+        """Dizini sütunlu token verisinden (tür kodları, başlangıçlar, bitişler) baştan oluştur"""
+        self.length = len(text)
+        self.positions, self.kinds = self._scan_brackets(text, types, starts, ends, 0, len(types))
+        self.comment_starts, self.comment_ends = self._scan_comments(text, types, starts, ends, 0, len(types))
+        count = len(self.positions)
+        self.partners = array('l', [-1]) * count
+        self.parents = array('l', [-1]) * count
+        self._pair(0, [])
+
+    def update(self, text, types, starts, ends, first, new_stop, old_stop):
+        """
+        Artımlı lexer güncellemesinden sonra dizini güncelle: eski akıştaki
+        [first, old_stop) token'ları yeni akıştaki [first, new_stop) token'larıyla
+        değiştirilmiştir (IncrementalLexer.update dönüş değeri)
+        """
+        delta = len(text) - self.length
+        region_start = starts[first] if first < len(starts) else len(text)
+        region_end = starts[new_stop] if new_stop < len(starts) else len(text)
+        old_region_end = region_end - delta
+        self.length = len(text)
+
+        # Yeniden taranan bölgenin yorumları
+        comment_starts, comment_ends = self._scan_comments(text, types, starts, ends, first, new_stop)
+        head = bisect_left(self.comment_starts, region_start)
+        tail = bisect_left(self.comment_starts, old_region_end)
+        self.comment_starts = (self.comment_starts[:head] + comment_starts
+                               + self._shifted(self.comment_starts[tail:], delta))
+        self.comment_ends = (self.comment_ends[:head] + comment_ends
+                             + self._shifted(self.comment_ends[tail:], delta))
+
+        # Yeniden taranan bölgenin parantezleri eski dizideki [a, b) aralığının yerini alır
+        positions, kinds = self._scan_brackets(text, types, starts, ends, first, new_stop)
+        a = bisect_left(self.positions, region_start)
+        b = bisect_left(self.positions, old_region_end)
+        if not len(positions) and a == b:
+            if delta:
+                self.positions[a:] = self._shifted(self.positions[a:], delta)
+            return
+
+        # Düzenlemenin önündeki ve ardındaki yığınlar eski eşlemeden okunur
+        stack = self._stack_at(a)
+        old_stack = self._stack_at(b)
+        old_kinds, old_partners, old_parents = self.kinds, self.partners, self.parents
+        tail_start = a + len(positions)
+        shift = tail_start - b
+
+        self.positions = self.positions[:a] + positions + self._shifted(self.positions[b:], delta)
+        self.kinds = old_kinds[:a] + kinds + old_kinds[b:]
+        count = len(self.positions)
+        self.partners = old_partners[:a] + array('l', [-1]) * (count - a)
+        self.parents = old_parents[:a] + array('l', [-1]) * (count - a)
+        for opener in stack:
+            self.partners[opener] = -1
+
+        def mapped(index):
+            """Eski indeksi yeni indekse çevir; kaldırılan parantezler için -1"""
+            if index < a:
+                return index
+            return index + shift if index >= b else -1
+
+        # Eski yığındaki kaldırılmış parantezler hiçbir yeni indekse eşit olmasın
+        old_stack = [index if index < a else index + shift if index >= b else -2 - index
+                     for index in old_stack]
+        synced = self._pair(a, stack, tail_start, old_stack, old_kinds)
+        if synced is None:
+            return
+
+        # Eşlenmiş noktadan sonraki eşler ve iç içelik eski dizininkiyle aynıdır
+        partners, parents = self.partners, self.parents
+        for opener in stack:
+            partners[opener] = mapped(old_partners[opener if opener < a else opener - shift])
+        partners[synced:] = array('l', [
+            mapped(partner) if partner >= 0 else -1 for partner in old_partners[synced - shift:]
+        ])
+        parents[synced:] = array('l', [
+            mapped(parent) if parent >= 0 else -1 for parent in old_parents[synced - shift:]
+        ])
+
+    def _pair(self, index, stack, tail_start=None, old_stack=None, old_kinds=None):
+        """
+        `index` parantezinden başlayarak yığınla eşle; `stack` o noktadaki açık
+        parantezlerdir ve yerinde güncellenir. `old_stack` verilirse kuyruktaki
+        (tail_start ve sonrası) her parantezden önce eski eşlemenin yığınıyla
+        karşılaştırılır; eşit oldukları parantezin indeksini döndürür, değilse None.
+        """
+        kinds, partners, parents = self.kinds, self.partners, self.parents
+        count = len(kinds)
+        while index < count:
+            if old_stack is not None and index >= tail_start:
+                if stack == old_stack:
+                    return index
+                # Eski eşleme de aynı parantezi işler
+                kind = kinds[index]
+                if kind < _OPENERS:
+                    old_stack.append(index)
+                elif old_stack:
+                    top = old_stack[-1]
+                    top_kind = kinds[top] if top >= 0 else old_kinds[-2 - top]
+                    if top_kind == kind - _OPENERS:
+                        old_stack.pop()
+
+            kind = kinds[index]
+            parents[index] = stack[-1] if stack else -1
+            if kind < _OPENERS:
+                stack.append(index)
+            elif stack and kinds[stack[-1]] == kind - _OPENERS:
+                opener = stack.pop()
+                partners[opener] = index
+                partners[index] = opener
+            index += 1
+        return None
+
+    def _stack_at(self, index):
+        """`index` parantezinden hemen önceki açık parantezlerin (dıştan içe) indeksleri"""
+        if index <= 0:
+            return []
+        previous = index - 1
+        if self.kinds[previous] < _OPENERS:
+            top = previous
+        else:
+            partner = self.partners[previous]
+            top = self.parents[partner] if partner >= 0 else self.parents[previous]
+        stack = []
+        parents = self.parents
+        while top >= 0:
+            stack.append(top)
+            top = parents[top]
+        stack.reverse()
+        return stack
+
+    @staticmethod
+    def _shifted(values, delta):
+        """Konum dizisini delta kadar kaydır"""
+        return array('l', [value + delta for value in values]) if delta else values
+
+    @staticmethod
+    def _scan_brackets(text, types, starts, ends, first, stop):
+        """[first, stop) token'larındaki parantezlerin (konumlar, türler) dizilerini döndür"""
+        positions, kinds = array('l'), array('B')
+        operator = TokenType.OPERATOR.value
+        mask = [code == operator for code in types[first:stop]]
+        for start, end in zip(compress(starts[first:stop], mask), compress(ends[first:stop], mask)):
+            if end - start == 1:
+                kind = _KINDS.get(text[start])
+                if kind is not None:
+                    positions.append(start)
+                    kinds.append(kind)
+        return positions, kinds
+
+    @staticmethod
+    def _scan_comments(text, types, starts, ends, first, stop):
+        """[first, stop) token'larındaki çok satırlı yorumların (başlangıçlar, bitişler) dizilerini döndür"""
+        comment_starts, comment_ends = array('l'), array('l')
+        comment = TokenType.COMMENT.value
+        mask = [code == comment for code in types[first:stop]]
+        find = text.find
+        for start, end in zip(compress(starts[first:stop], mask), compress(ends[first:stop], mask)):
+            # Satır yorumu sondaki satır sonunu da içerir; yalnızca içerideki satır sonları sayılır
+            if find("\n", start, end - 1) != -1:
+                comment_starts.append(start)
+                comment_ends.append(end)
+        return comment_starts, comment_ends
+
+    # --- Sorgular ---
+
+    def bracket_at(self, position):
+        """Verilen karakter konumundaki parantezin indeksi; yoksa -1"""
+        index = bisect_left(self.positions, position)
+        if index < len(self.positions) and self.positions[index] == position:
+            return index
+        return -1
+
+    def partner(self, index):
+        """Parantezin eşinin indeksi (O(1)); eşsizse -1"""
+        return self.partners[index]
+
+    def match_at(self, position):
+        """
+        İmleç konumundaki eşleme: önce imleçten sonraki, sonra önceki karakter
+        denenir. (parantez konumu, eşinin konumu veya -1) döndürür; yoksa None.
+        """
+        for candidate in (position, position - 1):
+            index = self.bracket_at(candidate)
+            if index >= 0:
+                partner = self.partners[index]
+                return candidate, self.positions[partner] if partner >= 0 else -1
+        return None
+
+    def enclosing(self, position):
+        """Konumu çevreleyen açık parantezlerin indeksleri (dıştan içe)"""
+        return self._stack_at(bisect_left(self.positions, position))
+
+    def comment_at(self, position):
+        """Konumu içeren çok satırlı yorumun (başlangıç, bitiş) aralığı; yoksa None"""
+        index = bisect_right(self.comment_starts, position) - 1
+        if index >= 0 and position < self.comment_ends[index]:
+            return self.comment_starts[index], self.comment_ends[index]
+        return None
+
+    def _block_lines(self, index, line_index):
+        """`{` parantezinin bloğu birden çok satıra yayılıyorsa (ilk, son) satırları; değilse None"""
+        partner = self.partners[index]
+        if self.kinds[index] != _BRACE or partner < 0:
+            return None
+        first, last = line_index.line_of(self.positions[index]), line_index.line_of(self.positions[partner])
+        return (first, last) if last > first else None
+
+    def fold_ranges(self, line_index):
+        """
+        Katlama aralıklarını (ilk satır, son satır) olarak (0 tabanlı) ilk satıra
+        göre sıralı döndür: çok satırlı `{ }` blokları ve çok satırlı yorumlar
+        """
+        ranges = [
+            lines for lines in (
+                self._block_lines(index, line_index)
+                for index in compress(range(len(self.kinds)), [kind == _BRACE for kind in self.kinds])
+            ) if lines is not None
+        ]
+        ranges += [
+            (line_index.line_of(start), line_index.line_of(end - 1))
+            for start, end in zip(self.comment_starts, self.comment_ends)
+        ]
+        ranges.sort()
+        return ranges
+
+    def fold_at(self, position, line_index):
+        """
+        İmlecin satırı için katlanacak aralığı (ilk satır, son satır) döndür:
+        satırda açılan ilk çok satırlı blok, imleci içeren çok satırlı yorum ya da
+        imleci çevreleyen en içteki çok satırlı blok; hiçbiri yoksa None
+        """
+        line = line_index.line_of(position)
+        line_start = line_index.offset(line, 0)
+        line_end = line_index.offset(line + 1, 0)
+
+        # Satırda açılan bloklar
+        for index in range(bisect_left(self.positions, line_start), bisect_left(self.positions, line_end)):
+            lines = self._block_lines(index, line_index)
+            if lines is not None:
+                return lines
+
+        comment = self.comment_at(position)
+        if comment is not None:
+            return line_index.line_of(comment[0]), line_index.line_of(comment[1] - 1)
+
+        for index in reversed(self.enclosing(position)):
+            lines = self._block_lines(index, line_index)
+            if lines is not None:
+                return lines
+        return None
@@ -0,0 +1,298 @@
+from array import array
+from bisect import bisect_left, bisect_right
+from time import perf_counter
+from typing import List, Optional, Tuple
+
+from src import instrumentation
+from src.lexer.lexer import Lexer, TokenStream, TokenType
+from src.lexer.line_index import LineIndex
+
+
+class IncrementalLexer:
+    """
+    Önceki token akışını ve satır başına lexer durumu kontrol noktalarını saklayan
+    artımlı sözcüksel analizci. Bir düzenlemede yalnızca değişiklikten önceki en
+    yakın güvenli kontrol noktasından itibaren yeniden tarama yapar ve yeni token
+    akışı eskisiyle yeniden hizalandığında durur.
+    """
+    # Karşılaştırma sırasında bir seferde karşılaştırılan karakter sayısı
+    _DIFF_CHUNK = 4096
+
+    def __init__(self, lexer: Optional[Lexer] = None):
+        self.lexer = lexer or Lexer()
+        self.text = ""
+
+        # Sütunlu token verisi: tür kodları, başlangıç ve bitiş konumları
+        self._types = array('B')
+        self._starts = array('l')
+        self._ends = array('l')
+
+        # Sonuna kadar taranan (kapanmamış dizi veya blok yorum) token'ların başlangıçları
+        self._open_starts: List[int] = []
+
+        # Satır kontrol noktaları: satır başlangıcı, o konumu kapsayan token'ın
+        # indeksi ve satırın bir /* ... */ blok yorumu içinde başlayıp başlamadığı
+        self.lines = LineIndex()
+        self._line_tokens: List[int] = [0]
+        self._line_in_comment: List[bool] = [False]
+
+        # Son güncellemede yeniden taranan token sayısı
+        self.last_relexed = 0
+
+    def reset(self, text: str) -> Tuple[int, int, int]:
+        """Metni baştan tara ve tüm durumu yeniden oluştur"""
+        old_count = len(self._starts)
+        self.text = text
+        self._types, self._starts, self._ends = array('B'), array('l'), array('l')
+        self._open_starts = []
+        self._scan(text, 0, None, 0, self._types, self._starts, self._ends)
+        self._open_starts = self._collect_open(text, self._types, self._starts, self._ends)
+        self._rebuild_lines()
+        self.last_relexed = len(self._starts)
+        return 0, len(self._starts), old_count
+
+    def update(self, text: str, start: Optional[int] = None,
+               old_end: Optional[int] = None, new_end: Optional[int] = None) -> Tuple[int, int, int]:
+        """
+        Yeni metne göre token akışını güncelle.
+        Düzenleme aralığı (start, old_end, new_end) verilmezse eski ve yeni metin
+        karşılaştırılarak bulunur.
+        (ilk, yeni_bitiş, eski_bitiş) döndürür: eski akıştaki [ilk, eski_bitiş)
+        token'ları yeni akıştaki [ilk, yeni_bitiş) token'larıyla değiştirilmiştir.
+        """
+        if not self._starts and not self.text:
+            return self.reset(text)
+
+        metrics = instrumentation.active
+        if metrics is not None:
+            started = perf_counter()
+
+        if start is None or old_end is None or new_end is None:
+            edit = self.find_edit(self.text, text)
+            if edit is None:
+                self.last_relexed = 0
+                return 0, 0, 0
+            start, old_end, new_end = edit
+
+        delta = new_end - old_end
+
+        # Güncellenen bölgenin başlayacağı güvenli token'ı bul
+        restart_index = self._restart_index(start)
+        restart_pos = self._starts[restart_index] if restart_index < len(self._starts) else len(self.text)
+
+        types = array('B')
+        starts = array('l')
+        ends = array('l')
+        sync_index = self._scan(text, restart_pos, (new_end, delta), restart_index,
+                                types, starts, ends)
+
+        self.text = text
+        old_count = len(self._starts)
+        if sync_index is None:
+            sync_index = old_count
+
+        # Değişmeyen kuyruğu kaydır ve yeni token'ları yerleştir
+        tail_starts = array('l', [s + delta for s in self._starts[sync_index:]]) if delta else self._starts[sync_index:]
+        tail_ends = array('l', [e + delta for e in self._ends[sync_index:]]) if delta else self._ends[sync_index:]
+        self._types[restart_index:] = types + self._types[sync_index:]
+        self._starts[restart_index:] = starts + tail_starts
+        self._ends[restart_index:] = ends + tail_ends
+
+        # Açık token listesini güncelle
+        sync_pos = tail_starts[0] if tail_starts else len(text)
+        keep = bisect_left(self._open_starts, restart_pos)
+        old_sync = sync_pos - delta
+        tail_open = [s + delta for s in self._open_starts[bisect_left(self._open_starts, old_sync):]]
+        new_open = self._collect_open(text, types, starts, ends)
+        self._open_starts[keep:] = new_open + tail_open
+
+        self._update_lines(start, old_end, new_end, restart_pos, sync_pos,
+                           len(types) - (sync_index - restart_index))
+        self.last_relexed = len(types)
+        if metrics is not None:
+            metrics.record("lex_incremental", perf_counter() - started, len(types))
+        return restart_index, restart_index + len(types), sync_index
+
+    @property
+    def tokens(self) -> TokenStream:
+        """Güncel token akışı (bir sonraki güncellemeye kadar geçerlidir)"""
+        return TokenStream(self.text, self._types, self._starts, self._ends)
+
+    def columns(self) -> Tuple[array, array, array]:
+        """Token nesneleri oluşturmadan (tür kodları, başlangıçlar, bitişler) dizilerini döndür"""
+        return self._types, self._starts, self._ends
+
+    def checkpoint(self, line: int) -> Tuple[int, int, bool]:
+        """
+        Verilen satır (0 tabanlı) için güvenli yeniden başlama noktasını döndür:
+        (token başlangıç konumu, token indeksi, satır blok yorum içinde mi)
+        """
+        line = max(0, min(line, len(self.lines) - 1))
+        index = self._line_tokens[line]
+        pos = self._starts[index] if index < len(self._starts) else len(self.text)
+        return pos, index, self._line_in_comment[line]
+
+    def line_of(self, position: int) -> int:
+        """Karakter konumunu içeren satırın (0 tabanlı) numarasını döndür"""
+        return self.lines.line_of(position)
+
+    def token_index_at(self, position: int) -> int:
+        """Verilen konumu kapsayan token'ın indeksini döndür"""
+        return max(bisect_right(self._starts, position) - 1, 0)
+
+    @classmethod
+    def find_edit(cls, old: str, new: str) -> Optional[Tuple[int, int, int]]:
+        """İki metin arasındaki değişen aralığı (başlangıç, eski_bitiş, yeni_bitiş) bul"""
+        if old == new:
+            return None
+
+        chunk = cls._DIFF_CHUNK
+        limit = min(len(old), len(new))
+
+        # Ortak önek
+        prefix = 0
+        while prefix < limit and old[prefix:prefix + chunk] == new[prefix:prefix + chunk]:
+            prefix += chunk
+        prefix = min(prefix, limit)
+        end = min(prefix + chunk, limit)
+        while prefix < end and old[prefix] == new[prefix]:
+            prefix += 1
+
+        # Ortak sonek (önekle çakışmadan)
+        limit -= prefix
+        suffix = 0
+        old_len, new_len = len(old), len(new)
+        while suffix + chunk <= limit and old[old_len - suffix - chunk:old_len - suffix] == new[new_len - suffix - chunk:new_len - suffix]:
+            suffix += chunk
+        while suffix < limit and old[old_len - suffix - 1] == new[new_len - suffix - 1]:
+            suffix += 1
+
+        return prefix, old_len - suffix, new_len - suffix
+
+    def _restart_index(self, start: int) -> int:
+        """Düzenlemeden etkilenebilecek ilk token'ın indeksini bul"""
+        if not self._starts:
+            return 0
+
+        # Token'lar bitişlerinden en fazla iki karakter ileriye bakar
+        line = self.line_of(max(start - 2, 0))
+        index = self._line_tokens[line]
+
+        # Kapanmamış bir dizi veya blok yorum metnin sonuna kadar bakmıştır
+        if self._open_starts and self._open_starts[0] < start:
+            index = min(index, bisect_left(self._starts, self._open_starts[0]))
+
+        # Yeni bir hata aralığı önceki hata token'ıyla birleşebilir
+        if index > 0 and self._types[index - 1] == TokenType.ERROR.value:
+            index -= 1
+        return index
+
+    def _scan(self, text, position, sync, old_index, types, starts, ends):
+        """
+        Metni verilen konumdan itibaren tarayıp token'ları verilen listelere ekle.
+        `sync` verilmişse (yeni_bitiş, kayma), eski token akışıyla hizalanan
+        ilk eski token indeksini döndür.
+        """
+        old_starts = self._starts
+        group_to_code = self.lexer.group_to_code
+        error_code = TokenType.ERROR.value
+
+        def synced(pos):
+            if sync is None or pos <= sync[0]:
+                return None
+            old_pos = pos - sync[1]
+            i = bisect_left(old_starts, old_pos, old_index)
+            if i < len(old_starts) and old_starts[i] == old_pos:
+                return i
+            return None
+
+        for match in self.lexer.regex.finditer(text, position):
+            match_start = match.start()
+            if match_start > position:
+                found = synced(position)
+                if found is not None:
+                    return found
+                types.append(error_code)
+                starts.append(position)
+                ends.append(match_start)
+
+            found = synced(match_start)
+            if found is not None:
+                return found
+            types.append(group_to_code[match.lastgroup])
+            starts.append(match_start)
+            position = match.end()
+            ends.append(position)
+
+        if position < len(text):
+            found = synced(position)
+            if found is not None:
+                return found
+            types.append(error_code)
+            starts.append(position)
+            ends.append(len(text))
+        return None
+
+    def _collect_open(self, text, types, starts, ends) -> List[int]:
+        """Kapanmamış bir dizi veya blok yorum denemesiyle başlayan token'ları bul"""
+        quotes = self.lexer.quotes
+        comment_start = self.lexer.block_comment_start
+        open_starts = []
+        for token_type, start, end in zip(types, starts, ends):
+            if token_type == TokenType.ERROR.value:
+                segment = text[start:end]
+                if any(quote in segment for quote in quotes):
+                    open_starts.append(start)
+            elif (token_type == TokenType.OPERATOR.value and comment_start
+                    and text.startswith(comment_start, start)):
+                open_starts.append(start)
+        return open_starts
+
+    def _rebuild_lines(self):
+        """Satır kontrol noktalarını baştan oluştur"""
+        self.lines = LineIndex(self.text)
+        self._line_tokens, self._line_in_comment = self._line_checkpoints(self.lines.starts, 0)
+
+    def _line_checkpoints(self, line_starts, token_from):
+        """Verilen satır başlangıçları için kontrol noktalarını hesapla"""
+        starts, ends, types, text = self._starts, self._ends, self._types, self.text
+        comment_start = self.lexer.block_comment_start
+        line_tokens = []
+        in_comment = []
+        index = token_from
+        count = len(starts)
+        for line_start in line_starts:
+            while index + 1 < count and starts[index + 1] <= line_start:
+                index += 1
+            line_tokens.append(index)
+            in_comment.append(
+                index < count
+                and types[index] == TokenType.COMMENT.value
+                and starts[index] < line_start < ends[index]
+                and comment_start is not None
+                and text.startswith(comment_start, starts[index])
+            )
+        return line_tokens, in_comment
+
+    def _update_lines(self, start, old_end, new_end, restart_pos, sync_pos, token_delta):
+        """Bir düzenlemeden sonra satır kontrol noktalarını güncelle"""
+        _, tail_len = self.lines.update(self.text, start, old_end, new_end)
+        line_starts = self.lines.starts
+        old_tail_tokens = self._line_tokens[len(self._line_tokens) - tail_len:]
+        old_tail_comment = self._line_in_comment[len(self._line_in_comment) - tail_len:]
+
+        # Kontrol noktaları: yeniden taranan bölgedeki satırlar yeniden hesaplanır
+        first_dirty = bisect_left(line_starts, restart_pos)
+        first_clean = bisect_left(line_starts, sync_pos, first_dirty)
+        first_clean = max(first_clean, len(line_starts) - tail_len)
+        for_dirty = line_starts[first_dirty:first_clean]
+        token_from = self._line_tokens[first_dirty - 1] if first_dirty > 0 else 0
+        dirty_tokens, dirty_comment = self._line_checkpoints(for_dirty, token_from)
+
+        # Eşitlenme noktasından sonraki satırların yalnızca token indeksleri kayar
+        clean_count = len(line_starts) - first_clean
+        clean_tokens = [i + token_delta for i in old_tail_tokens[tail_len - clean_count:]] if clean_count else []
+        clean_comment = old_tail_comment[tail_len - clean_count:] if clean_count else []
+
+        self._line_tokens[first_dirty:] = dirty_tokens + clean_tokens
+        self._line_in_comment[first_dirty:] = dirty_comment + clean_comment
@@ -1,5 +1,11 @@
+import codecs
 import re
+from array import array
 from enum import Enum, auto
+from time import perf_counter
+
+from src import instrumentation
+from src.language.definition import load_language
 
 class TokenType(Enum):
     """Vurgulanacak farklı token türleri için Enum"""
@@ -11,6 +17,7 @@ class TokenType(Enum):
     COMMENT = auto()  # Yorum
     WHITESPACE = auto()  # Boşluk
     ERROR = auto()  # Hata
+    EOF = auto()  # Akış sonu (lexer üretmez; ayrıştırıcının nöbetçi token'ı)
 
 class Token:
     """Token bilgilerini saklamak için Token sınıfı"""
@@ -22,59 +29,242 @@ class Token:
     def __repr__(self):
         return f"Token({self.type}, '{self.value}', {self.position})"
 
+# Token türü kodundan (TokenType.value) token türüne eşleme
+TOKEN_TYPES = [None] * (max(token_type.value for token_type in TokenType) + 1)
+for _token_type in TokenType:
+    TOKEN_TYPES[_token_type.value] = _token_type
+del _token_type
+
+class TokenStream:
+    """
+    Sütunlu token akışı: tür kodları array('B'), başlangıç/bitiş konumları array('l')
+    içinde saklanır. Token değerleri yalnızca erişildiğinde kaynak metinden kesilir.
+    Yineleme ve indeksleme Token nesneleri döndürür.
+    """
+    __slots__ = ("text", "types", "starts", "ends")
+    
+    def __init__(self, text="", types=None, starts=None, ends=None):
+        self.text = text
+        self.types = types if types is not None else array('B')
+        self.starts = starts if starts is not None else array('l')
+        self.ends = ends if ends is not None else array('l')
+    
+    def append(self, token_type, start, end):
+        """Akışın sonuna bir token ekle"""
+        self.types.append(token_type.value)
+        self.starts.append(start)
+        self.ends.append(end)
+    
+    def __len__(self):
+        return len(self.starts)
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return TokenStream(self.text, self.types[index], self.starts[index], self.ends[index])
+        start, end = self.starts[index], self.ends[index]
+        return Token(TOKEN_TYPES[self.types[index]], self.text[start:end], (start, end))
+    
+    def __iter__(self):
+        text = self.text
+        for code, start, end in zip(self.types, self.starts, self.ends):
+            yield Token(TOKEN_TYPES[code], text[start:end], (start, end))
+    
+    def __repr__(self):
+        return f"TokenStream({len(self)} token)"
+    
+    def type_at(self, index):
+        """Verilen indeksteki token'ın türü"""
+        return TOKEN_TYPES[self.types[index]]
+    
+    def value_at(self, index):
+        """Verilen indeksteki token'ın değeri"""
+        return self.text[self.starts[index]:self.ends[index]]
+    
+    def spans(self):
+        """Token nesneleri oluşturmadan (başlangıç, bitiş, token_türü) üçlülerini üret"""
+        for code, start, end in zip(self.types, self.starts, self.ends):
+            yield start, end, TOKEN_TYPES[code]
+
 class Lexer:
-    """Düzenli ifadeler ve tablolar kullanan sözcüksel analizci uygulaması"""
-    def __init__(self):
+    """
+    Düzenli ifadeler ve tablolar kullanan sözcüksel analizci uygulaması.
+    Token desenleri dil tanımından (src.language) gelir; language verilmezse
+    varsayılan dil kullanılır.
+
+    Derlenmiş desen diske önbelleğe alınmaz: re modülü derlenmiş desenleri
+    serileştiremez ve derleme yaklaşık 0.5 ms sürer. Her süreç (toplu
+    vurgulayıcının işçileri dahil) dilini ilk kullanımda bir kez derler; dil
+    tanımı dosyası da süreç başına bir kez okunur.
+    """
+    def __init__(self, language=None):
+        self.language = load_language(language)
+        
         # Düzenli ifade desenleri ve token türleriyle token özelliklerini tanımla
         self.token_specs = [
-            ('COMMENT', r'//.*?(?:\n|$)|/\*[\s\S]*?\*/', TokenType.COMMENT),
-            ('KEYWORD', r'\b(if|else|while|for|return|int|float|string|void|class|function)\b', TokenType.KEYWORD),
-            ('STRING', r'"[^"]*"|\'[^\']*\'', TokenType.STRING),
-            ('NUMBER', r'\d+(\.\d+)?', TokenType.NUMBER),
-            ('OPERATOR', r'[+\-*/=<>!&|;,.(){}[\]]', TokenType.OPERATOR),
-            ('IDENTIFIER', r'[a-zA-Z_][a-zA-Z0-9_]*', TokenType.IDENTIFIER),
-            ('WHITESPACE', r'\s+', TokenType.WHITESPACE),
+            (name, pattern, TokenType[type_name]) for name, pattern, type_name in self.language.token_specs
         ]
         
+        # Sonraki metne bakan yapılar: kapanmamış dizi ve blok yorum denemeleri
+        self.quotes = self.language.quotes
+        self.block_comment_start = self.language.block_comment[0] if self.language.block_comment else None
+        
         # Düzenli ifade deseni oluştur
         self.regex_str = '|'.join(f'(?P<{name}>{pattern})' for name, pattern, _ in self.token_specs)
         self.regex = re.compile(self.regex_str)
         
-        # Grup adlarını token türlerine eşle
+        # Grup adlarını token türlerine ve tür kodlarına eşle
         self.group_to_type = {name: token_type for name, _, token_type in self.token_specs}
+        self.group_to_code = {name: token_type.value for name, _, token_type in self.token_specs}
         
     def tokenize(self, text):
-        """Giriş metnini token listesine dönüştür"""
-        tokens = []
+        """Giriş metnini sütunlu bir token akışına (TokenStream) dönüştür"""
+        metrics = instrumentation.active
+        if metrics is not None:
+            started = perf_counter()
+        
+        types = array('B')
+        starts = array('l')
+        ends = array('l')
+        add_type, add_start, add_end = types.append, starts.append, ends.append
+        group_to_code = self.group_to_code
+        error_code = TokenType.ERROR.value
         position = 0
         
         # Metindeki tüm eşleşmeleri bulmak için finditer kullan
         for match in self.regex.finditer(text):
+            start_pos, end_pos = match.span()
+            
             # Eğer mevcut konum ile eşleşme başlangıcı arasında boşluk varsa,
             # eşleşmeyen metin için bir hata token'i ekle
-            if match.start() > position:
-                error_text = text[position:match.start()]
-                tokens.append(Token(TokenType.ERROR, error_text, (position, match.start())))
+            if start_pos > position:
+                add_type(error_code)
+                add_start(position)
+                add_end(start_pos)
             
-            # Hangi token türünün eşleştiğini belirle
-            token_type = None
-            for group_name, group_value in match.groupdict().items():
-                if group_value is not None:
-                    token_type = self.group_to_type[group_name]
-                    break
-            
-            # Token oluştur
-            value = match.group(0)
-            start_pos = match.start()
-            end_pos = match.end()
-            tokens.append(Token(token_type, value, (start_pos, end_pos)))
+            # Eşleşen grup token türünü belirler
+            add_type(group_to_code[match.lastgroup])
+            add_start(start_pos)
+            add_end(end_pos)
             
             # Konumu güncelle
             position = end_pos
         
         # Eğer kalan metin varsa, hata token'i olarak ekle
         if position < len(text):
-            error_text = text[position:]
-            tokens.append(Token(TokenType.ERROR, error_text, (position, len(text))))
+            add_type(error_code)
+            add_start(position)
+            add_end(len(text))
+        
+        if metrics is not None:
+            metrics.record("lex", perf_counter() - started, len(types))
+        return TokenStream(text, types, starts, ends)
+
+    def tokenize_parallel(self, text, workers=None):
+        """
+        Büyük bir metni satır sonlarından parçalara bölüp süreç havuzunda token'lara
+        ayır (src.lexer.parallel); sonuç tokenize ile aynıdır. Küçük metinler seri taranır.
+        """
+        from src.lexer.parallel import tokenize_parallel
+        return tokenize_parallel(self, text, workers)
+
+    def iter_tokens(self, source, chunk_size=65536):
+        """
+        Metni, dosya nesnesini veya parça (chunk) yineleyicisini akış halinde
+        token'lara ayır. Parça sınırında kalan eksik lexeme'ler (kapanmamış dizi
+        veya blok yorum, bölünmüş sayı vb.) bir sonraki parçaya taşınır; bellek
+        kullanımı en büyük token ile sınırlıdır.
+        """
+        chunks = self._iter_chunks(source, chunk_size)
+        regex = self.regex
+        group_to_type = self.group_to_type
+        
+        buffer = ""   # Henüz token'a dönüştürülmemiş metin (önünde bir bağlam karakteriyle)
+        base = 0      # buffer[0]'ın mutlak konumu
+        position = 0  # buffer içindeki bir sonraki token'ın başlangıcı
+        want = chunk_size
+        eof = False
+        
+        while True:
+            # Taranmamış kısım istenen boyuta ulaşana kadar parça oku
+            pieces = [buffer]
+            pending = len(buffer) - position
+            while not eof and pending < want:
+                chunk = next(chunks, None)
+                if chunk is None:
+                    eof = True
+                else:
+                    pieces.append(chunk)
+                    pending += len(chunk)
+            buffer = "".join(pieces)
+            
+            # Sona iki karakterden daha yakın biten eşleşmeler daha fazla veriyle değişebilir
+            limit = len(buffer) - 2
+            emitted = False
+            complete = True
+            for match in regex.finditer(buffer, position):
+                start_pos, end_pos = match.span()
+                if not eof and end_pos > limit:
+                    complete = False
+                    break
+                
+                if start_pos > position:
+                    # Aralıktaki bir tırnak, kapanışını aramak için arabelleğin sonuna kadar taradı
+                    error_text = buffer[position:start_pos]
+                    if not eof and any(quote in error_text for quote in self.quotes):
+                        complete = False
+                        break
+                    yield Token(TokenType.ERROR, error_text, (base + position, base + start_pos))
+                    position = start_pos
+                    emitted = True
+                
+                # Kapanmamış bir blok yorum '/' operatörü olarak eşleşir
+                token_type = group_to_type[match.lastgroup]
+                if (not eof and self.block_comment_start and token_type == TokenType.OPERATOR
+                        and buffer.startswith(self.block_comment_start, start_pos)):
+                    complete = False
+                    break
+                
+                yield Token(token_type, match.group(), (base + start_pos, base + end_pos))
+                position = end_pos
+                emitted = True
+            
+            if eof and complete:
+                # Kalan metin hata token'i olarak eklenir
+                if position < len(buffer):
+                    yield Token(TokenType.ERROR, buffer[position:], (base + position, base + len(buffer)))
+                return
+            
+            # Tüketilen kısmı at; kelime sınırları için bir karakter bağlam tut
+            keep = max(position - 1, 0)
+            buffer = buffer[keep:]
+            base += keep
+            position -= keep
+            
+            # İlerleme yoksa tekrar taramanın karesel olmaması için okuma boyutunu ikiye katla
+            want = chunk_size if emitted else max(want, len(buffer)) * 2
+    
+    @staticmethod
+    def _iter_chunks(source, chunk_size):
+        """Metin, dosya nesnesi veya parça yineleyicisinden metin parçaları üret"""
+        if isinstance(source, str):
+            for start in range(0, len(source), chunk_size):
+                yield source[start:start + chunk_size]
+            return
+        
+        if hasattr(source, "read"):
+            read = source.read
+            source = iter(lambda: read(chunk_size), read(0))
         
-        return tokens 
\ No newline at end of file
+        # Bayt parçaları artımlı olarak UTF-8 çözülür
+        decoder = None
+        for chunk in source:
+            if isinstance(chunk, (bytes, bytearray, memoryview)):
+                if decoder is None:
+                    decoder = codecs.getincrementaldecoder("utf-8")()
+                chunk = decoder.decode(chunk)
+            if chunk:
+                yield chunk
+        if decoder is not None:
+            tail = decoder.decode(b"", final=True)
+            if tail:
+                yield tail
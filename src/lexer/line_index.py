@@ -0,0 +1,105 @@
+from bisect import bisect_right
+from typing import Iterable, List, Tuple
+
+
+class LineIndex:
+    """
+    Satır başlangıç konumlarının sıralı dizisi. Karakter konumunu (satır, sütun)
+    çiftine ikili arama ile O(log n) sürede dönüştürür. Satır ve sütunlar 0 tabanlıdır.
+    Tk Text widget'ında olduğu gibi yalnızca '\\n' satır sonudur; '\\r' sıradan bir
+    sütun olarak sayılır (dosyalar yüklenirken satır sonları '\\n'e çevrilir).
+    """
+    def __init__(self, text: str = ""):
+        self.starts: List[int] = [0] + self._scan(text, 0, len(text))
+        self.length = len(text)
+
+    @staticmethod
+    def _scan(text: str, start: int, end: int) -> List[int]:
+        """[start, end) aralığındaki yeni satır karakterlerinden sonraki konumları bul"""
+        starts = []
+        find = text.find
+        pos = find("\n", start, end)
+        while pos != -1:
+            starts.append(pos + 1)
+            pos = find("\n", pos + 1, end)
+        return starts
+
+    def copy(self) -> "LineIndex":
+        """Bağımsız olarak güncellenebilen bir kopya döndür"""
+        clone = LineIndex()
+        clone.starts = list(self.starts)
+        clone.length = self.length
+        return clone
+
+    def __len__(self) -> int:
+        """Satır sayısı"""
+        return len(self.starts)
+
+    def line_of(self, offset: int) -> int:
+        """Karakter konumunu içeren satırın numarasını döndür"""
+        return bisect_right(self.starts, offset) - 1
+
+    def line_col(self, offset: int) -> Tuple[int, int]:
+        """Karakter konumunu (satır, sütun) çiftine dönüştür"""
+        offset = max(0, min(offset, self.length))
+        line = bisect_right(self.starts, offset) - 1
+        return line, offset - self.starts[line]
+
+    def offset(self, line: int, col: int) -> int:
+        """(satır, sütun) çiftini karakter konumuna dönüştür"""
+        if line < 0:
+            return 0
+        if line >= len(self.starts):
+            return self.length
+        return min(self.starts[line] + col, self.length)
+
+    def line_cols(self, offsets: Iterable[int]) -> List[Tuple[int, int]]:
+        """Artan sıradaki konumları tek doğrusal geçişte (satır, sütun) çiftlerine dönüştür"""
+        starts = self.starts
+        last = len(starts) - 1
+        line = 0
+        result = []
+        for offset in offsets:
+            while line < last and starts[line + 1] <= offset:
+                line += 1
+            result.append((line, offset - starts[line]))
+        return result
+
+    def convert_spans(self, spans: Iterable[tuple]) -> List[Tuple[int, int, int, int]]:
+        """
+        Başlangıca göre sıralı, çakışmayan (başlangıç, bitiş, ...) aralıklarını tek
+        doğrusal geçişte (başlangıç_satırı, başlangıç_sütunu, bitiş_satırı, bitiş_sütunu)
+        dörtlülerine dönüştür
+        """
+        starts = self.starts
+        last = len(starts) - 1
+        line = 0
+        result = []
+        for span in spans:
+            start, end = span[0], span[1]
+            while line < last and starts[line + 1] <= start:
+                line += 1
+            start_line = line
+            while line < last and starts[line + 1] <= end:
+                line += 1
+            result.append((start_line, start - starts[start_line], line, end - starts[line]))
+        return result
+
+    def update(self, text: str, start: int, old_end: int, new_end: int) -> Tuple[int, int]:
+        """
+        [start, old_end) aralığının yeni metinde [start, new_end) ile değiştirildiği
+        bir düzenlemeden sonra dizini güncelle.
+        (ilk değişen satır, sondaki yalnızca kayan satır sayısı) döndürür.
+        """
+        starts = self.starts
+        delta = new_end - old_end
+
+        # Düzenlemeden önce başlayan satırlar aynı kalır, düzenlenen bölgedekiler
+        # yeniden hesaplanır, sonrakiler kayar
+        first_changed = bisect_right(starts, start)
+        first_tail = bisect_right(starts, old_end, first_changed)
+        middle = self._scan(text, start, new_end)
+        tail = [s + delta for s in starts[first_tail:]] if delta else starts[first_tail:]
+        starts[first_changed:] = middle + tail
+        self.length = len(text)
+        return first_changed, len(tail)
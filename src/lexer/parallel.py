@@ -0,0 +1,218 @@
+"""
+Büyük tek bir metnin süreç havuzunda paralel sözcüksel analizi.
+
+Metin satır sonlarından parçalara bölünür ve her parça bir işçi sürecinde
+taranır. Bir parçanın başında lexer'ın hangi durumda olduğu (olağan kod, bir
+blok yorumun ya da dizinin içi) ancak önceki parçalar taranınca bilinir; bu
+yüzden işçi parçayı her olası giriş durumu için tarar:
+
+    olağan durum   parçanın başından
+    yorum/dizi içi parçadaki ilk kapatıcıdan (ör. "*/", '"') sonra
+
+Kapatıcı girişli taramalar olağan taramayla aynı token sınırına geldiği anda
+durur; oradan sonra iki tarama aynıdır. Sonuçlar soldan sağa birleştirilir:
+önceki parçanın son token'ının bittiği konum, bu parçanın taramalarından
+hangisinin bir token sınırıysa o tarama seçilir. Düzenli ifade taraması
+yalnızca başladığı konuma bağlı olduğundan (işçiler metnin tamamını görür,
+bağlam iddiaları da doğru çalışır) seçilen tarama oradan sonra seri taramayla
+aynıdır. Hiçbir giriş durumu tutmazsa o konumdan seri taranır ve parçanın
+olağan taramasıyla eşitlenilen ilk token sınırında ona dönülür. Sonuç her
+durumda Lexer.tokenize ile aynıdır.
+
+Metin işçilere, mümkünse fork ile kopyalanmadan aktarılır; işçiler token
+sütunlarını mutlak konumlarla döndürür. İşçiler lexer'ı dil tanımının kendisinden
+kurar; bellekte oluşturulmuş (dosyası olmayan) tanımlar da aynı sonucu verir.
+"""
+import os
+from array import array
+from bisect import bisect_left
+from time import perf_counter
+
+from src import instrumentation
+from src.lexer.lexer import Lexer, TokenStream, TokenType
+
+# Bu boyuttan küçük parçalar oluşturulmaz; daha kısa metinler seri taranır
+MIN_CHUNK_CHARS = 1 << 20
+
+# İşçi başına parça sayısı (yük dengesi için)
+CHUNKS_PER_WORKER = 2
+
+# İşçi sürecindeki lexer ve taranan metin
+_worker = None
+
+
+def _init_worker(text, language):
+    """Her işçi süreci için lexer'ı dil tanımından (LanguageDefinition) bir kez oluştur ve metni sakla"""
+    global _worker
+    _worker = (Lexer(language=language), text)
+
+
+def split_points(text, count, min_chunk=MIN_CHUNK_CHARS):
+    """
+    Metni en fazla `count` parçaya bölen, satır sonlarından hemen sonraki
+    sınırları döndür: [0, ..., len(text)]
+    """
+    length = len(text)
+    count = max(1, min(count, length // max(min_chunk, 1)))
+    bounds = [0]
+    for part in range(1, count):
+        newline = text.find("\n", max(length * part // count, bounds[-1]))
+        if newline == -1:
+            break
+        if newline + 1 < length and newline + 1 > bounds[-1]:
+            bounds.append(newline + 1)
+    bounds.append(length)
+    return bounds
+
+
+def entry_closers(lexer):
+    """Satır sonlarını aşabilen yapıların kapatıcıları: blok yorum sonu ve tırnaklar"""
+    closers = list(lexer.quotes)
+    block_comment = lexer.language.block_comment
+    if block_comment:
+        closers.append(block_comment[1])
+    return closers
+
+
+def _scan(lexer, text, position, stop, sync=None):
+    """
+    `position` konumundan başlayarak `stop` konumundan önce başlayan token'ları
+    tara; son token `stop`tan sonra bitebilir. `sync` (artan başlangıç konumları)
+    verilirse, bir sonraki token bu konumlardan birinde başladığında durulur.
+    (türler, başlangıçlar, bitişler, eşitlenme indeksi veya None) döndürür.
+    """
+    types, starts, ends = array('B'), array('l'), array('l')
+    add_type, add_start, add_end = types.append, starts.append, ends.append
+    group_to_code = lexer.group_to_code
+    error_code = TokenType.ERROR.value
+    length = len(text)
+
+    def synced(pos):
+        if sync is None:
+            return None
+        index = bisect_left(sync, pos)
+        return index if index < len(sync) and sync[index] == pos else None
+
+    found = synced(position)
+    if found is not None or position >= stop:
+        return types, starts, ends, found
+
+    for match in lexer.regex.finditer(text, position):
+        match_start = match.start()
+        if match_start > position:
+            # Eşleşmeyen metin hata token'ı olur
+            add_type(error_code)
+            add_start(position)
+            add_end(match_start)
+            position = match_start
+            found = synced(position)
+            if found is not None or position >= stop:
+                return types, starts, ends, found
+
+        add_type(group_to_code[match.lastgroup])
+        add_start(match_start)
+        position = match.end()
+        add_end(position)
+        found = synced(position)
+        if found is not None or position >= stop:
+            return types, starts, ends, found
+
+    if position < length:
+        add_type(error_code)
+        add_start(position)
+        add_end(length)
+    return types, starts, ends, None
+
+
+def lex_chunk(start, stop):
+    """
+    İşçide bir parçayı her giriş durumu için tara. Olağan taramayı ve kapatıcı
+    girişli taramaların olağan taramayla eşitlenene kadarki önek kısımlarını
+    döndürür: (olağan, [(türler, başlangıçlar, bitişler, eşitlenme indeksi), ...])
+    """
+    lexer, text = _worker
+    normal = _scan(lexer, text, start, stop)[:3]
+    normal_starts = normal[1]
+
+    entries = []
+    for closer in entry_closers(lexer):
+        found = text.find(closer, start, stop)
+        if found == -1:
+            continue
+        entry = found + len(closer)
+        run = _scan(lexer, text, entry, stop, normal_starts)
+        if len(run[1]) or run[3] is None:
+            entries.append(run)
+    return normal, entries
+
+
+def _stitch(lexer, text, bounds, results):
+    """Parça sonuçlarını soldan sağa seri taramayla aynı tek bir akışta birleştir"""
+    types, starts, ends = array('B'), array('l'), array('l')
+
+    def take(run, index):
+        # Aynı türden diziler kopyalanmadan tek seferde eklenir
+        for column, run_column in zip((types, starts, ends), run[:3]):
+            column.frombytes(memoryview(run_column).cast('B')[index * run_column.itemsize:])
+
+    position = 0
+    for chunk, (normal, entries) in enumerate(results):
+        stop = bounds[chunk + 1]
+        if position >= stop:
+            # Önceki bir token (ör. uzun bir blok yorum) bu parçayı tümüyle kapsıyor
+            continue
+
+        normal_starts = normal[1]
+        runs = [(run, run[3]) for run in entries] + [(normal, None)]
+        for run, sync_index in runs:
+            index = bisect_left(run[1], position)
+            if index < len(run[1]) and run[1][index] == position:
+                take(run, index)
+                if sync_index is not None:
+                    take(normal, sync_index)
+                break
+        else:
+            # Hiçbir giriş durumu tutmadı: olağan taramayla eşitlenene kadar seri tara
+            run = _scan(lexer, text, position, stop, normal_starts)
+            take(run, 0)
+            if run[3] is not None:
+                take(normal, run[3])
+
+        if len(ends):
+            position = ends[-1]
+    return TokenStream(text, types, starts, ends)
+
+
+def _pool(workers, text, language):
+    """Metni işçilere mümkünse fork ile (kopyalamadan) aktaran bir süreç havuzu oluştur"""
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+
+    context = None
+    if "fork" in multiprocessing.get_all_start_methods():
+        context = multiprocessing.get_context("fork")
+    return ProcessPoolExecutor(max_workers=workers, mp_context=context,
+                               initializer=_init_worker, initargs=(text, language))
+
+
+def tokenize_parallel(lexer, text, workers=None, min_chunk=MIN_CHUNK_CHARS):
+    """
+    Metni süreç havuzunda paralel olarak token'lara ayır; sonuç
+    lexer.tokenize(text) ile aynıdır. Metin tek parçaya sığıyorsa seri taranır.
+    """
+    workers = workers or os.cpu_count() or 1
+    bounds = split_points(text, workers * CHUNKS_PER_WORKER, min_chunk)
+    if len(bounds) <= 2 or workers == 1:
+        return lexer.tokenize(text)
+
+    metrics = instrumentation.active
+    if metrics is not None:
+        started = perf_counter()
+
+    with _pool(workers, text, lexer.language) as executor:
+        results = list(executor.map(lex_chunk, bounds[:-1], bounds[1:]))
+    tokens = _stitch(lexer, text, bounds, results)
+
+    if metrics is not None:
+        metrics.record("lex_parallel", perf_counter() - started, len(tokens))
+    return tokens
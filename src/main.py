@@ -1,6 +1,8 @@
+import os
 import tkinter as tk
 import traceback
 import sys
+from src import instrumentation
 from src.gui.editor import SyntaxHighlighterGUI
 
 def main():
@@ -11,19 +13,25 @@ def main():
     try:
         print("Syntax Mirror başlatılıyor...")
         
+        # Ortam değişkeni verilmişse aşama ölçümlerini aç ve JSON satırları olarak döküm al
+        metrics_path = os.environ.get("SYNTAX_MIRROR_METRICS")
+        if metrics_path:
+            instrumentation.enable(dump_path=metrics_path)
+        
         # Create main window
         root = tk.Tk()
         
         # Set window icon and title
         root.title("Syntax Mirror")
         
-        # Uygulamayı oluştur ve başlat
-        app = SyntaxHighlighterGUI(root)
+        # Uygulamayı oluştur ve başlat; dil SYNTAX_MIRROR_LANGUAGE ile seçilebilir
+        app = SyntaxHighlighterGUI(root, language=os.environ.get("SYNTAX_MIRROR_LANGUAGE"))
         
         print("Uygulama başarıyla başlatıldı!")
         
         # Ana döngüyü başlat
         root.mainloop()
+        instrumentation.disable()
     except Exception as e:
         print(f"Uygulama başlatılırken hata oluştu: {e}")
         traceback.print_exc()
@@ -0,0 +1,228 @@
+from bisect import bisect_left
+from typing import List, Optional, Tuple
+
+from src.parser.parser import ASTNode, ParseError, Parser
+
+
+class IncrementalParser:
+    """
+    Önceki AST'yi, üst düzey ifadelerin token aralıklarıyla birlikte saklayan
+    artımlı ayrıştırıcı. Bir düzenlemeden sonra yalnızca değişen token aralığıyla
+    çakışan ifadeleri yeniden ayrıştırır; değişmeyen alt ağaçları (aynı nesneler
+    olarak) yeni ağaca geri takar.
+
+    Yeniden ayrıştırılan ifadelerin içinde de (ör. tek bir sınıfın veya fonksiyonun
+    gövdesi) ayrıştırıcı, ileri bakışı dahil değişiklikle çakışmayan eski bir iç
+    ifadenin başlangıcına geldiğinde onu ayrıştırmadan geri takar. Böylece büyük bir
+    bloktaki düzenleme yalnızca değişikliği içeren ifade zincirini yeniden ayrıştırır.
+    """
+    def __init__(self, language=None):
+        self.parser = Parser(language=language)
+        self.root: Optional[ASTNode] = None
+
+        # Son ayrıştırmada yeniden ayrıştırılan üst düzey ifade ve ayrıştırılmadan
+        # geri takılan (iç içe veya üst düzey) ifade sayıları
+        self.last_reparsed = 0
+        self.last_reused = 0
+
+    def parse(self, tokens, changed: Optional[Tuple[int, int, int]] = None) -> Tuple[ASTNode, List[str]]:
+        """
+        Token akışını ayrıştır. `changed`, IncrementalLexer.update'in döndürdüğü
+        (ilk, yeni_bitiş, eski_bitiş) token aralığıdır; verilmezse ve önceki bir
+        ağaç varsa, eski ve yeni akış karşılaştırılarak bulunur (bu durumda yerinde
+        güncellenen bir akış değil, yeni bir akış verilmelidir).
+        """
+        if self.root is None:
+            return self._parse_all(tokens)
+        if changed is None:
+            changed = self.find_changed(self.parser.tokens, tokens)
+
+        first, new_stop, old_stop = changed
+        delta = new_stop - old_stop
+        old = self.root.children
+        old_starts = [statement.token_range[0] for statement in old]
+
+        # Ayrıştırması (ileri bakış dahil) değişiklikten önce biten ifadeler olduğu
+        # gibi kalır; sonraki token'a bakan son ifade (ör. 'else' denetimi) yeniden ayrıştırılır
+        keep = 0
+        while keep < len(old) and old[keep].lookahead <= first:
+            keep += 1
+
+        parser = self.parser
+        parser.set_tokens(tokens)
+        parser.current_token_index = old[keep - 1].token_range[1] if keep else 0
+        self.last_reused = 0
+        parser.reusable = self._reuser(tokens, old, old_starts, keep, changed)
+
+        children = old[:keep]
+        reparsed = 0
+        while True:
+            position = parser.current_token_index
+
+            # Değişiklikten sonra eski bir ifadenin başlangıcına denk gelindiyse kalan
+            # ifadelerin baktığı token'lar değişmemiştir; aralıklarını ve hata konumlarını
+            # kaydırıp geri tak
+            if position >= new_stop:
+                index = bisect_left(old_starts, position - delta, keep)
+                if index < len(old) and old_starts[index] == position - delta:
+                    for statement in old[index:]:
+                        self._shift(statement, delta, tokens)
+                        children.append(statement)
+                    break
+
+            statement = parser.next_statement()
+            if statement is None:
+                break
+            children.append(statement)
+            reparsed += 1
+
+        parser.reusable = None  # Eski ağaca başvuru tutulmaz
+        self.root = ASTNode("Program", children)
+        self.last_reparsed = reparsed
+        return self.root, self.errors
+
+    def _reuser(self, tokens, old, old_starts, keep, changed):
+        """
+        Ayrıştırıcının ifade başlangıçlarında çağırdığı geri takma işlevini oluştur.
+        Adaylar, değişikliği içeren eski üst düzey ifadelerin değişiklikten önce
+        (ileri bakışı dahil) biten veya değişiklikten sonra başlayan iç ifadeleri ile
+        değişiklikten sonra başlayan eski üst düzey ifadelerdir. Bir ifadenin
+        ayrıştırması yalnızca başlangıcı ile ileri bakışı arasındaki token'lara
+        bağlıdır; aynı token'lar aynı konumda aynı sonucu verir.
+        """
+        first, new_stop, old_stop = changed
+        delta = new_stop - old_stop
+
+        # Yeni başlangıç indeksi -> (ifade, eski başlangıç, uzunluk, eski üst düzey ifade, ilk hata, hata sayısı)
+        candidates = {}
+        for top in old[keep:bisect_left(old_starts, old_stop, keep)]:
+            stack = [(top, top.token_range[0], 0)]
+            while stack:
+                node, base, error_base = stack.pop()
+                for child in node.children:
+                    span = child.span
+                    if span is None:
+                        # Bloklar ve ifade düğümleri iç ifadeleri üst ifadeye göre tutar
+                        stack.append((child, base, error_base))
+                        continue
+                    start = base + span[0]
+                    if span[1] <= span[0]:
+                        # Token tüketmeyen ifadelerde (ör. dosya sonundaki hata) bitiş önceki
+                        # ifadenin bitişidir; geri takılmaz, yeniden ayrıştırılması ucuzdur
+                        continue
+                    if base + span[2] <= first or start >= old_stop:
+                        entry = (child, start, span[1] - span[0], top, error_base + span[3], span[4])
+                        candidates[start if start < first else start + delta] = entry
+                    else:
+                        stack.append((child, start, error_base + span[3]))
+
+        def reuse(parser):
+            position = parser.current_token_index
+            entry = candidates.get(position)
+            if entry is None:
+                if position < new_stop:
+                    return None
+                index = bisect_left(old_starts, position - delta, keep)
+                if index == len(old) or old_starts[index] != position - delta:
+                    return None
+                top = old[index]
+                entry = (top, old_starts[index], top.token_range[1] - old_starts[index], top, 0, len(top.errors))
+
+            node, old_start, length, top, error_first, error_count = entry
+            top_start = top.token_range[0]
+            for error in top.errors[error_first:error_first + error_count]:
+                index = position + top_start + error.offset - old_start
+                parser.errors.append(self._moved(error, index, tokens))
+            parser.current_token_index = position + length
+            self.last_reused += 1
+            return node
+
+        return reuse
+
+    @staticmethod
+    def _shift(statement, delta, tokens):
+        """
+        Geri takılan ifadenin token aralığını kaydır. Token indeksi değişmese de
+        düzenleme karakter konumlarını kaydırmış olabilir; hatalar yeni konumlarıyla yeniden oluşturulur.
+        """
+        start, end = statement.token_range
+        statement.token_range = (start + delta, end + delta)
+        statement.lookahead += delta
+        if not statement.errors:
+            return
+
+        statement.errors = [IncrementalParser._moved(error, start + delta + error.offset, tokens)
+                            for error in statement.errors]
+
+    @staticmethod
+    def _moved(error, index, tokens):
+        """Hatanın, yeni akışta verilen token indeksine taşınmış kopyası"""
+        count = len(tokens)
+        if index < count:
+            position = tokens[index].position
+        else:
+            end = tokens[count - 1].position[1] if count else 0
+            position = (end, end)
+        moved = ParseError(f"{error.message} (konum {position[0]})")
+        moved.message = error.message
+        moved.position = position
+        moved.token_index = index
+        moved.offset = error.offset
+        return moved
+
+    def reset(self):
+        """Önceki ağacı unut; bir sonraki ayrıştırma baştan yapılır"""
+        self.root = None
+
+    @property
+    def errors(self) -> List[str]:
+        """Ağaçtaki tüm ifadelerin ayrıştırma hataları"""
+        if self.root is None:
+            return []
+        return [error for statement in self.root.children for error in statement.errors]
+
+    def error_spans(self) -> List[Tuple[int, int, str]]:
+        """
+        Ağaçtaki hataların son ayrıştırılan token akışındaki (başlangıç, bitiş, ileti)
+        konumları. Geri takılan ifadelerin hataları kaydırılmış token aralığından bulunur.
+        """
+        if self.root is None:
+            return []
+        tokens = self.parser.tokens
+        count = len(tokens)
+        end = tokens[count - 1].position[1] if count else 0
+        spans = []
+        for statement in self.root.children:
+            first = statement.token_range[0]
+            for error in statement.errors:
+                index = first + error.offset
+                start, stop = tokens[index].position if index < count else (end, end)
+                spans.append((start, stop, error.message))
+        return spans
+
+    def _parse_all(self, tokens):
+        """Tüm token akışını baştan ayrıştır"""
+        self.parser.set_tokens(tokens)
+        self.root, _ = self.parser.parse()
+        self.last_reparsed = len(self.root.children)
+        return self.root, self.errors
+
+    @staticmethod
+    def find_changed(old_tokens, new_tokens) -> Tuple[int, int, int]:
+        """İki token akışı arasındaki değişen aralığı (ilk, yeni_bitiş, eski_bitiş) bul"""
+        old_count, new_count = len(old_tokens), len(new_tokens)
+        limit = min(old_count, new_count)
+
+        def same(old_index, new_index):
+            old_token, new_token = old_tokens[old_index], new_tokens[new_index]
+            return old_token.type == new_token.type and old_token.value == new_token.value
+
+        first = 0
+        while first < limit and same(first, first) and old_tokens[first].position == new_tokens[first].position:
+            first += 1
+
+        suffix = 0
+        while suffix < limit - first and same(old_count - suffix - 1, new_count - suffix - 1):
+            suffix += 1
+
+        return first, new_count - suffix, old_count - suffix
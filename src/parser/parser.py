@@ -1,387 +1,607 @@
 from typing import List, Tuple, Optional
+from src.language.definition import load_language
 from src.lexer.lexer import Token, TokenType
 
+# İkili operatörler: operatör -> (öncelik, sağdan birleşmeli mi)
+BINARY_OPERATORS = {
+    "=": (1, True),
+    "||": (2, False),
+    "&&": (3, False),
+    "==": (4, False), "!=": (4, False),
+    "<": (5, False), ">": (5, False), "<=": (5, False), ">=": (5, False),
+    "+": (6, False), "-": (6, False),
+    "*": (7, False), "/": (7, False),
+}
+
+# Önek operatörleri ikili operatörlerin hepsinden sıkı bağlanır
+PREFIX_OPERATORS = {"-", "+", "!", "++", "--"}
+PREFIX_PRECEDENCE = 8
+
+# Sonek operatörleri
+POSTFIX_OPERATORS = {"++", "--"}
+
+# Lexer tek karakterlik operatör üretir; bitişik iki operatör bu çiftlerden biriyse birleştirilir
+COMPOUND_OPERATORS = {"==", "!=", "<=", ">=", "&&", "||", "++", "--"}
+
+# Ayrıştırıcının atladığı token türleri
+TRIVIA = (TokenType.WHITESPACE, TokenType.COMMENT)
+_TRIVIA_CODES = tuple(token_type.value for token_type in TRIVIA)
+
+# İfade motorunun operatör yığınındaki girdi türleri
+_BINARY, _PREFIX, _GROUP, _CALL, _LIST, _INDEX = range(6)
+
+# Açılış operatörü ve operatör konumunda mı (True) yoksa işlenen konumunda mı görüldüğü
+# -> (yığın girdisi türü, kapanış operatörü)
+_OPENERS = {
+    ("(", False): (_GROUP, ")"),
+    ("[", False): (_LIST, "]"),
+    ("(", True): (_CALL, ")"),
+    ("[", True): (_INDEX, "]"),
+}
+
+class ParseError(str):
+    """
+    Bir sözdizimi hatası. Metin olarak "ileti, token bulundu (konum N)" biçimindedir;
+    `message` konumsuz ileti, `position` hatalı token'ın (başlangıç, bitiş) konumu,
+    `offset` ise token'ın üst düzey ifadenin ilk token'ına göre indeksidir. Artımlı
+    ayrıştırmada kaydırılan ifadelerin hata konumları `offset` ile yeniden bulunur.
+    """
+    message = ""
+    position = (0, 0)
+    token_index = 0
+    offset = 0
+
+
 class ASTNode:
     """Soyut Sözdizimi Ağacı (AST) düğümleri için temel sınıf"""
-    def __init__(self, node_type, children=None):
+    def __init__(self, node_type, children=None, value=None):
         self.type = node_type
         self.children = children or []
-    
+        self.value = value  # Operatör, tanımlayıcı adı veya literal değeri
+        self.token_range = None  # Üst düzey ifadeler için (ilk, son+1) token indeksleri
+        self.lookahead = None  # Üst düzey ifadeler için ayrıştırmanın baktığı son token indeksi+1
+        self.errors = []  # Bu ifadeyi ayrıştırırken oluşan hatalar
+        # İç ifadeler için üst ifadeye göre (başlangıç, bitiş, ileri bakış) token ve
+        # (ilk hata, hata sayısı) hata göreli konumları
+        self.span = None
+
     def add_child(self, child):
         self.children.append(child)
-    
+
     def __str__(self):
-        return f"{self.type}({', '.join(str(child) for child in self.children)})"
+        # Derin ağaçlar özyineleme sınırına takılmasın diye açık yığınla sonradan sıralı dolaşılır
+        done = []  # Tamamlanan alt ağaçların metinleri
+        stack = [(self, False)]
+        while stack:
+            node, expanded = stack.pop()
+            if not expanded:
+                stack.append((node, True))
+                stack.extend((child, False) for child in reversed(node.children))
+                continue
+            parts = [] if node.value is None else [str(node.value)]
+            if node.children:
+                count = len(node.children)
+                parts.extend(done[-count:])
+                del done[-count:]
+            done.append(f"{node.type}({', '.join(parts)})")
+        return done[0]
 
 class Parser:
-    """Yukarıdan aşağıya özyinelemeli iniş ayrıştırıcı uygulaması"""
-    def __init__(self, tokens=None):
-        self.tokens = tokens or []
-        self.current_token_index = 0
-        self.errors = []
-    
+    """
+    Yukarıdan aşağıya iniş ayrıştırıcı uygulaması. İfadeler, açık bir operatör
+    yığını kullanan tablo güdümlü tek döngülü bir öncelik motoruyla, cümleler ise
+    bekleyen kuralların açık bir yığınıyla ayrıştırılır; iç içe geçme derinliği
+    özyineleme sınırına takılmaz.
+    Cümle başlatan anahtar kelimeler dil tanımının dilbilgisinden gelir.
+    """
+    def __init__(self, tokens=None, language=None):
+        self.language = grammar = load_language(language)
+
+        # Anahtar kelime -> cümle kuralı; tür anahtar kelimeleri tanımlama başlatır
+        rules = {
+            "if": self.parse_if_statement,
+            "while": self.parse_while_statement,
+            "for": self.parse_for_statement,
+            "class": self.parse_class,
+            "return": self.parse_return_statement,
+        }
+        self.statement_rules = {keyword: rules[rule] for keyword, rule in grammar.statements.items()}
+        for keyword in grammar.declarations:
+            self.statement_rules[keyword] = self.parse_declaration
+        self.else_keyword = grammar.else_keyword
+
+        self.set_tokens(tokens if tokens is not None else [])
+
     def set_tokens(self, tokens):
         """Ayrıştırılacak token'ları ayarla"""
         self.tokens = tokens
-        self.current_token_index = 0
         self.errors = []
-    
+
+        # Akış sonunu temsil eden nöbetçi token
+        end = tokens[len(tokens) - 1].position[1] if len(tokens) else 0
+        self._eof = Token(TokenType.EOF, "", (end, end))
+        self._codes = getattr(tokens, "types", None)
+        self._previous = None
+        self.current_token_index = 0
+
+        # Artımlı ayrıştırıcının verdiği, mevcut konumda başlayan değişmemiş bir ifadeyi
+        # geri takıp döndüren (yoksa None) işlev
+        self.reusable = None
+
+    @property
+    def current_token_index(self):
+        """Mevcut (boşluk veya yorum olmayan) token'ın ham akıştaki indeksi"""
+        return self._index
+
+    @current_token_index.setter
+    def current_token_index(self, index):
+        self._end = index
+        self._seek(index)
+
+    def _seek(self, index):
+        """Verilen indeksten itibaren ilk anlamlı token'a konumlan; boşluk ve yorumlar tek geçişte atlanır"""
+        tokens = self.tokens
+        count = len(tokens)
+        codes = self._codes
+        if codes is not None:
+            # Sütunlu akışta atlanan token'lar için Token nesnesi oluşturulmaz
+            while index < count and codes[index] in _TRIVIA_CODES:
+                index += 1
+        else:
+            while index < count and tokens[index].type in TRIVIA:
+                index += 1
+        self._index = index
+        self._current = tokens[index] if index < count else self._eof
+
     def peek(self):
-        """Tüketmeden mevcut token'a bak"""
-        if self.current_token_index < len(self.tokens):
-            return self.tokens[self.current_token_index]
-        return None
-    
+        """Tüketmeden mevcut token'a bak; akış bittiyse EOF token'ı döner"""
+        return self._current
+
     def consume(self):
-        """Mevcut token'ı tüket ve bir sonrakine ilerle"""
-        if self.current_token_index < len(self.tokens):
-            token = self.tokens[self.current_token_index]
-            self.current_token_index += 1
-            return token
-        return None
-    
+        """Mevcut token'ı tüket ve bir sonrakine ilerle; EOF tüketilmez"""
+        token = self._current
+        if token is not self._eof:
+            self._previous = token
+            self._end = self._index + 1
+            self._seek(self._end)
+        return token
+
     def match(self, token_type):
         """Mevcut token'in beklenen türe uyup uymadığını kontrol et ve tüket"""
-        if self.peek() and self.peek().type == token_type:
+        if self._current.type == token_type:
             return self.consume()
         return None
-    
+
+    def match_operator(self, value):
+        """Mevcut token verilen operatörse tüket"""
+        token = self._current
+        if token.type == TokenType.OPERATOR and token.value == value:
+            return self.consume()
+        return None
+
+    def check_operator(self, value):
+        """Mevcut token verilen operatör mü?"""
+        token = self._current
+        return token.type == TokenType.OPERATOR and token.value == value
+
     def expect(self, token_type, error_message):
         """Belirli bir türde token bekle, bulunamazsa hata oluştur"""
         token = self.match(token_type)
         if not token:
-            self.errors.append(error_message)
+            self.error(error_message)
         return token
-    
+
+    def expect_operator(self, value):
+        """Belirli bir operatörü bekle, bulunamazsa hata oluştur"""
+        token = self.match_operator(value)
+        if not token:
+            self.error(f"'{value}' bekleniyor")
+        return token
+
+    def error(self, message, token=None):
+        """Konum bilgisiyle bir sözdizimi hatası kaydet"""
+        token = token or self._current
+        found = "dosya sonu" if token.type == TokenType.EOF else f"'{token.value}'"
+        error = ParseError(f"{message}, {found} bulundu (konum {token.position[0]})")
+        error.message = f"{message}, {found} bulundu"
+        error.position = token.position
+        error.token_index = self._index
+        self.errors.append(error)
+
+    def synchronize(self):
+        """
+        Hatadan sonra bir eşitleme noktasına kadar token'ları atla: ';' tüketilir,
+        '}' çevreleyen bloğa bırakılır. Böylece tek bir hatalı token hata zinciri oluşturmaz.
+        """
+        while self._current is not self._eof:
+            if self.match_operator(";"):
+                return
+            if self.check_operator("}"):
+                return
+            self.consume()
+
     def parse(self) -> Tuple[ASTNode, List[str]]:
         """Token'ları soyut sözdizimi ağacına ayrıştır"""
-        # Bu, yalnızca token dizisini doğrulayan basitleştirilmiş bir ayrıştırıcıdır
-        # Gerçek bir ayrıştırıcı için, dilbilgisindeki her bir terminal olmayan için
-        # üretim kurallarını uygulayan yöntemleriniz olurdu
-        
-        # Basit bir dil için örnek dilbilgisi kuralları şu şekilde olabilir:
+        # Dilbilgisi:
         # program -> ifade*
-        # ifade -> ifade_cümlesi | tanımlama | if_cümlesi | while_cümlesi
+        # ifade -> blok | if_cümlesi | while_cümlesi | for_cümlesi | return_cümlesi
+        #          | sınıf | tanımlama | ifade_cümlesi | ';'
         # ifade_cümlesi -> ifade ';'
-        # tanımlama -> tür tanımlayıcı ('=' ifade)? ';'
-        # vb.
-        
+        # tanımlama -> tür ('[' ']')? ifade (blok | ';')
+
         root = ASTNode("Program")
-        
-        while self.peek() and self.peek().type != TokenType.ERROR:
-            # Boşlukları veya yorumları atla
-            while self.peek() and self.peek().type in (TokenType.WHITESPACE, TokenType.COMMENT):
-                self.consume()
-            
-            # Başka token kalmadıysa veya sadece boşluk/yorum kaldıysa, işimiz bitti
-            if not self.peek() or self.peek().type == TokenType.ERROR:
+
+        while True:
+            statement = self.next_statement()
+            if statement is None:
                 break
-            
-            # Bir ifadeyi ayrıştır (bu basitleştirilmiş bir örnektir)
-            statement = self.parse_statement()
-            if statement:
-                root.add_child(statement)
-        
+            root.add_child(statement)
+
         return root, self.errors
-    
-    def parse_statement(self) -> Optional[ASTNode]:
-        """Dilbilgisine göre bir ifadeyi ayrıştır"""
-        # Bu basitleştirilmiş bir sürümdür - gerçek bir ayrıştırıcıda 
-        # her ifade türü için özel yöntemler olurdu
-        
-        token = self.peek()
-        
-        if not token:
+
+    def next_statement(self) -> Optional[ASTNode]:
+        """
+        Bir sonraki üst düzey ifadeyi ayrıştır ve token aralığını kaydet.
+        Başka token kalmadıysa None döndür.
+        """
+        # Boşluk ve yorumlar konumlanırken zaten atlanmıştır
+        if self._current is self._eof:
             return None
-            
-        # İlk token'a dayalı olarak ifade türlerinin basit tanımlanması
+
+        start = self._index
+        errors_before = len(self.errors)
+        statement = self.parse_statement()
+        statement.token_range = (start, self._end)
+        # Ayrıştırma sonraki anlamlı token'a (ör. 'else' denetimi) ve operatör
+        # birleştirmede ondan sonraki ham token'a da bakmış olabilir
+        statement.lookahead = self._index + 2
+        statement.errors = self.errors[errors_before:]
+        for error in statement.errors:
+            error.offset = error.token_index - start
+        return statement
+
+    def parse_statement(self) -> ASTNode:
+        """
+        Dilbilgisine göre bir ifadeyi ayrıştır. İç içe ifade içeren kurallar (blok,
+        if, while, for, sınıf, tanımlama) üreteçtir: iç ifade gerektiğinde `yield`
+        eder ve ayrıştırılan ifadeyi geri alır. Bekleyen kurallar özyineleme yerine
+        bir yığında tutulur. Her iç ifadenin konumu üst ifadesine göre `span` olarak
+        kaydedilir; artımlı ayrıştırıcı değişmeyen iç ifadeleri bununla geri takar.
+        """
+        pending = []  # (kural üreteci, başlangıç indeksi, başlangıçtaki hata sayısı)
+        start, errors_before = self._index, len(self.errors)
+        node = self._begin_statement()
+        while True:
+            if isinstance(node, ASTNode):
+                if not pending:
+                    return node
+                rule, parent_start, parent_errors = pending[-1]
+                node.span = (start - parent_start, self._end - parent_start, self._index + 2 - parent_start,
+                             errors_before - parent_errors, len(self.errors) - errors_before)
+                value = node
+            else:
+                pending.append((node, start, errors_before))
+                rule, value = node, None
+            try:
+                rule.send(value)
+                start, errors_before = self._index, len(self.errors)
+                node = self._begin_statement()
+            except StopIteration as stop:
+                _, start, errors_before = pending.pop()
+                node = stop.value
+
+    def _begin_statement(self):
+        """Mevcut konumdaki ifadeyi geri tak ya da ayrıştırmaya başla"""
+        if self.reusable is not None:
+            node = self.reusable(self)
+            if node is not None:
+                return node
+        return self._start_statement()
+
+    def _start_statement(self):
+        """Bir ifadeye başla: tamamlanan bir düğüm ya da iç ifade bekleyen bir kural üreteci döndür"""
+        token = self._current
+
+        # İlk token'a dayalı olarak ifade türlerinin tanımlanması
         if token.type == TokenType.KEYWORD:
-            if token.value == "if":
-                return self.parse_if_statement()
-            elif token.value == "while":
-                return self.parse_while_statement()
-            elif token.value in ("int", "float", "string", "void"):
-                return self.parse_declaration()
-            elif token.value == "return":
-                return self.parse_return_statement()
-        
+            rule = self.statement_rules.get(token.value)
+            if rule is not None:
+                return rule()
+        elif token.type == TokenType.OPERATOR:
+            if token.value == "{":
+                return self.parse_block()
+            elif token.value == ";":
+                self.consume()
+                return ASTNode("EmptyStatement")
+            elif token.value == "}":
+                self.error("Beklenmeyen blok sonu")
+                self.consume()
+                return ASTNode("Error")
+
         # Varsayılan olarak ifade cümlesi
         return self.parse_expression_statement()
-    
-    def parse_if_statement(self) -> ASTNode:
-        """Bir if ifadesini ayrıştır"""
-        # Basitleştirilmiş uygulama
+
+    def parse_block(self):
+        """'{' ifade* '}'"""
+        self.consume()  # '{' token'ını tüket
+        node = ASTNode("Block")
+        while self._current is not self._eof and not self.check_operator("}"):
+            node.add_child((yield))
+        self.expect_operator("}")
+        return node
+
+    def parse_if_statement(self):
+        """'if' ifade ifade ('else' ifade)?"""
         self.consume()  # 'if' token'ını tüket
-        node = ASTNode("IfStatement")
+        condition = self.expression()
+        node = ASTNode("IfStatement", [condition, (yield)])
+        token = self._current
+        if token.type == TokenType.KEYWORD and token.value == self.else_keyword:
+            self.consume()
+            node.add_child((yield))
         return node
-    
-    def parse_while_statement(self) -> ASTNode:
-        """Bir while ifadesini ayrıştır"""
-        # Basitleştirilmiş uygulama
+
+    def parse_while_statement(self):
+        """'while' ifade ifade"""
         self.consume()  # 'while' token'ını tüket
-        node = ASTNode("WhileStatement")
+        condition = self.expression()
+        return ASTNode("WhileStatement", [condition, (yield)])
+
+    def parse_for_statement(self):
+        """'for' '(' ifade ifade? ';' ifade? ')' ifade"""
+        self.consume()  # 'for' token'ını tüket
+        node = ASTNode("ForStatement")
+        if not self.expect_operator("("):
+            self.synchronize()
+            return node
+
+        # Başlangıç bir tanımlama veya ifade cümlesidir ve ';' işaretini kendisi tüketir
+        node.add_child((yield))
+        node.add_child(ASTNode("EmptyExpression") if self.check_operator(";") else self.expression())
+        self.expect_operator(";")
+        node.add_child(ASTNode("EmptyExpression") if self.check_operator(")") else self.expression())
+        self.expect_operator(")")
+        node.add_child((yield))
+        return node
+
+    def parse_class(self):
+        """'class' tanımlayıcı blok"""
+        self.consume()  # 'class' token'ını tüket
+        name = self.expect(TokenType.IDENTIFIER, "Sınıf adı bekleniyor")
+        node = ASTNode("Class", value=name.value if name else None)
+        if self.check_operator("{"):
+            return self._with_block(node)
+        self.expect_operator("{")
+        self.synchronize()
         return node
-        
-    def parse_declaration(self) -> ASTNode:
+
+    def parse_declaration(self):
         """Bir değişken veya fonksiyon tanımlamasını ayrıştır"""
-        # Basitleştirilmiş uygulama
         type_token = self.consume()
-        node = ASTNode("Declaration", [type_token.value])
+        node = ASTNode("Declaration", value=type_token.value)
+
+        # Dizi türü: int[]
+        if self.match_operator("["):
+            self.expect_operator("]")
+            node.value += "[]"
+
+        errors_before = len(self.errors)
+        node.add_child(self.expression())
+
+        # Fonksiyon gövdesi veya tanımlamanın sonu
+        if self.check_operator("{"):
+            return self._with_block(node)
+        self.end_statement(errors_before)
         return node
-    
+
+    def _with_block(self, node):
+        """Düğüme '{' ile başlayan bir blok gövdesi ekleyen kural üreteci"""
+        node.add_child((yield from self.parse_block()))
+        return node
+
     def parse_return_statement(self) -> ASTNode:
-        """Bir return ifadesini ayrıştır"""
-        # Basitleştirilmiş uygulama
+        """'return' ifade? ';'"""
         self.consume()  # 'return' token'ını tüket
         node = ASTNode("ReturnStatement")
+        errors_before = len(self.errors)
+        if not self.check_operator(";"):
+            node.add_child(self.expression())
+        self.end_statement(errors_before)
         return node
-    
+
     def parse_expression_statement(self) -> ASTNode:
-        """Bir ifade cümlesini ayrıştır"""
-        # Basitleştirilmiş uygulama
-        # Gerçek bir ayrıştırıcıda, bu işlem operatör önceliğine göre ifadeleri ayrıştırmayı
-        # ve uygun bir ifade ağacı oluşturmayı içerirdi
-        
-        # Basitlik için, sadece noktalı virgül bulana kadar token'ları tüketeceğiz
-        node = ASTNode("ExpressionStatement")
+        """ifade ';'"""
+        errors_before = len(self.errors)
+        node = ASTNode("ExpressionStatement", [self.expression()])
+        self.end_statement(errors_before)
         return node
 
+    def end_statement(self, errors_before):
+        """
+        İfadeyi sonlandıran ';' işaretini tüket. Bulunamazsa, ifadede daha önce hata
+        bildirilmediyse hata kaydet ve eşitleme noktasına atla.
+        """
+        if self.match_operator(";"):
+            return
+        if len(self.errors) == errors_before:
+            self.error("';' bekleniyor")
+        self.synchronize()
+
+    def _operator(self):
+        """Mevcut operatörü, bitişik bir sonraki token'la birleşik operatör oluşturuyorsa birleştirerek döndür"""
+        token = self._current
+        index = self._index + 1
+        if index < len(self.tokens):
+            following = self.tokens[index]
+            if (following.type == TokenType.OPERATOR
+                    and token.value + following.value in COMPOUND_OPERATORS):
+                return token.value + following.value, 2
+        return token.value, 1
+
+    def _advance(self, count):
+        """count adet operatör token'ını tüket"""
+        for _ in range(count):
+            self.consume()
+
+    def expression(self) -> ASTNode:
+        """
+        Bir ifadeyi tablo güdümlü öncelik tırmanmasıyla tek döngüde ayrıştır.
+        İşlenenler ve operatörler açık yığınlarda tutulur; parantezler, çağrılar ve
+        dizi literalleri yığına işaretçi olarak konur.
+        """
+        errors_before = len(self.errors)
+        operands = []
+        operators = []  # (tür, operatör veya kapanış, öncelik, işlenen yığını tabanı)
+        expect_operand = True
+
+        def reduce():
+            kind, operator, _, _ = operators.pop()
+            if kind == _PREFIX:
+                operands.append(ASTNode("Unary", [operands.pop()], operator))
+                return
+            right = operands.pop()
+            left = operands.pop()
+            if operator == "=":
+                operands.append(ASTNode("Assignment", [left, right]))
+            else:
+                operands.append(ASTNode("Binary", [left, right], operator))
+
+        def reduce_to_marker():
+            while operators and operators[-1][0] <= _PREFIX:
+                reduce()
+
+        def close():
+            kind, _, _, base = operators.pop()
+            if kind == _GROUP:
+                return
+            items = operands[base:]
+            del operands[base:]
+            if kind == _LIST:
+                operands.append(ASTNode("Array", items))
+            elif kind == _CALL:
+                operands.append(ASTNode("Call", [operands.pop()] + items))
+            else:
+                operands.append(ASTNode("Index", [operands.pop()] + items))
+
+        while True:
+            token = self._current
+            token_type = token.type
+
+            if expect_operand:
+                if token_type in (TokenType.IDENTIFIER, TokenType.NUMBER, TokenType.STRING):
+                    operands.append(ASTNode(token_type.name.capitalize(), value=token.value))
+                    self.consume()
+                    expect_operand = False
+                    continue
+
+                if token_type == TokenType.OPERATOR:
+                    operator, width = self._operator()
+                    if operator in PREFIX_OPERATORS:
+                        operators.append((_PREFIX, operator, PREFIX_PRECEDENCE, 0))
+                        self._advance(width)
+                        continue
+                    opener = _OPENERS.get((operator, False))
+                    if opener is not None:
+                        operators.append((opener[0], opener[1], 0, len(operands)))
+                        self.consume()
+                        continue
+
+                    # Boş çağrı veya dizi: f(), []
+                    if (operators and operators[-1][0] in (_CALL, _LIST)
+                            and operators[-1][1] == operator and operators[-1][3] == len(operands)):
+                        self.consume()
+                        close()
+                        expect_operand = False
+                        continue
+
+                self.error("İfade bekleniyor" if token_type != TokenType.ERROR else "Tanınmayan token")
+                operands.append(ASTNode("Error"))
+                break
+
+            # Operatör konumu: işlenenden sonra yalnızca operatörler ifadeyi sürdürür
+            if token_type != TokenType.OPERATOR:
+                break
+            operator, width = self._operator()
+
+            binary = BINARY_OPERATORS.get(operator)
+            if binary is not None:
+                precedence, right_associative = binary
+                while operators and operators[-1][0] <= _PREFIX and (
+                        operators[-1][2] > precedence
+                        or (operators[-1][2] == precedence and not right_associative)):
+                    reduce()
+                operators.append((_BINARY, operator, precedence, 0))
+                self._advance(width)
+                expect_operand = True
+                continue
+
+            if operator in POSTFIX_OPERATORS:
+                operands.append(ASTNode("Postfix", [operands.pop()], operator))
+                self._advance(width)
+                continue
+
+            opener = _OPENERS.get((operator, True))
+            if opener is not None:
+                # Çağrı ve indeksleme en sıkı bağlanır; sol işlenen yığının tepesindedir
+                operators.append((opener[0], opener[1], 0, len(operands)))
+                self.consume()
+                expect_operand = True
+                continue
+
+            if operator == ".":
+                self.consume()
+                name = self.expect(TokenType.IDENTIFIER, "Üye adı bekleniyor")
+                if name is None:
+                    break
+                operands.append(ASTNode("Member", [operands.pop()], name.value))
+                continue
+
+            if operator == ",":
+                reduce_to_marker()
+                if operators and operators[-1][0] in (_CALL, _LIST):
+                    self.consume()
+                    expect_operand = True
+                    continue
+                break
+
+            if operator in (")", "]"):
+                reduce_to_marker()
+                if operators and operators[-1][1] == operator:
+                    self.consume()
+                    close()
+                    continue
+                if operators:
+                    self.error(f"'{operators[-1][1]}' bekleniyor")
+                break
+
+            # Diğer operatörler (';', '{', '}' ...) ifadeyi sonlandırır
+            break
+
+        # Kalan operatörleri indirge; kapanmamış işaretçiler, ifadede başka hata
+        # bildirilmediyse bir kez hata olarak bildirilir
+        while operators:
+            if operators[-1][0] <= _PREFIX:
+                reduce()
+                continue
+            if len(self.errors) == errors_before:
+                self.error(f"'{operators[-1][1]}' bekleniyor")
+            close()
+
+        return operands[-1] if operands else ASTNode("Error")
+
     def program(self) -> ASTNode:
         """Program -> İfade*"""
-        statements = []
-        while not self.is_at_end():
-            statements.append(self.statement())
-        return ASTNode("Program", children=statements)
-    
-    def statement(self) -> ASTNode:
-        """Parse a statement"""
-        if self.match(TokenType.KEYWORD):
-            return self.keyword_statement()
-        return self.expression()
-    
-    def keyword_statement(self) -> ASTNode:
-        """Parse a keyword statement (if, while, etc.)"""
-        keyword = self.previous()
-        if keyword.value == "if":
-            return self.if_statement()
-        elif keyword.value in ("while", "for"):
-            return self.loop_statement()
-        elif keyword.value == "def":
-            return self.function_definition()
-        elif keyword.value == "class":
-            return self.class_definition()
-        elif keyword.value == "return":
-            return self.return_statement()
-        else:
-            return self.expression()
-    
-    def function_definition(self) -> ASTNode:
-        """Parse a function definition"""
-        # Consume 'def' keyword
-        self.consume()
-        
-        # Get function name
-        name = self.consume()
-        
-        # Parse parameters
-        self.consume()  # '('
-        parameters = []
-        if not self.check(TokenType.OPERATOR) or self.peek().value != ")":
-            parameters.append(self.parameter())
-            while self.match(TokenType.OPERATOR) and self.previous().value == ",":
-                parameters.append(self.parameter())
-        self.consume()  # ')'
-        
-        # Parse function body
-        self.consume()  # ':'
-        body = []
-        while not self.is_at_end() and not self.check(TokenType.KEYWORD):
-            body.append(self.statement())
-        
-        return ASTNode("Function", children=[
-            ASTNode("Parameters", children=parameters),
-            ASTNode("Body", children=body)
-        ])
-    
-    def parameter(self) -> ASTNode:
-        """Parse a function parameter"""
-        name = self.consume()
-        return ASTNode("Parameter", name.value)
-    
-    def if_statement(self) -> ASTNode:
-        """Parse an if statement"""
-        # Consume 'if' keyword
-        self.consume()
-        
-        # Parse condition
-        condition = self.expression()
-        
-        # Parse body
-        self.consume()  # ':'
-        body = []
-        while not self.is_at_end() and not self.check(TokenType.KEYWORD):
-            body.append(self.statement())
-        
-        return ASTNode("If", children=[
-            ASTNode("Condition", children=[condition]),
-            ASTNode("Body", children=body)
-        ])
-    
-    def loop_statement(self) -> ASTNode:
-        """Parse a while or for loop"""
-        keyword = self.previous()
-        
-        if keyword.value == "while":
-            # Parse while loop
-            condition = self.expression()
-            self.consume()  # ':'
-            body = []
-            while not self.is_at_end() and not self.check(TokenType.KEYWORD):
-                body.append(self.statement())
-            return ASTNode("While", children=[
-                ASTNode("Condition", children=[condition]),
-                ASTNode("Body", children=body)
-            ])
-        else:
-            # Parse for loop
-            target = self.consume()
-            self.consume()  # 'in'
-            iterable = self.expression()
-            self.consume()  # ':'
-            body = []
-            while not self.is_at_end() and not self.check(TokenType.KEYWORD):
-                body.append(self.statement())
-            return ASTNode("For", children=[
-                ASTNode("Target", target.value),
-                ASTNode("Iterable", children=[iterable]),
-                ASTNode("Body", children=body)
-            ])
-    
-    def class_definition(self) -> ASTNode:
-        """Parse a class definition"""
-        # Consume 'class' keyword
-        self.consume()
-        
-        # Get class name
-        name = self.consume()
-        
-        # Parse class body
-        self.consume()  # ':'
-        body = []
-        while not self.is_at_end() and not self.check(TokenType.KEYWORD):
-            body.append(self.statement())
-        
-        return ASTNode("Class", name.value, body)
-    
-    def return_statement(self) -> ASTNode:
-        """Parse a return statement"""
-        # Consume 'return' keyword
-        self.consume()
-        
-        # Parse return value
-        value = self.expression()
-        return ASTNode("Return", children=[value])
-    
-    def expression(self) -> ASTNode:
-        """Parse an expression"""
-        return self.assignment()
-    
-    def assignment(self) -> ASTNode:
-        """Parse an assignment expression"""
-        expr = self.equality()
-        
-        if self.match(TokenType.OPERATOR) and self.previous().value == "=":
-            value = self.assignment()
-            return ASTNode("Assignment", children=[expr, value])
-        
-        return expr
-    
-    def equality(self) -> ASTNode:
-        """Parse equality expressions"""
-        expr = self.comparison()
-        
-        while self.match(TokenType.OPERATOR) and self.previous().value in ("==", "!="):
-            operator = self.previous().value
-            right = self.comparison()
-            expr = ASTNode("Binary", operator, [expr, right])
-        
-        return expr
-    
-    def comparison(self) -> ASTNode:
-        """Parse comparison expressions"""
-        expr = self.term()
-        
-        while self.match(TokenType.OPERATOR) and self.previous().value in ("<", ">", "<=", ">="):
-            operator = self.previous().value
-            right = self.term()
-            expr = ASTNode("Binary", operator, [expr, right])
-        
-        return expr
-    
-    def term(self) -> ASTNode:
-        """Parse addition/subtraction"""
-        expr = self.factor()
-        
-        while self.match(TokenType.OPERATOR) and self.previous().value in ("+", "-"):
-            operator = self.previous().value
-            right = self.factor()
-            expr = ASTNode("Binary", operator, [expr, right])
-        
-        return expr
-    
-    def factor(self) -> ASTNode:
-        """Parse multiplication/division"""
-        expr = self.unary()
-        
-        while self.match(TokenType.OPERATOR) and self.previous().value in ("*", "/"):
-            operator = self.previous().value
-            right = self.unary()
-            expr = ASTNode("Binary", operator, [expr, right])
-        
-        return expr
-    
-    def unary(self) -> ASTNode:
-        """Parse unary expressions"""
-        if self.match(TokenType.OPERATOR) and self.previous().value in ("-", "not"):
-            operator = self.previous().value
-            right = self.unary()
-            return ASTNode("Unary", operator, [right])
-        
-        return self.primary()
-    
-    def primary(self) -> ASTNode:
-        """Parse primary expressions"""
-        if self.match(TokenType.NUMBER):
-            return ASTNode("Number", self.previous().value)
-        elif self.match(TokenType.STRING):
-            return ASTNode("String", self.previous().value)
-        elif self.match(TokenType.IDENTIFIER):
-            return ASTNode("Identifier", self.previous().value)
-        elif self.match(TokenType.KEYWORD) and self.previous().value in ("True", "False", "None"):
-            return ASTNode("Literal", self.previous().value)
-        
-        # Handle parentheses
-        if self.match(TokenType.OPERATOR) and self.previous().value == "(":
-            expr = self.expression()
-            self.consume()  # ')'
-            return expr
-        
-        return ASTNode("Error")
-    
-    # Helper methods
-    def check(self, type: TokenType) -> bool:
-        """Check if current token is of given type"""
-        if self.is_at_end():
-            return False
-        return self.peek().type == type
-    
+        return self.parse()[0]
+
+    # Yardımcı yöntemler
+    def check(self, token_type: TokenType) -> bool:
+        """Mevcut token verilen türde mi?"""
+        return self._current.type == token_type
+
     def is_at_end(self) -> bool:
-        """Check if we've reached the end of tokens"""
-        return self.peek().type == TokenType.EOF
-    
-    def previous(self) -> Token:
-        """Get previous token"""
-        return self.tokens[self.current_token_index - 1]
-    
-    def errors(self):
-        return self.errors
\ No newline at end of file
+        """Token akışının sonuna gelindi mi?"""
+        return self._current is self._eof
+
+    def previous(self) -> Optional[Token]:
+        """Son tüketilen token"""
+        return self._previous
@@ -0,0 +1 @@
+# Server package initialization
@@ -0,0 +1,324 @@
+"""
+Sunucudaki açık bir belgenin durumu.
+
+Metin değişiklikleri olay döngüsünde uygulanır: metin birleştirilir, konum
+dönüşümleri için satır dizini güncellenir ve son analizden beri yapılan tüm
+değişiklikler tek bir düzenleme aralığında toplanır. Sözcüksel analiz,
+ayrıştırma ve semantik token kodlaması analiz kilidi altında yapılır (yürütücü
+iş parçacıklarında ya da küçük işlerde doğrudan olay döngüsünde); her analiz bekleyen metni ve düzenlemeyi kendi kilidi altında aldığı için
+analizler sırası ne olursa olsun tutarlıdır ve iptal edilen bir bekleme
+değişiklik kaybettirmez.
+"""
+import re
+import threading
+from bisect import bisect_left, bisect_right
+
+from src.lexer.incremental import IncrementalLexer
+from src.lexer.lexer import TokenType
+from src.lexer.line_index import LineIndex
+from src.parser.incremental import IncrementalParser
+
+# Semantik token türleri (LSP lejantı); token türü kodu -> lejant indeksi
+SEMANTIC_TOKEN_TYPES = {
+    TokenType.KEYWORD: "keyword",
+    TokenType.OPERATOR: "operator",
+    TokenType.IDENTIFIER: "variable",
+    TokenType.NUMBER: "number",
+    TokenType.STRING: "string",
+    TokenType.COMMENT: "comment",
+    TokenType.ERROR: "error",
+}
+LEGEND = list(SEMANTIC_TOKEN_TYPES.values())
+_LEGEND_INDEX = [-1] * 256
+for _index, _token_type in enumerate(SEMANTIC_TOKEN_TYPES):
+    _LEGEND_INDEX[_token_type.value] = _index
+
+ERROR_SEVERITY = 1
+
+# Bekleyen düzenlemesi bu kadar karakterden küçük olan belgeler olay döngüsünde
+# analiz edilebilir; tam token kodlaması ise bu uzunluğa kadar olan metinlerde
+INLINE_EDIT_CHARS = 4096
+INLINE_TEXT_CHARS = 64 * 1024
+
+# UTF-16'da iki birim kaplayan karakterler
+_ASTRAL = re.compile("[\U00010000-\U0010FFFF]")
+
+
+def utf16_column(line, column):
+    """Satırdaki karakter sütununu UTF-16 birim sütununa dönüştür"""
+    return column + len(_ASTRAL.findall(line, 0, column))
+
+
+def character_column(line, units):
+    """Satırdaki UTF-16 birim sütununu karakter sütununa dönüştür"""
+    if line.isascii():
+        return min(units, len(line))
+    column = count = 0
+    for char in line:
+        if count >= units:
+            break
+        count += 2 if char > "\uffff" else 1
+        column += 1
+    return column
+
+
+def merge_edits(first, second):
+    """
+    Art arda iki düzenlemeyi (başlangıç, eski_bitiş, yeni_bitiş) ilk metinden son
+    metne giden tek bir düzenlemede birleştir; `first` None olabilir
+    """
+    if first is None:
+        return second
+    first_start, first_old_end, first_new_end = first
+    start, old_end, new_end = second
+    # Ara metindeki birleşik bölgenin sonu; eski ve yeni metne kaydırılır
+    middle_end = max(first_new_end, old_end)
+    return (
+        min(first_start, start),
+        middle_end - (first_new_end - first_old_end),
+        middle_end + (new_end - old_end),
+    )
+
+
+class Document:
+    """
+    Açık bir belge. `utf16` True ise istemci konumları UTF-16 birimleriyle
+    sayar (LSP varsayılanı), değilse karakterlerle (utf-32).
+    """
+    def __init__(self, uri, text, version, lexer, language=None, parse=True, utf16=True):
+        self.uri = uri
+        self.version = version
+        self.utf16 = utf16
+
+        # Olay döngüsü tarafı: güncel metin ve konum dönüşümleri için satır dizini
+        self.text = text
+        self.lines = LineIndex(text)
+
+        # Son analizden beri birleştirilmiş düzenleme (başlangıç, eski_bitiş, yeni_bitiş)
+        self._edit = None
+        self._pending_lock = threading.Lock()
+
+        # Yürütücü tarafı: artımlı lexer ve ayrıştırıcı yalnızca bu kilit altında kullanılır.
+        # Ayrıştırma yalnızca tanılar için gerekir; semantik token istekleri beklemesin diye
+        # ertelenir ve aradaki token değişiklikleri tek bir aralıkta birleştirilir.
+        self._lexer = IncrementalLexer(lexer)
+        self._parser = IncrementalParser(language) if parse else None
+        self._parse_changed = None  # (ilk, eski_bitiş, yeni_bitiş) token aralığı
+        self._parsed_generation = 0
+        self._analysis_lock = threading.RLock()
+        self._analyzed = False
+        self.analyzed_version = None
+        self._generation = 0  # Analiz edilen metin her değiştiğinde artar
+        self._astral = False
+        self._semantic = None  # (nesil, kodlanmış veri)
+        self._diagnostics = None  # (nesil, LSP tanı listesi)
+
+    # --- Olay döngüsü tarafı ---
+
+    def offset(self, position):
+        """LSP {line, character} konumunu güncel metindeki karakter konumuna dönüştür"""
+        return self._offset(self.text, self.lines, position)
+
+    def _offset(self, text, lines, position):
+        line = position["line"]
+        if line < 0:
+            return 0
+        if line >= len(lines):
+            return len(text)
+        start = lines.starts[line]
+        end = lines.starts[line + 1] - 1 if line + 1 < len(lines) else len(text)
+        character = max(position["character"], 0)
+        if self.utf16:
+            character = character_column(text[start:end], character)
+        return start + min(character, end - start)
+
+    def apply_changes(self, changes, version):
+        """
+        LSP contentChanges listesini sırayla uygula. Aralıksız bir değişiklik tüm
+        metni değiştirir; bu durumda düzenleme aralığı eski ve yeni metin
+        karşılaştırılarak bulunur.
+        """
+        for change in changes:
+            text = self.text
+            new_text = change["text"]
+            if "range" in change:
+                start = self.offset(change["range"]["start"])
+                old_end = max(self.offset(change["range"]["end"]), start)
+                new_end = start + len(new_text)
+                text = text[:start] + new_text + text[old_end:]
+            else:
+                edit = IncrementalLexer.find_edit(text, new_text)
+                text = new_text
+                if edit is None:
+                    continue
+                start, old_end, new_end = edit
+
+            self.lines.update(text, start, old_end, new_end)
+            with self._pending_lock:
+                self.text = text
+                self._edit = merge_edits(self._edit, (start, old_end, new_end))
+        self.version = version
+
+    def run_inline(self, function, *args, full=False):
+        """
+        Bekleyen iş küçükse ve analiz kilidi boştaysa function'ı (bu belgenin
+        kilitli yöntemlerinden biri) hemen çalıştır ve (True, sonuç) döndür; değilse
+        (False, None). Küçük işler için iş parçacığı havuzuna gidip gelmek, havuz
+        meşgulken GIL geçiş aralığı kadar beklemeye mal olur.
+        """
+        with self._pending_lock:
+            edit = self._edit
+            small = self._analyzed and (
+                edit is None or max(edit[1], edit[2]) - edit[0] <= INLINE_EDIT_CHARS
+            )
+        if not small or (full and len(self.text) > INLINE_TEXT_CHARS):
+            return False, None
+        if not self._analysis_lock.acquire(blocking=False):
+            return False, None
+        try:
+            return True, function(*args)
+        finally:
+            self._analysis_lock.release()
+
+    # --- Yürütücü tarafı ---
+
+    def _analyze(self):
+        """Bekleyen değişiklikleri lexer'a ve ayrıştırıcıya uygula (analiz kilidi altında çağrılır)"""
+        with self._pending_lock:
+            text, edit, version = self.text, self._edit, self.version
+            self._edit = None
+
+        if not self._analyzed:
+            self._lexer.reset(text)
+            self._analyzed = True
+            self._parse_changed = None
+            if self._parser is not None:
+                self._parser.reset()
+        elif edit is not None:
+            first, new_stop, old_stop = self._lexer.update(text, *edit)
+            self._parse_changed = merge_edits(self._parse_changed, (first, old_stop, new_stop))
+        else:
+            self.analyzed_version = version
+            return
+
+        self._astral = self.utf16 and not text.isascii() and _ASTRAL.search(text) is not None
+        self._generation += 1
+        self.analyzed_version = version
+
+    def _parse(self):
+        """Ertelenmiş ayrıştırmayı güncel token akışına uygula (analiz kilidi altında çağrılır)"""
+        if self._parser is None or self._parsed_generation == self._generation:
+            return
+        changed = self._parse_changed
+        if changed is None or self._parser.root is None:
+            self._parser.reset()
+            self._parser.parse(self._lexer.tokens)
+        else:
+            first, old_stop, new_stop = changed
+            self._parser.parse(self._lexer.tokens, (first, new_stop, old_stop))
+        self._parse_changed = None
+        self._parsed_generation = self._generation
+
+    def analyze(self):
+        """Belgeyi güncel sürüme kadar analiz et; analiz edilen sürümü döndür"""
+        with self._analysis_lock:
+            self._analyze()
+            return self.analyzed_version
+
+    def semantic_tokens(self, range_=None):
+        """
+        Güncel sürüm için LSP semantik token verisini (göreli beşliler) döndür.
+        `range_` verilirse yalnızca o aralıkla kesişen token'lar kodlanır.
+        """
+        with self._analysis_lock:
+            self._analyze()
+            if range_ is None:
+                if self._semantic is None or self._semantic[0] != self._generation:
+                    self._semantic = (self._generation, self._encode(0, len(self._lexer.text)))
+                return self._semantic[1]
+            text, lines = self._lexer.text, self._lexer.lines
+            start = self._offset(text, lines, range_["start"])
+            end = self._offset(text, lines, range_["end"])
+            return self._encode(start, end)
+
+    def diagnostics(self):
+        """Güncel sürüm için (sürüm, LSP tanı listesi) döndür"""
+        with self._analysis_lock:
+            self._analyze()
+            if self._diagnostics is None or self._diagnostics[0] != self._generation:
+                self._parse()
+                if self._parser is not None:
+                    spans = self._parser.error_spans()
+                else:
+                    types, starts, ends = self._lexer.columns()
+                    error = TokenType.ERROR.value
+                    spans = [
+                        (starts[index], ends[index], "Tanınmayan token")
+                        for index in range(len(types)) if types[index] == error
+                    ]
+                items = [
+                    {
+                        "range": {"start": self._position(start), "end": self._position(end)},
+                        "severity": ERROR_SEVERITY,
+                        "source": "syntax-mirror",
+                        "message": message,
+                    }
+                    for start, end, message in spans
+                ]
+                self._diagnostics = (self._generation, items)
+            return self.analyzed_version, self._diagnostics[1]
+
+    def _position(self, offset):
+        """Analiz edilmiş metindeki karakter konumunu LSP konumuna dönüştür"""
+        lines = self._lexer.lines
+        line, column = lines.line_col(offset)
+        if self._astral:
+            start = lines.starts[line]
+            column = utf16_column(self._lexer.text[start:start + column], column)
+        return {"line": line, "character": column}
+
+    def _encode(self, first, last):
+        """[first, last) ile kesişen token'ları satırlara bölünmüş göreli beşliler olarak kodla"""
+        lexer = self._lexer
+        text = lexer.text
+        line_starts = lexer.lines.starts
+        line_count = len(line_starts)
+        types, starts, ends = lexer.columns()
+        legend = _LEGEND_INDEX
+        astral = self._astral
+
+        data = []
+        previous_line = previous_column = 0
+        index = max(bisect_right(starts, first) - 1, 0)
+        stop = bisect_left(starts, last, index)
+        line = max(bisect_right(line_starts, first) - 1, 0)
+        for index in range(index, stop):
+            token_type = legend[types[index]]
+            if token_type < 0:
+                continue
+            start, end = max(starts[index], first), min(ends[index], last)
+            while line + 1 < line_count and line_starts[line + 1] <= start:
+                line += 1
+
+            # Çok satırlı token'lar (blok yorumlar) satır başına bir parçaya bölünür
+            while start < end:
+                line_start = line_starts[line]
+                line_end = line_starts[line + 1] - 1 if line + 1 < line_count else len(text)
+                piece_end = min(end, line_end)
+                if piece_end > start:
+                    column, length = start - line_start, piece_end - start
+                    if astral:
+                        prefix = text[line_start:piece_end]
+                        column = utf16_column(prefix, column)
+                        length = utf16_column(prefix, piece_end - line_start) - column
+                    data += (
+                        line - previous_line,
+                        column - previous_column if line == previous_line else column,
+                        length, token_type, 0,
+                    )
+                    previous_line, previous_column = line, column
+                if piece_end >= end or line + 1 >= line_count:
+                    break
+                line += 1
+                start = line_starts[line]
+        return data
@@ -0,0 +1,91 @@
+"""
+JSON-RPC 2.0 mesaj çerçeveleme (LSP tarzı).
+
+Her mesaj "Content-Length: N" başlığı, boş bir satır ve N baytlık UTF-8 JSON
+gövdesinden oluşur. Okuma ve yazma asyncio akışları üzerinden yapılır.
+"""
+import json
+
+# JSON-RPC ve LSP hata kodları
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+INTERNAL_ERROR = -32603
+SERVER_NOT_INITIALIZED = -32002
+REQUEST_CANCELLED = -32800
+
+# Bir mesaj gövdesinin izin verilen en büyük boyutu
+MAX_CONTENT_LENGTH = 256 * 1024 * 1024
+
+
+class ProtocolError(Exception):
+    """Çerçeveleme veya JSON-RPC biçim hatası; `code` JSON-RPC hata kodudur"""
+    def __init__(self, code, message):
+        super().__init__(message)
+        self.code = code
+
+
+class RequestError(Exception):
+    """Bir isteğin işleyicisinin istemciye hata yanıtı olarak döndürdüğü hata"""
+    def __init__(self, code, message):
+        super().__init__(message)
+        self.code = code
+
+
+async def read_message(reader):
+    """
+    Akıştan bir mesaj oku ve çözülmüş JSON nesnesini döndür. Akış mesaj
+    başlamadan kapandıysa None döndür.
+    """
+    length = None
+    while True:
+        line = await reader.readline()
+        if not line:
+            if length is None:
+                return None
+            raise ProtocolError(PARSE_ERROR, "Başlıklar tamamlanmadan akış kapandı")
+        line = line.strip()
+        if not line:
+            if length is None:
+                # Mesajlar arasındaki boş satırlar yok sayılır
+                continue
+            break
+        name, _, value = line.decode("ascii", "replace").partition(":")
+        if name.strip().lower() == "content-length":
+            try:
+                length = int(value)
+            except ValueError:
+                raise ProtocolError(PARSE_ERROR, f"Geçersiz Content-Length: {value.strip()}") from None
+            if not 0 <= length <= MAX_CONTENT_LENGTH:
+                raise ProtocolError(PARSE_ERROR, f"Content-Length sınır dışında: {length}")
+
+    body = await reader.readexactly(length)
+    try:
+        message = json.loads(body)
+    except ValueError as error:
+        raise ProtocolError(PARSE_ERROR, f"Geçersiz JSON: {error}") from None
+    if not isinstance(message, dict):
+        raise ProtocolError(INVALID_REQUEST, "Mesaj bir JSON nesnesi olmalı")
+    return message
+
+
+def encode_message(message):
+    """Mesajı başlığıyla birlikte bayt dizisine kodla"""
+    body = json.dumps(message, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    return b"Content-Length: %d\r\n\r\n%s" % (len(body), body)
+
+
+def response(request_id, result):
+    """Başarılı yanıt mesajı"""
+    return {"jsonrpc": "2.0", "id": request_id, "result": result}
+
+
+def error_response(request_id, code, message):
+    """Hata yanıtı mesajı"""
+    return {"jsonrpc": "2.0", "id": request_id, "error": {"code": code, "message": message}}
+
+
+def notification(method, params):
+    """Bildirim mesajı (yanıt beklenmez)"""
+    return {"jsonrpc": "2.0", "method": method, "params": params}
@@ -0,0 +1,415 @@
+"""
+Syntax Mirror - asyncio vurgulama sunucusu
+
+Lexer/ayrıştırıcı hattını Tk başlatmadan başka editörlere ve servislere açar.
+Stdio veya yerel bir TCP soketi üzerinden LSP tarzı JSON-RPC konuşur:
+
+    initialize, shutdown, exit
+    textDocument/didOpen, didChange (artımlı), didClose
+    textDocument/semanticTokens/full, textDocument/semanticTokens/range
+    textDocument/diagnostic (istek) ve textDocument/publishDiagnostics (bildirim)
+    $/cancelRequest
+
+Her bağlantı kendi belge kümesini tutar; lexer'lar dil başına paylaşılır.
+Metin değişiklikleri olay döngüsünde uygulanır. Küçük düzenlemelerden sonraki
+semantik token istekleri de döngüde yanıtlanır: GIL altında iş parçacığı
+havuzuna gidip gelmek, havuz meşgulken işin kendisinden pahalıdır. İlk analiz
+ve büyük düzenlemeler bir iş parçacığı havuzunda yapılır. Ayrıştırma yalnızca
+tanılar için gerekir; ayrı bir arka plan iş parçacığında ertelenir, her belge
+için kısa bir gecikmeyle birleştirilir ve yeni bir değişiklik bekleyen tanı
+işini iptal eder.
+
+Kullanım:
+    python -m src.server.server [--stdio | --tcp [HOST:]PORT] [--language DİL]
+                                [--no-parse] [--workers N]
+                                [--diagnostics-delay SANİYE]
+"""
+import asyncio
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from time import perf_counter
+from urllib.parse import unquote, urlparse
+
+from src import instrumentation
+from src.language.definition import available_languages, language_for_path, load_language
+from src.lexer.lexer import Lexer
+from src.server.document import LEGEND, Document
+from src.server.protocol import (
+    INTERNAL_ERROR, INVALID_PARAMS, INVALID_REQUEST, METHOD_NOT_FOUND, REQUEST_CANCELLED,
+    SERVER_NOT_INITIALIZED, ProtocolError, RequestError, encode_message, error_response, notification, read_message, response,
+)
+
+# LSP TextDocumentSyncKind.Incremental
+SYNC_INCREMENTAL = 2
+
+# window/logMessage türü
+LOG_ERROR = 1
+
+
+def _valid_id(request_id):
+    """JSON-RPC istek kimliği bir dizi, sayı veya null olmalıdır"""
+    return request_id is None or (isinstance(request_id, (str, int, float)) and not isinstance(request_id, bool))
+
+
+class Session:
+    """
+    Tek bir istemci bağlantısının durumu: açık belgeler, süren istekler ve
+    bekleyen tanı işleri. `send` bir mesajı istemciye yazan eşyordamdır.
+    """
+    def __init__(self, server, send):
+        self.server = server
+        self.send = send
+        self.documents = {}
+        self.utf16 = True
+        self.initialized = False
+        self.shutdown_requested = False
+        self.closed = False
+
+        self._requests = {}  # istek kimliği -> görev
+        self._diagnostic_tasks = {}  # uri -> görev
+
+        self._request_handlers = {
+            "initialize": self.initialize,
+            "shutdown": self.shutdown,
+            "textDocument/semanticTokens/full": self.semantic_tokens_full,
+            "textDocument/semanticTokens/range": self.semantic_tokens_range,
+            "textDocument/diagnostic": self.diagnostic,
+        }
+        self._notification_handlers = {
+            "initialized": None,
+            "exit": self.exit,
+            "$/cancelRequest": self.cancel_request,
+            "textDocument/didOpen": self.did_open,
+            "textDocument/didChange": self.did_change,
+            "textDocument/didClose": self.did_close,
+        }
+
+    async def handle(self, message):
+        """
+        Gelen bir mesajı işle. Bildirimler sırayla hemen uygulanır; istekler ayrı
+        görevlerde çalışır, böylece yavaş bir istek sonraki değişiklikleri bekletmez.
+        Bir bildirimin hatası yanıtlanamaz; window/logMessage ile bildirilir ve
+        oturum sürer (ör. didClose ile yarışan bir didChange).
+        """
+        method = message.get("method")
+        if method is None:
+            return  # İstemciden gelen yanıtlar yok sayılır
+        params = message.get("params") or {}
+
+        if "id" not in message:
+            handler = self._notification_handlers.get(method)
+            if handler is None:
+                return
+            try:
+                await handler(params)
+            except RequestError as error:
+                await self._log(f"{method}: {error}")
+            except (KeyError, TypeError, ValueError) as error:
+                await self._log(f"{method}: geçersiz parametreler ({type(error).__name__}: {error})")
+            except Exception as error:
+                await self._log(f"{method}: iç hata ({type(error).__name__}: {error})")
+            return
+
+        request_id = message["id"]
+        if not _valid_id(request_id):
+            await self._send(error_response(None, INVALID_REQUEST, f"Geçersiz istek kimliği: {request_id!r}"))
+            return
+        handler = self._request_handlers.get(method)
+        if handler is None:
+            await self._send(error_response(request_id, METHOD_NOT_FOUND, f"Bilinmeyen yöntem: {method}"))
+        elif not self.initialized and method != "initialize":
+            await self._send(error_response(request_id, SERVER_NOT_INITIALIZED, "Sunucu başlatılmadı"))
+        else:
+            task = asyncio.create_task(self._run_request(request_id, method, handler, params))
+            self._requests[request_id] = task
+
+    async def _run_request(self, request_id, method, handler, params):
+        metrics = instrumentation.active
+        if metrics is not None:
+            started = perf_counter()
+        try:
+            message = response(request_id, await handler(params))
+        except asyncio.CancelledError:
+            message = error_response(request_id, REQUEST_CANCELLED, "İstek iptal edildi")
+        except RequestError as error:
+            message = error_response(request_id, error.code, str(error))
+        except (KeyError, TypeError, ValueError) as error:
+            message = error_response(request_id, INVALID_PARAMS, f"Geçersiz parametreler: {type(error).__name__}: {error}")
+        except Exception as error:
+            message = error_response(request_id, INTERNAL_ERROR, f"{type(error).__name__}: {error}")
+        finally:
+            self._requests.pop(request_id, None)
+        if metrics is not None:
+            metrics.record("server_request", perf_counter() - started)
+        await self._send(message)
+
+    async def _send(self, message):
+        """Bağlantı kapandıysa sessizce vazgeçerek mesaj gönder"""
+        if self.closed:
+            return
+        try:
+            await self.send(message)
+        except (ConnectionError, RuntimeError):
+            self.closed = True
+
+    async def _log(self, text):
+        await self._send(notification("window/logMessage", {"type": LOG_ERROR, "message": text}))
+
+    def _document(self, params):
+        uri = params["textDocument"]["uri"]
+        document = self.documents.get(uri)
+        if document is None:
+            raise RequestError(INVALID_PARAMS, f"Açık olmayan belge: {uri}")
+        return document
+
+    async def _run(self, document, function, *args, full=False):
+        """
+        Bir belge işini çalıştır: bekleyen değişiklik küçükse hemen olay döngüsünde,
+        değilse (ilk analiz, büyük düzenleme) iş parçacığı havuzunda
+        """
+        done, result = document.run_inline(function, *args, full=full)
+        if done:
+            return result
+        return await asyncio.get_running_loop().run_in_executor(self.server.executor, function, *args)
+
+    async def _run_background(self, function, *args):
+        """
+        Ayrıştırma gerektiren tanı işlerini ayrı bir arka plan iş parçacığında çalıştır;
+        böylece istekler tanı kuyruğunun arkasında beklemez
+        """
+        return await asyncio.get_running_loop().run_in_executor(self.server.background, function, *args)
+
+    # --- İstekler ---
+
+    async def initialize(self, params):
+        # İstemci destekliyorsa konumlar karakterlerle (utf-32) sayılır; dönüşüm gerekmez
+        general = (params.get("capabilities") or {}).get("general") or {}
+        encodings = general.get("positionEncodings") or []
+        self.utf16 = "utf-32" not in encodings
+        self.initialized = True
+        return {
+            "capabilities": {
+                "positionEncoding": "utf-16" if self.utf16 else "utf-32",
+                "textDocumentSync": {"openClose": True, "change": SYNC_INCREMENTAL},
+                "semanticTokensProvider": {
+                    "legend": {"tokenTypes": LEGEND, "tokenModifiers": []},
+                    "full": True,
+                    "range": True,
+                },
+                "diagnosticProvider": {"interFileDependencies": False, "workspaceDiagnostics": False},
+            },
+            "serverInfo": {"name": "syntax-mirror"},
+        }
+
+    async def shutdown(self, params):
+        self.shutdown_requested = True
+        return None
+
+    async def semantic_tokens_full(self, params):
+        document = self._document(params)
+        return {"data": await self._run(document, document.semantic_tokens, full=True)}
+
+    async def semantic_tokens_range(self, params):
+        document = self._document(params)
+        return {"data": await self._run(document, document.semantic_tokens, params["range"])}
+
+    async def diagnostic(self, params):
+        document = self._document(params)
+        _, items = await self._run_background(document.diagnostics)
+        return {"kind": "full", "items": items}
+
+    # --- Bildirimler ---
+
+    async def exit(self, params):
+        self.closed = True
+
+    async def cancel_request(self, params):
+        task = self._requests.get(params["id"])
+        if task is not None:
+            task.cancel()
+
+    async def did_open(self, params):
+        item = params["textDocument"]
+        uri = item["uri"]
+        language = self.server.language_for(uri, item.get("languageId"))
+        self.documents[uri] = Document(
+            uri, item["text"], item.get("version", 0), self.server.lexer_for(language),
+            language, self.server.parse, self.utf16,
+        )
+        self._schedule_diagnostics(uri)
+
+    async def did_change(self, params):
+        document = self._document(params)
+        document.apply_changes(params["contentChanges"], params["textDocument"].get("version"))
+        self._schedule_diagnostics(document.uri)
+
+    async def did_close(self, params):
+        uri = params["textDocument"]["uri"]
+        self.documents.pop(uri, None)
+        task = self._diagnostic_tasks.pop(uri, None)
+        if task is not None:
+            task.cancel()
+        await self._send(notification("textDocument/publishDiagnostics", {"uri": uri, "diagnostics": []}))
+
+    def _schedule_diagnostics(self, uri):
+        """Belgenin tanılarını kısa bir gecikmeyle yayınla; bekleyen eski işi iptal et"""
+        task = self._diagnostic_tasks.get(uri)
+        if task is not None:
+            task.cancel()
+        self._diagnostic_tasks[uri] = asyncio.create_task(self._publish_diagnostics(uri))
+
+    async def _publish_diagnostics(self, uri):
+        try:
+            await asyncio.sleep(self.server.diagnostics_delay)
+            document = self.documents.get(uri)
+            if document is None:
+                return
+            version, items = await self._run_background(document.diagnostics)
+        except asyncio.CancelledError:
+            return
+        if self.documents.get(uri) is not document:
+            return  # Beklerken kapatıldı veya yeniden açıldı
+        if self._diagnostic_tasks.get(uri) is asyncio.current_task():
+            del self._diagnostic_tasks[uri]
+        await self._send(notification(
+            "textDocument/publishDiagnostics", {"uri": uri, "version": version, "diagnostics": items}
+        ))
+
+    def close(self):
+        """Süren istekleri ve tanı işlerini iptal et"""
+        self.closed = True
+        for task in list(self._requests.values()) + list(self._diagnostic_tasks.values()):
+            task.cancel()
+        self._requests.clear()
+        self._diagnostic_tasks.clear()
+        self.documents.clear()
+
+
+class HighlightServer:
+    """
+    Bağlantılar arasında paylaşılan sunucu durumu: dil başına lexer'lar,
+    sözcüksel analiz için iş parçacığı havuzu ve tanılar (ayrıştırma) için tek
+    iş parçacıklı arka plan yürütücüsü.
+    """
+    def __init__(self, language=None, parse=True, workers=None, diagnostics_delay=0.05):
+        self.language = load_language(language)
+        self.parse = parse
+        self.diagnostics_delay = diagnostics_delay
+        self.executor = ThreadPoolExecutor(
+            max_workers=workers or min(4, os.cpu_count() or 1), thread_name_prefix="highlight"
+        )
+        self.background = ThreadPoolExecutor(max_workers=1, thread_name_prefix="diagnostics")
+        self._lexers = {}
+
+    def lexer_for(self, language):
+        """Dil için paylaşılan lexer; token desenleri bir kez derlenir"""
+        lexer = self._lexers.get(language)
+        if lexer is None:
+            lexer = self._lexers[language] = Lexer(language=language)
+        return lexer
+
+    def language_for(self, uri, language_id=None):
+        """
+        Belgenin dili: languageId yerleşik bir dilse o, değilse dosya uzantısına göre.
+        languageId istemciden gelir; dosya yolu olarak yorumlanmaması için yalnızca
+        yerleşik dil adları kabul edilir.
+        """
+        if language_id and language_id in available_languages():
+            return load_language(language_id)
+        return language_for_path(unquote(urlparse(uri).path), self.language)
+
+    async def serve_connection(self, reader, writer):
+        """Bir bağlantıyı exit bildirimine veya akış sonuna kadar hizmet et; oturumu döndür"""
+        lock = asyncio.Lock()
+
+        async def send(message):
+            data = encode_message(message)
+            async with lock:
+                writer.write(data)
+                await writer.drain()
+
+        session = Session(self, send)
+        try:
+            while not session.closed:
+                try:
+                    message = await read_message(reader)
+                except ProtocolError as error:
+                    await session._send(error_response(None, error.code, str(error)))
+                    continue
+                except (asyncio.IncompleteReadError, ConnectionError):
+                    break
+                if message is None:
+                    break
+                await session.handle(message)
+        finally:
+            session.close()
+            try:
+                writer.close()
+            except (ConnectionError, RuntimeError):
+                pass
+        return session
+
+    async def serve_tcp(self, host="127.0.0.1", port=0):
+        """Yerel TCP sunucusunu başlat ve asyncio.Server nesnesini döndür"""
+        async def connection(reader, writer):
+            await self.serve_connection(reader, writer)
+        return await asyncio.start_server(connection, host, port)
+
+    async def serve_stdio(self):
+        """Stdin/stdout üzerinden tek bir istemciye hizmet et; LSP çıkış kodunu döndür"""
+        loop = asyncio.get_running_loop()
+        reader = asyncio.StreamReader()
+        await loop.connect_read_pipe(lambda: asyncio.StreamReaderProtocol(reader), sys.stdin.buffer)
+        transport, protocol = await loop.connect_write_pipe(asyncio.streams.FlowControlMixin, sys.stdout.buffer)
+        writer = asyncio.StreamWriter(transport, protocol, reader, loop)
+        session = await self.serve_connection(reader, writer)
+        return 0 if session.shutdown_requested else 1
+
+    def close(self):
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        self.background.shutdown(wait=False, cancel_futures=True)
+
+
+def _address(value):
+    host, _, port = value.rpartition(":")
+    return host or "127.0.0.1", int(port)
+
+
+async def _serve(args):
+    server = HighlightServer(args.language, parse=not args.no_parse, workers=args.workers,
+                             diagnostics_delay=args.diagnostics_delay)
+    try:
+        if args.tcp is None:
+            return await server.serve_stdio()
+        tcp = await server.serve_tcp(*_address(args.tcp))
+        host, port = tcp.sockets[0].getsockname()[:2]
+        print(f"Syntax Mirror sunucusu dinliyor: {host}:{port}", file=sys.stderr, flush=True)
+        async with tcp:
+            await tcp.serve_forever()
+        return 0
+    finally:
+        server.close()
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Syntax Mirror vurgulama sunucusu (LSP tarzı JSON-RPC)")
+    transport = parser.add_mutually_exclusive_group()
+    transport.add_argument("--stdio", action="store_true", help="stdin/stdout üzerinden hizmet et (varsayılan)")
+    transport.add_argument("--tcp", metavar="[HOST:]PORT", help="yerel bir TCP soketinde dinle (0: boş bir port)")
+    parser.add_argument("-l", "--language", default=None, help="languageId tanınmadığında kullanılan dil")
+    parser.add_argument("--no-parse", action="store_true", help="ayrıştırmayı kapat; tanılar yalnızca lexer hatalarıdır")
+    parser.add_argument("--workers", type=int, default=None, help="analiz iş parçacığı sayısı")
+    parser.add_argument("--diagnostics-delay", type=float, default=0.05, help="tanı yayınlama gecikmesi (saniye)")
+    args = parser.parse_args(argv)
+
+    try:
+        return asyncio.run(_serve(args))
+    except KeyboardInterrupt:
+        return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,92 @@
+"""Toplu vurgulayıcı: çıktı biçimleri, dosya başına dil seçimi ve okunamayan dosyalar"""
+import json
+import os
+import re
+
+import pytest
+
+from src.batch import FORMATS, collect_jobs, main, run
+from src.lexer.lexer import TokenType
+
+SOURCES = {
+    "a.sm": "int x = 1; // yorum\n",
+    "alt/b.sm": 'string s = "metin";\n',
+    "c.scr": "# yorum\nvar y = 0x1F;\n",
+}
+
+
+@pytest.fixture
+def tree(tmp_path):
+    source = tmp_path / "kaynak"
+    for name, text in SOURCES.items():
+        path = source / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text, encoding="utf-8")
+    return source
+
+
+def strip_ansi(text):
+    return re.sub("\x1b\\[[0-9;]*m", "", text)
+
+
+@pytest.mark.parametrize("output_format", sorted(FORMATS))
+def test_formats(tree, tmp_path, output_format):
+    output = tmp_path / "cikti"
+    jobs = collect_jobs([str(tree)], str(output), "*", FORMATS[output_format])
+    assert sorted(os.path.relpath(path, output) for _, path in jobs) == sorted(
+        os.path.normpath(name) + FORMATS[output_format] for name in SOURCES)
+
+    files, total_bytes, _, failures = run(jobs, output_format, workers=2)
+    assert (files, failures) == (3, [])
+    assert total_bytes == sum(len(text.encode("utf-8")) for text in SOURCES.values())
+
+    for name, text in SOURCES.items():
+        content = (output / (name + FORMATS[output_format])).read_text(encoding="utf-8")
+        if output_format == "html":
+            assert content.startswith("<!DOCTYPE html>") and "<span style=" in content
+        elif output_format == "ansi":
+            assert "\x1b[" in content and strip_ansi(content) == text
+        else:
+            data = json.loads(content)
+            assert data["path"].endswith(os.path.normpath(name))
+            spans = data["spans"]
+            assert spans and all(0 <= start < end <= len(text) for start, end, _ in spans)
+            assert all(spans[i][1] <= spans[i + 1][0] for i in range(len(spans) - 1))
+            assert {kind for _, _, kind in spans} <= set(TokenType.__members__)
+
+    assert main([str(tree), "-o", str(tmp_path / "main"), "-f", output_format, "-j", "1"]) == 0
+
+
+def test_language_follows_extension(tree, tmp_path):
+    output = tmp_path / "cikti"
+    run(collect_jobs([str(tree)], str(output), "*", ".json"), "json", workers=1)
+    script = json.loads((output / "c.scr.json").read_text(encoding="utf-8"))["spans"]
+    assert [0, 7, "COMMENT"] in script
+
+    # Zorunlu dil tüm dosyalara uygulanır; varsayılan dilde '#' yorum değildir
+    run(collect_jobs([str(tree)], str(output), "*", ".json"), "json", workers=1, language="default")
+    script = json.loads((output / "c.scr.json").read_text(encoding="utf-8"))["spans"]
+    assert [0, 7, "COMMENT"] not in script
+
+
+def test_unreadable_file_is_reported(tree, tmp_path, capsys):
+    os.symlink(tmp_path / "yok.sm", tree / "bozuk.sm")
+    output = tmp_path / "cikti"
+    jobs = collect_jobs([str(tree)], str(output), "*.sm", ".html")
+    files, _, _, failures = run(jobs, "html", workers=2, chunksize=1)
+    assert files == 3 and len(failures) == 1 and "bozuk.sm" in failures[0]
+    assert (output / "a.sm.html").exists() and (output / "alt" / "b.sm.html").exists()
+
+    assert main([str(tree), "-o", str(output), "-p", "*.sm"]) == 1
+    captured = capsys.readouterr()
+    assert "bozuk.sm" in captured.err and "(1 hatalı)" in captured.out
+
+
+def test_duplicate_outputs_are_rejected(tree, tmp_path, capsys):
+    other = tmp_path / "diger"
+    other.mkdir()
+    (other / "a.sm").write_text("int z;\n", encoding="utf-8")
+    with pytest.raises(ValueError):
+        collect_jobs([str(tree / "a.sm"), str(other / "a.sm")], str(tmp_path / "cikti"), "*", ".html")
+    assert main([str(tree / "a.sm"), str(other / "a.sm"), "-o", str(tmp_path / "cikti")]) == 2
+    assert "aynı çıktıya" in capsys.readouterr().err
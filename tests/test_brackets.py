@@ -0,0 +1,109 @@
+"""Parantez dizini: artımlı güncellemenin baştan oluşturmayla aynı olması ve sorgular"""
+import random
+
+import pytest
+
+from src.benchmarks.corpus import PROFILES, generate
+from src.lexer.brackets import BracketIndex
+from src.lexer.incremental import IncrementalLexer
+from src.lexer.lexer import Lexer
+from src.lexer.line_index import LineIndex
+
+# Düzenlemelerde eklenen parçalar: dengesiz parantezler, dizi ve yorum içindeki parantezler
+FRAGMENTS = [
+    "(", ")", "[", "]", "{", "}", "{\n", "\n}", "{\n}\n", "(]", "[)", "}{", "\n", " ",
+    '"', '"(}"', "'{'", "/*", "*/", "/* { */", "/*\n(\n*/", "// }\n", "x", "if (a) {\n  b[0];\n}\n",
+]
+
+
+def built(text):
+    """Metinden baştan oluşturulan dizin"""
+    tokens = Lexer().tokenize(text)
+    index = BracketIndex()
+    index.build(text, tokens.types, tokens.starts, tokens.ends)
+    return index
+
+
+def columns(index):
+    return (index.length, list(index.positions), list(index.kinds), list(index.partners), list(index.parents),
+            list(index.comment_starts), list(index.comment_ends))
+
+
+def assert_same(actual, text):
+    expected = built(text)
+    assert columns(actual) == columns(expected)
+    lines = LineIndex(text)
+    assert actual.fold_ranges(lines) == expected.fold_ranges(lines)
+    for position in range(len(text) + 1):
+        assert actual.match_at(position) == expected.match_at(position)
+        assert actual.enclosing(position) == expected.enclosing(position)
+    for line in range(len(lines)):
+        position = lines.offset(line, 0)
+        assert actual.fold_at(position, lines) == expected.fold_at(position, lines)
+
+
+def random_text(rng, pieces):
+    return "".join(rng.choice(FRAGMENTS) for _ in range(pieces))
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_update_matches_build(seed):
+    rng = random.Random(seed)
+    texts = [random_text(rng, rng.randint(0, 30)) for _ in range(40)]
+    texts.append(generate(sorted(PROFILES)[seed % len(PROFILES)], 1_500, seed))
+    for text in texts:
+        lexer = IncrementalLexer()
+        lexer.reset(text)
+        index = BracketIndex()
+        index.build(text, *lexer.columns())
+        for _ in range(10):
+            start = rng.randint(0, len(text))
+            old_end = min(len(text), start + rng.choice((0, 0, 1, 2, 6)))
+            inserted = random_text(rng, rng.randint(0, 2))
+            text = text[:start] + inserted + text[old_end:]
+            changed = lexer.update(text, start, old_end, start + len(inserted))
+            index.update(text, *lexer.columns(), *changed)
+            assert_same(index, text)
+
+
+def test_pairs_and_unbalanced():
+    text = "a(b[c]{d}) ) (x]"
+    index = built(text)
+    assert index.match_at(1) == (1, 9)
+    assert index.match_at(10) == (9, 1)  # İmleçten önceki karakter
+    assert index.match_at(3) == (3, 5)
+    # Eşsiz kapanış ve türü uymayan kapanış eşlenmez, açık '(' eşsiz kalır
+    assert index.match_at(11) == (11, -1)
+    assert index.match_at(13) == (13, -1)
+    assert index.match_at(15) == (15, -1)
+    assert index.match_at(0) is None
+    assert [index.positions[i] for i in index.enclosing(4)] == [1, 3]
+
+
+def test_brackets_in_strings_and_comments_are_ignored():
+    text = 'f("(", \'{\') /* ) } */ // ]\n[x]'
+    index = built(text)
+    assert [text[position] for position in index.positions] == ["(", ")", "[", "]"]
+    assert index.match_at(1) == (1, 10)
+    assert index.match_at(text.index("{")) is None
+
+
+def test_fold_ranges_and_fold_at():
+    text = "class A {\n  f() {\n    x;\n  }\n  g() { y; }\n}\n/* çok\n satırlı */\n{ }\n"
+    index = built(text)
+    lines = LineIndex(text)
+    assert index.fold_ranges(lines) == [(0, 5), (1, 3), (6, 7)]
+    assert index.fold_at(lines.offset(0, 0), lines) == (0, 5)
+    assert index.fold_at(lines.offset(1, 0), lines) == (1, 3)
+    assert index.fold_at(lines.offset(2, 4), lines) == (1, 3)  # Çevreleyen en içteki blok
+    assert index.fold_at(lines.offset(4, 0), lines) == (0, 5)  # Tek satırlı blok katlanmaz
+    assert index.fold_at(lines.offset(7, 2), lines) == (6, 7)
+    assert index.fold_at(lines.offset(8, 0), lines) is None
+
+
+def test_unclosed_block_does_not_fold():
+    text = "{\n  a;\n  {\n  b;\n"
+    index = built(text)
+    lines = LineIndex(text)
+    assert index.fold_ranges(lines) == []
+    assert index.fold_at(lines.offset(1, 0), lines) is None
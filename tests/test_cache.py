@@ -0,0 +1,118 @@
+"""İçerik adresli önbelleğin doğrudan taramayla aynı token akışını vermesi ve LRU atması"""
+import random
+
+import pytest
+
+from src.benchmarks.corpus import PROFILES, generate
+from src.benchmarks.parallel_lex import same_tokens
+from src.highlighter.cache import HighlightCache
+from src.lexer.lexer import Lexer, TokenType
+
+# Düzenlemelerde eklenen parçalar: blok sınırlarını aşan dizi ve yorumlar da dahil
+FRAGMENTS = [
+    "\n", "\n\n", " ", "x", "int y = 1;\n", '"', "'", "/*", "*/", "//", '"a\nb"', "/* c\n*/",
+    "{", "}", "42", "#", "if (a) {\n  b();\n}\n",
+]
+
+
+@pytest.fixture(scope="module")
+def lexer():
+    return Lexer()
+
+
+def spans_of(tokens):
+    whitespace = TokenType.WHITESPACE.value
+    return [(start, end, TokenType(code)) for code, start, end in zip(tokens.types, tokens.starts, tokens.ends)
+            if code != whitespace]
+
+
+def edit(rng, text):
+    start = rng.randint(0, len(text))
+    end = min(len(text), start + rng.choice((0, 0, 1, 3, 20)))
+    return text[:start] + rng.choice(FRAGMENTS) * rng.randint(0, 2) + text[end:]
+
+
+@pytest.mark.parametrize("seed", range(3))
+@pytest.mark.parametrize("max_bytes", [4_000, 60_000, 32 * 1024 * 1024])
+def test_random_edits_match_lexer(lexer, seed, max_bytes):
+    rng = random.Random(seed)
+    # Küçük bloklar çok sayıda sınır üretir; küçük kapasite girdilerin atılmasını zorlar
+    cache = HighlightCache(max_bytes=max_bytes, block_mask=3, min_block_lines=1, max_block_lines=8)
+    versions = [generate(profile, 3_000, seed) for profile in sorted(PROFILES)]
+
+    for step in range(150):
+        if step % 5 == 4:
+            text = rng.choice(versions)  # Daha önce görülmüş sürüm: büyük kapasitede isabet
+        else:
+            text = edit(rng, rng.choice(versions))
+            versions.append(text)
+        expected = lexer.tokenize(text)
+        assert same_tokens(expected, cache.tokenize(text, lexer)), (step, text)
+        assert cache.spans(text, lexer) == spans_of(expected)
+        assert cache.size <= max_bytes
+
+    # Blok sınırları hash() ile seçilir; küçük kapasitede isabet sayısı çalıştırmaya göre değişir
+    stats = cache.stats()
+    if max_bytes == 32 * 1024 * 1024:
+        assert stats["hits"] > 0 and stats["block_hits"] > 0
+
+
+def test_lru_evicts_least_recently_used(lexer):
+    texts = ["int a%d = %d;\n" % (i, i) * 20 for i in range(3)]
+    probe = HighlightCache()
+    probe.tokenize(texts[0], lexer)
+    # İki belgeye yer var, üçüncüsü en eski girdiyi atar (bloklar kapatılır)
+    cache = HighlightCache(max_bytes=probe.size * 2 + 100, min_block_lines=10_000, max_block_lines=10_000)
+
+    cache.tokenize(texts[0], lexer)
+    cache.tokenize(texts[1], lexer)
+    assert cache.get(texts[0]) is not None  # texts[0] en son kullanılan olur
+    cache.tokenize(texts[2], lexer)
+
+    assert cache.get(texts[0]) is not None
+    assert cache.get(texts[1]) is None
+    assert cache.get(texts[2]) is not None
+    assert cache.size <= cache.max_bytes
+
+
+def test_unchanged_blocks_are_reused(lexer):
+    cache = HighlightCache(block_mask=0, min_block_lines=4, max_block_lines=4)
+    text = "".join(f"int v{i} = {i};\n" for i in range(400))
+    cache.tokenize(text, lexer)
+    misses = cache.block_misses
+
+    edited = text.replace("v200 ", "w200 ")
+    assert same_tokens(lexer.tokenize(edited), cache.tokenize(edited, lexer))
+    assert cache.block_misses - misses == 1
+    assert cache.block_hits >= 99
+
+
+def test_trailing_whitespace_joins_next_block(lexer):
+    # Saklanan bloğun sonundaki '\n', girintili sonraki blokla tek boşluk token'ı olmalıdır
+    cache = HighlightCache(block_mask=0, min_block_lines=2, max_block_lines=2)
+    head = "int a = 1;\nint b = 2;\n"
+    cache.tokenize(head + "c();\nd();\n", lexer)
+    indented = head + "    c();\n\nd();\n"
+    hits = cache.block_hits
+    assert same_tokens(lexer.tokenize(indented), cache.tokenize(indented, lexer))
+    assert cache.block_hits > hits
+
+
+def test_block_with_unclosed_comment_is_not_stored(lexer):
+    # '/*' kapanmadığında blok hata ve operatör token'larıyla biter; sonraki metin bağlamı değiştirebilir
+    cache = HighlightCache(block_mask=0, min_block_lines=1, max_block_lines=1)
+    cache.tokenize("a;\n/* açık\nb;\n", lexer)
+    closed = "a;\n/* açık\nb; */\n"
+    assert same_tokens(lexer.tokenize(closed), cache.tokenize(closed, lexer))
+
+
+def test_put_and_get(lexer):
+    cache = HighlightCache()
+    text = "int x = 1;\n"
+    assert cache.get(text) is None
+    tokens = lexer.tokenize(text)
+    cache.put(text, tokens)
+    assert cache.get(text) is tokens
+    assert cache.stats()["hits"] == 1 and cache.stats()["misses"] == 1
+    cache.clear()
+    assert cache.get(text) is None and cache.size == 0
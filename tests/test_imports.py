@@ -0,0 +1,23 @@
+"""Başsız modüllerin `python -X importtime` ile ölçülen içe aktarma süresi bütçesi"""
+import os
+
+import pytest
+
+from src.benchmarks.imports import BUDGET_MS, MODULES, measure, violations
+
+# Yavaş CI makineleri için bütçe ortam değişkeniyle genişletilebilir
+BUDGET = float(os.environ.get("SYNTAX_MIRROR_IMPORT_BUDGET_MS", BUDGET_MS))
+
+
+@pytest.mark.parametrize("module", MODULES)
+def test_import_budget(module):
+    total, own = measure(module, repeat=3)
+    assert module in own
+    assert violations(module, total, own, BUDGET) == []
+
+
+def test_forbidden_modules_are_reported():
+    own = {"src.x": 1.0, "tkinter": 5.0, "tkinter.font": 1.0}
+    failures = violations("src.x", 80.0, own, budget=60.0)
+    assert len(failures) == 2
+    assert "tkinter" in failures[0] and "80.0 ms" in failures[1]
@@ -0,0 +1,64 @@
+"""Artımlı ayrıştırmanın tam ayrıştırmayla aynı ağacı ve hataları vermesi"""
+import random
+
+import pytest
+
+from src.benchmarks.corpus import PROFILES, generate
+from src.benchmarks.incremental_parse import compare, random_text, snapshot
+from src.lexer.incremental import IncrementalLexer
+from src.parser.incremental import IncrementalParser
+from src.parser.parser import Parser
+
+CLASS = "class Big {\n" + "".join(
+    f"    int f{i}(a) {{ if (a > {i}) {{ return a * {i}; }} else {{ return a; }} }}\n"
+    for i in range(200)) + "}\n"
+
+
+def edit(lexer, parser, text, start, old_end, inserted):
+    """Metni düzenle, artımlı ayrıştır ve tam ayrıştırmayla karşılaştır"""
+    text = text[:start] + inserted + text[old_end:]
+    changed = lexer.update(text, start, old_end, start + len(inserted))
+    tokens = snapshot(lexer)
+    root, errors = parser.parse(tokens, changed)
+    expected_root, expected_errors = Parser(tokens).parse()
+    assert str(root) == str(expected_root)
+    assert list(errors) == list(expected_errors)
+    assert parser.error_spans() == [(error.position[0], error.position[1], error.message)
+                                    for error in expected_errors]
+    return text
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_random_edits_match_full_parse(seed):
+    rng = random.Random(seed)
+    texts = [generate(profile, 1000, seed) for profile in sorted(PROFILES)]
+    texts += [random_text(rng, rng.randint(0, 25)) for _ in range(100)]
+    for text in texts:
+        failure, _, _ = compare(text, rng, 8)
+        assert failure is None, failure
+
+
+def test_edit_inside_block_reuses_inner_statements():
+    lexer = IncrementalLexer()
+    lexer.reset(CLASS)
+    parser = IncrementalParser()
+    parser.parse(snapshot(lexer))
+    old_members = parser.root.children[0].children[0].children
+
+    start = CLASS.index("a * 100") + 2
+    edit(lexer, parser, CLASS, start, start + 1, "+")
+    members = parser.root.children[0].children[0].children
+    assert parser.last_reparsed == 1
+    assert parser.last_reused >= 199
+    assert members[98] is old_members[98] and members[101] is old_members[101]
+    assert members[100] is not old_members[100]
+
+
+def test_statement_without_tokens_at_end_is_reparsed():
+    # Dosya sonundaki hata ifadesi token tüketmez; geri takılırsa konum geriye kayardı
+    text = "for(a)()classint[]whileforelse)( class/* y */"
+    lexer = IncrementalLexer()
+    lexer.reset(text)
+    parser = IncrementalParser()
+    parser.parse(snapshot(lexer))
+    edit(lexer, parser, text, 39, 40, "<")
@@ -0,0 +1,123 @@
+"""Ölçüm: aşama yüzdelikleri ve histogramı, özetler ve JSON satırı dökümleri"""
+import json
+import threading
+
+import pytest
+
+from src import instrumentation
+from src.instrumentation import BUCKETS_MS, Instrumentation, PhaseStats
+
+
+def lines(path):
+    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+
+
+def test_percentiles_and_window():
+    stats = PhaseStats(window=1000)
+    for ms in range(1, 101):
+        stats.add(ms / 1000, 2)
+    summary = stats.summary()
+    assert (summary["count"], summary["items"], summary["last_ms"]) == (100, 200, 100)
+    assert summary["p50_ms"] == pytest.approx(51)
+    assert summary["p95_ms"] == pytest.approx(96)
+    assert summary["p99_ms"] == pytest.approx(100)
+    assert summary["mean_ms"] == pytest.approx(50.5)
+    assert summary["items_per_s"] == pytest.approx(200 / 5.05)
+
+    # Yüzdelikler yalnızca son `window` örnekten, sayaçlar tüm kayıtlardan hesaplanır
+    windowed = PhaseStats(window=10)
+    for ms in range(1, 101):
+        windowed.add(ms / 1000, 0)
+    summary = windowed.summary()
+    assert summary["count"] == 100 and summary["p50_ms"] == pytest.approx(96)
+    assert summary["items_per_s"] == 0.0
+
+
+def test_empty_phase():
+    summary = PhaseStats(window=10).summary()
+    assert summary["count"] == 0
+    assert summary["mean_ms"] == summary["p95_ms"] == 0.0
+    assert sum(summary["histogram_ms"].values()) == 0
+
+
+def test_histogram_buckets():
+    stats = PhaseStats(window=10)
+    # Sınır değerler kendi kovalarına, en büyük sınırın üstü "inf" kovasına düşer
+    for ms in (0.05, 0.1, 0.2, 1, 7, 1000, 5000):
+        stats.add(ms / 1000, 0)
+    histogram = stats.summary()["histogram_ms"]
+    assert list(histogram) == [str(bound) for bound in BUCKETS_MS] + ["inf"]
+    assert {bucket: count for bucket, count in histogram.items() if count} == {
+        "0.1": 2, "0.25": 1, "1": 1, "10": 1, "1000": 1, "inf": 1,
+    }
+
+
+def test_snapshot_summary_and_reset():
+    metrics = Instrumentation(window=100)
+    metrics.record("lex", 0.002, 50)
+    metrics.record("lex", 0.004, 70)
+    metrics.record("tag", 0.010)
+    snapshot = metrics.snapshot()
+    assert set(snapshot) == {"lex", "tag"}
+    assert (snapshot["lex"]["count"], snapshot["lex"]["items"]) == (2, 120)
+    # Yalnızca istenen ve kaydedilmiş aşamalar, verilen sırayla
+    assert metrics.summary() == "lex 4.0/4.0 ms tag 10.0/10.0 ms"
+    assert metrics.summary(("tag", "cycle")) == "tag 10.0/10.0 ms"
+    metrics.reset()
+    assert metrics.snapshot() == {} and metrics.summary() == ""
+
+
+def test_dump_appends_json_lines(tmp_path):
+    path = tmp_path / "olcumler.jsonl"
+    metrics = Instrumentation(dump_path=str(path), dump_interval=3600)
+    metrics.record("lex", 0.001, 10)
+    assert not path.exists()  # Aralık dolmadan döküm yapılmaz
+    metrics.dump()
+    metrics.record("lex", 0.003, 10)
+    metrics.dump(str(tmp_path / "diger.jsonl"))
+    metrics.dump()
+    dumps = lines(path)
+    assert [entry["phases"]["lex"]["count"] for entry in dumps] == [1, 2]
+    assert dumps[0]["time"] <= dumps[1]["time"]
+    assert lines(tmp_path / "diger.jsonl")[0]["phases"]["lex"]["items"] == 20
+
+
+def test_periodic_dump_runs_once_per_interval(tmp_path):
+    path = tmp_path / "olcumler.jsonl"
+    metrics = Instrumentation(dump_path=str(path), dump_interval=3600)
+    metrics._last_dump -= 3600  # Aralık doldu
+
+    # Aynı anda kayıt yapan iş parçacıkları aralık başına tek döküm başlatır
+    def worker():
+        for _ in range(200):
+            metrics.record("lex", 0.001)
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    metrics._dump_thread.join()
+    assert len(lines(path)) == 1
+
+
+def test_background_dump_errors_are_ignored(tmp_path):
+    # Dizin olan bir döküm yolu açılamaz; arka plandaki hata kayıt yapanı etkilemez
+    metrics = Instrumentation(dump_path=str(tmp_path), dump_interval=0)
+    metrics.record("lex", 0.001)
+    metrics._dump_thread.join()
+    with pytest.raises(OSError):
+        metrics.dump()
+
+
+def test_enable_and_disable(tmp_path):
+    path = tmp_path / "olcumler.jsonl"
+    try:
+        metrics = instrumentation.enable(window=5, dump_path=str(path), dump_interval=3600)
+        assert instrumentation.active is metrics and metrics.window == 5
+        metrics.record("cycle", 0.02)
+    finally:
+        instrumentation.disable()
+    assert instrumentation.active is None
+    # Kapatırken son anlık görüntü yazılır
+    assert lines(path)[-1]["phases"]["cycle"]["count"] == 1
@@ -0,0 +1,80 @@
+"""Dil tanımları: yerleşik ikinci dil, uzantıya göre seçim ve dil tanımının lexer, ayrıştırıcı ve vurgulayıcıya ulaşması"""
+import json
+
+from src.highlighter.highlighter import SyntaxHighlighter
+from src.language.definition import (
+    LanguageDefinition, available_languages, definition_path, language_for_path, load_language,
+)
+from src.lexer.incremental import IncrementalLexer
+from src.lexer.lexer import Lexer, TokenType
+from src.parser.parser import Parser
+
+SCRIPT = '# yorum // değil\ndef topla(a, b) { return a + b; }\nvar x = topla(0x1F, 2.5);\nvar s = "metin";\n'
+
+
+def kinds(tokens):
+    return [(token.type, token.value) for token in tokens if token.type != TokenType.WHITESPACE]
+
+
+def test_builtin_languages():
+    assert {"default", "script"} <= set(available_languages())
+    script = load_language("script")
+    assert script is load_language(definition_path("script"))
+    assert script.token_specs != load_language("default").token_specs
+
+
+def test_language_for_path_uses_extensions():
+    assert language_for_path("a/b.SCR").name == "script"
+    assert language_for_path("a/b.sm").name == "default"
+    assert language_for_path("a/b.bilinmeyen").name == "default"
+    assert language_for_path("a/b.bilinmeyen", "script").name == "script"
+
+
+def test_script_tokens():
+    tokens = kinds(Lexer("script").tokenize(SCRIPT))
+    assert tokens[0] == (TokenType.COMMENT, "# yorum // değil")
+    assert (TokenType.KEYWORD, "def") in tokens and (TokenType.KEYWORD, "var") in tokens
+    assert (TokenType.NUMBER, "0x1F") in tokens and (TokenType.NUMBER, "2.5") in tokens
+    # Varsayılan dilde '#' tanınmaz, '//' ise yorumdur
+    default = kinds(Lexer().tokenize(SCRIPT))
+    assert default[0] == (TokenType.ERROR, "#")
+    assert (TokenType.COMMENT, "// değil\n") in default
+
+
+def test_script_parses_with_its_declarations():
+    root, errors = Parser(Lexer("script").tokenize(SCRIPT), language="script").parse()
+    assert errors == []
+    assert [child.type for child in root.children] == ["Declaration"] * 3
+    assert [child.value for child in root.children] == ["def", "var", "var"]
+    # Varsayılan dilde 'var' bir tanımlama başlatmaz
+    _, errors = Parser(Lexer().tokenize("var x = 1;\n")).parse()
+    assert errors
+
+
+def test_script_incremental_and_streaming_match_full_lexing():
+    lexer = Lexer("script")
+    expected = lexer.tokenize(SCRIPT)
+    streamed = list(lexer.iter_tokens(SCRIPT[i:i + 5] for i in range(0, len(SCRIPT), 5)))
+    assert [(t.type, t.value, t.position) for t in streamed] == [(t.type, t.value, t.position) for t in expected]
+
+    incremental = IncrementalLexer(lexer)
+    incremental.reset(SCRIPT.replace('"metin"', '"met'))
+    incremental.update(SCRIPT)
+    assert incremental.columns() == (expected.types, expected.starts, expected.ends)
+
+
+def test_highlighter_styles_follow_language():
+    highlighter = SyntaxHighlighter(language="script")
+    assert highlighter.lexer.language.name == "script"
+    assert highlighter.highlighting_rules != SyntaxHighlighter().highlighting_rules
+
+
+def test_definition_from_file(tmp_path):
+    data = json.loads(open(definition_path("script"), encoding="utf-8").read())
+    data["name"] = "kopya"
+    path = tmp_path / "kopya.json"
+    path.write_text(json.dumps(data), encoding="utf-8")
+    copy = load_language(str(path))
+    assert copy.name == "kopya" and copy.path == str(path)
+    fresh = LanguageDefinition(data)
+    assert (fresh.token_specs, fresh.styles, fresh.statements) == (copy.token_specs, copy.styles, copy.statements)
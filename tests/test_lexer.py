@@ -0,0 +1,82 @@
+"""Lexer: token akışının metni eksiksiz kapsaması ve akış halinde taramanın tek seferlik taramayla aynı olması"""
+import os
+
+import pytest
+
+from src.benchmarks.corpus import PROFILES, generate
+from src.lexer.lexer import Lexer, TokenStream, TokenType
+
+SAMPLE = os.path.join(os.path.dirname(__file__), "sample_code.txt")
+
+# Parça sınırlarını zorlayan metinler: kapanmamış dizi ve yorumlar, bölünen sayılar
+EDGE_TEXTS = [
+    "",
+    "x",
+    "int a = 1;",
+    '"kapanmamış dizi\nint b;',
+    "/* kapanmamış yorum\nint c;",
+    "a /* yorum */ b // satır\nc",
+    "3.14159 + 2.5 - 10",
+    "x @ y # z",
+    "'tek' + \"çift\"",
+    "iff if ifx _if if_",
+]
+
+
+@pytest.fixture(scope="module")
+def lexer():
+    return Lexer()
+
+
+def columns(tokens):
+    return [(token.type, token.position) for token in tokens]
+
+
+def test_sample_code_tokens(lexer):
+    with open(SAMPLE, encoding="utf-8") as file:
+        text = file.read()
+    tokens = lexer.tokenize(text)
+
+    values = {(token.type, token.value) for token in tokens}
+    assert (TokenType.KEYWORD, "class") in values
+    assert (TokenType.STRING, '"Test"') in values
+    assert (TokenType.NUMBER, "3.14") in values
+    assert (TokenType.COMMENT, "// Single-line comment\n") in values
+
+
+@pytest.mark.parametrize("text", EDGE_TEXTS + [generate(profile, 5000, 1) for profile in sorted(PROFILES)])
+def test_tokens_cover_text(lexer, text):
+    tokens = lexer.tokenize(text)
+    position = 0
+    for start, end, _ in tokens.spans():
+        assert start == position and end > start
+        position = end
+    assert position == len(text)
+    assert "".join(token.value for token in tokens) == text
+
+
+def test_token_stream_indexing(lexer):
+    tokens = lexer.tokenize("int a = 1;")
+    assert isinstance(tokens, TokenStream)
+    assert len(tokens) == 8
+    assert tokens[0].type == TokenType.KEYWORD and tokens[0].value == "int"
+    assert tokens.type_at(2) == TokenType.IDENTIFIER and tokens.value_at(2) == "a"
+    assert columns(tokens[2:4]) == columns(list(tokens)[2:4])
+
+
+def test_unknown_language():
+    with pytest.raises(ValueError):
+        Lexer(language="böyle-bir-dil-yok")
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 64, 65536])
+@pytest.mark.parametrize("text", EDGE_TEXTS + [generate("mixed", 3000, 2), generate("comment_heavy", 3000, 3)])
+def test_iter_tokens_matches_tokenize(lexer, text, chunk_size):
+    assert columns(lexer.iter_tokens(text, chunk_size)) == columns(lexer.tokenize(text))
+
+
+def test_iter_tokens_reads_bytes_chunks(lexer):
+    text = "string s = \"çğüşöı\"; // yorum\n" * 20
+    data = text.encode("utf-8")
+    chunks = [data[index:index + 5] for index in range(0, len(data), 5)]
+    assert columns(lexer.iter_tokens(iter(chunks))) == columns(lexer.tokenize(text))
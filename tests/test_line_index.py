@@ -0,0 +1,108 @@
+"""Satır dizini: konum dönüşümlerinin uç durumları ve artımlı güncellemenin baştan oluşturmayla aynı olması"""
+import random
+
+import pytest
+
+from src.lexer.line_index import LineIndex
+
+TEXTS = ["", "a", "\n", "\n\n", "ab\ncd", "ab\ncd\n", "a\r\nb\r\n", "a\rb\r", "\r\n\r\n", "x\n\ny\r\n\rz"]
+
+
+def naive_line_col(text, offset):
+    """Metni baştan sayarak (satır, sütun) bul; yalnızca '\\n' satır sonudur"""
+    line = text.count("\n", 0, offset)
+    return line, offset - (text.rfind("\n", 0, offset) + 1)
+
+
+@pytest.mark.parametrize("text", TEXTS)
+def test_line_col_matches_naive(text):
+    index = LineIndex(text)
+    assert len(index) == text.count("\n") + 1
+    for offset in range(len(text) + 1):
+        line, column = index.line_col(offset)
+        assert (line, column) == naive_line_col(text, offset)
+        assert index.line_of(offset) == line
+        assert index.offset(line, column) == offset
+    assert index.line_cols(range(len(text) + 1)) == [index.line_col(offset) for offset in range(len(text) + 1)]
+
+
+def test_bounds():
+    text = "ab\ncd"
+    index = LineIndex(text)
+    assert index.line_col(0) == (0, 0)
+    assert index.line_col(len(text)) == (1, 2)
+    # Metin dışındaki konumlar ve satırlar sınırlara kırpılır
+    assert index.line_col(-5) == (0, 0)
+    assert index.line_col(100) == (1, 2)
+    assert index.offset(-1, 3) == 0
+    assert index.offset(2, 0) == len(text)
+    assert index.offset(1, 100) == len(text)
+
+    empty = LineIndex("")
+    assert (len(empty), empty.line_col(0), empty.offset(0, 0)) == (1, (0, 0), 0)
+
+
+def test_carriage_returns_are_columns():
+    # Yalnızca '\n' satır sonudur (Tk Text ile aynı); '\r' sütun olarak sayılır
+    index = LineIndex("a\r\nb\rc")
+    assert index.starts == [0, 3]
+    assert index.line_col(1) == (0, 1)
+    assert index.line_col(2) == (0, 2)
+    assert index.line_col(5) == (1, 2)
+
+
+@pytest.mark.parametrize("text", TEXTS)
+def test_convert_spans(text):
+    index = LineIndex(text)
+    spans = [(start, min(start + 2, len(text)), None) for start in range(0, len(text), 2)]
+    assert index.convert_spans(spans) == [
+        index.line_col(start) + index.line_col(end) for start, end, _ in spans
+    ]
+    # Satır sonunu ve birden çok satırı kapsayan aralık
+    if text:
+        assert index.convert_spans([(0, len(text))]) == [(0, 0) + index.line_col(len(text))]
+
+
+@pytest.mark.parametrize("start, old_end, inserted", [
+    (0, 0, "\n"),           # baştaki ekleme
+    (2, 2, "\n\n"),         # satır ortasında yeni satırlar
+    (2, 3, ""),             # satır sonunun silinmesi iki satırı birleştirir
+    (1, 7, "x"),            # birden çok satır sonunu kapsayan silme
+    (3, 3, "y"),            # satır başında ekleme (satır sonu yok)
+    (0, 9, ""),             # tüm metin
+    (9, 9, "\r\n"),         # sona ekleme
+    (4, 4, "\r"),
+])
+def test_update_matches_rebuild(start, old_end, inserted):
+    text = "ab\ncd\nef\n"
+    index = LineIndex(text)
+    new_text = text[:start] + inserted + text[old_end:]
+    first_changed, shifted = index.update(new_text, start, old_end, start + len(inserted))
+    fresh = LineIndex(new_text)
+    assert (index.starts, index.length) == (fresh.starts, fresh.length)
+    # İlk değişen satırdan önceki satırlar değişmez; sondaki kayan satırlar da yeni dizinde vardır
+    assert index.starts[:first_changed] == LineIndex(text).starts[:first_changed]
+    assert 0 <= shifted <= len(index.starts) - first_changed
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_random_updates_match_rebuild(seed):
+    rng = random.Random(seed)
+    text = "".join(rng.choice(["a", "\n", "\r", "\r\n", " "]) for _ in range(60))
+    index = LineIndex(text)
+    for _ in range(300):
+        start = rng.randint(0, len(text))
+        old_end = min(len(text), start + rng.choice((0, 0, 1, 2, 5)))
+        inserted = "".join(rng.choice(["b", "\n", "\r", "\r\n"]) for _ in range(rng.randint(0, 3)))
+        text = text[:start] + inserted + text[old_end:]
+        index.update(text, start, old_end, start + len(inserted))
+        fresh = LineIndex(text)
+        assert (index.starts, index.length) == (fresh.starts, fresh.length)
+
+
+def test_copy_is_independent():
+    index = LineIndex("a\nb\n")
+    clone = index.copy()
+    index.update("a\nb\nc\n", 4, 4, 6)
+    assert clone.starts == [0, 2, 4] and clone.length == 4
+    assert index.starts == [0, 2, 4, 6]
@@ -0,0 +1,58 @@
+"""Paralel sözcüksel analizin seri analizle bayt bayt aynı olması"""
+import json
+
+import pytest
+
+from src.benchmarks.corpus import PROFILES, generate
+from src.benchmarks.parallel_lex import adversarial_texts, same_tokens
+from src.language.definition import LanguageDefinition, definition_path
+from src.lexer.lexer import Lexer
+from src.lexer.parallel import split_points, tokenize_parallel
+
+# Küçük parça boyutu metni çok sayıda parçaya böler; her sınır bir giriş durumu sınamasıdır
+CHUNK = 512
+WORKERS = 2
+
+TEXTS = dict(adversarial_texts(20_000))
+TEXTS.update({profile: generate(profile, 20_000, 4) for profile in sorted(PROFILES)})
+
+
+@pytest.fixture(scope="module")
+def lexer():
+    return Lexer()
+
+
+def test_split_points_are_after_newlines():
+    text = "satır\n" * 1000
+    bounds = split_points(text, 8, min_chunk=100)
+    assert bounds[0] == 0 and bounds[-1] == len(text)
+    assert len(bounds) == 9
+    assert all(text[bound - 1] == "\n" for bound in bounds[1:-1])
+    assert bounds == sorted(set(bounds))
+
+
+def test_split_points_without_newlines():
+    assert split_points("x" * 10_000, 8, min_chunk=100) == [0, 10_000]
+
+
+@pytest.mark.parametrize("name", sorted(TEXTS))
+def test_parallel_matches_serial(lexer, name):
+    text = TEXTS[name]
+    assert same_tokens(lexer.tokenize(text), tokenize_parallel(lexer, text, WORKERS, CHUNK))
+
+
+def test_in_memory_language_reaches_workers():
+    # Dosyası olmayan bir tanım: 'foo' anahtar kelime, '#' satır yorumu başlatır
+    with open(definition_path("default"), encoding="utf-8") as file:
+        data = json.load(file)
+    data["name"] = "bellek"
+    data["keywords"].append("foo")
+    data["token_specs"].insert(0, ["HASH_COMMENT", "#[^\\n]*", "COMMENT"])
+    language = LanguageDefinition(data)
+    assert language.path is None
+
+    lexer = Lexer(language=language)
+    text = "foo x; # yorum /* değil\nint y = 1;\n" * 500
+    serial = lexer.tokenize(text)
+    assert not same_tokens(serial, Lexer().tokenize(text))
+    assert same_tokens(serial, tokenize_parallel(lexer, text, WORKERS, CHUNK))
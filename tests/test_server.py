@@ -0,0 +1,180 @@
+"""Vurgulama sunucusu: belge durumu, dil seçimi ve TCP üzerinden uçtan uca JSON-RPC oturumu"""
+import asyncio
+import json
+
+import pytest
+
+from src.language.definition import load_language
+from src.lexer.lexer import Lexer
+from src.server.document import Document, character_column, merge_edits, utf16_column
+from src.server.protocol import (
+    INVALID_REQUEST, METHOD_NOT_FOUND, SERVER_NOT_INITIALIZED, encode_message, read_message,
+)
+from src.server.server import HighlightServer
+
+TEXT = "int a = 1;\nstring s = \"x\";\nif (a) { a = a + 1; }\n"
+
+
+@pytest.fixture
+def server():
+    server = HighlightServer(diagnostics_delay=0)
+    yield server
+    server.close()
+
+
+def test_language_for_ignores_paths(server, tmp_path):
+    # languageId istemciden gelir; dosya yolu olarak açılmamalı
+    definition = tmp_path / "x.json"
+    definition.write_text(json.dumps({"x": 1}), encoding="utf-8")
+    default = load_language()
+    assert server.language_for("file:///a.c", str(definition)) is default
+    assert server.language_for("file:///a.c", str(tmp_path / "yok.json")) is default
+    assert server.language_for("file:///a.c", "default") is default
+
+
+def test_utf16_columns():
+    line = "a\U0001F600b"
+    assert utf16_column(line, 2) == 3
+    assert character_column(line, 3) == 2
+    assert character_column("abc", 10) == 3
+
+
+def test_merge_edits_composes_consecutive_edits():
+    text = "abcdef"
+    first = (1, 3, 4)   # "bc" -> "xyz"
+    middle = text[:1] + "xyz" + text[3:]
+    second = (3, 5, 3)  # "zd" silinir
+    final = middle[:3] + middle[5:]
+    start, old_end, new_end = merge_edits(first, second)
+    assert text[:start] + final[start:new_end] + text[old_end:] == final
+    assert merge_edits(None, second) == second
+
+
+def test_incremental_changes_match_fresh_document():
+    lexer = Lexer()
+    document = Document("file:///a.sm", TEXT, 1, lexer)
+    document.semantic_tokens()
+    document.apply_changes([
+        {"range": {"start": {"line": 0, "character": 8}, "end": {"line": 0, "character": 9}}, "text": "42"},
+        {"range": {"start": {"line": 2, "character": 0}, "end": {"line": 2, "character": 0}}, "text": "// yorum\n"},
+    ], 2)
+    expected = TEXT.replace("= 1;", "= 42;").replace("if (a)", "// yorum\nif (a)")
+    assert document.text == expected
+    fresh = Document("file:///b.sm", expected, 1, lexer)
+    assert document.semantic_tokens() == fresh.semantic_tokens()
+    assert document.diagnostics() == (2, [])
+
+
+def test_diagnostics_report_parse_errors():
+    document = Document("file:///a.sm", "int a = ;\n", 1, Lexer())
+    version, items = document.diagnostics()
+    assert version == 1 and len(items) == 1
+    assert items[0]["range"]["start"] == {"line": 0, "character": 8}
+
+
+class Client:
+    """Testler için en küçük JSON-RPC istemcisi; bildirimleri ayrı bir kuyrukta toplar"""
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+        self.next_id = 0
+        self.notifications = []
+
+    async def send(self, method, params=None, request=True):
+        message = {"jsonrpc": "2.0", "method": method, "params": params or {}}
+        if request:
+            self.next_id += 1
+            message["id"] = self.next_id
+        self.writer.write(encode_message(message))
+        await self.writer.drain()
+        if not request:
+            return None
+        while True:
+            reply = await asyncio.wait_for(read_message(self.reader), 10)
+            if reply.get("id") == message["id"]:
+                return reply
+            self.notifications.append(reply)
+
+    async def notification(self, method):
+        for index, message in enumerate(self.notifications):
+            if message["method"] == method:
+                return self.notifications.pop(index)
+        while True:
+            message = await asyncio.wait_for(read_message(self.reader), 10)
+            if message.get("method") == method:
+                return message
+
+
+def test_session_over_tcp(server):
+    async def session():
+        tcp = await server.serve_tcp("127.0.0.1", 0)
+        host, port = tcp.sockets[0].getsockname()[:2]
+        client = Client(*await asyncio.open_connection(host, port))
+        uri = "file:///belge.sm"
+        try:
+            early = await client.send("textDocument/semanticTokens/full", {"textDocument": {"uri": uri}})
+            assert early["error"]["code"] == SERVER_NOT_INITIALIZED
+
+            reply = await client.send("initialize", {"capabilities": {}})
+            assert reply["result"]["capabilities"]["positionEncoding"] == "utf-16"
+
+            await client.send("textDocument/didOpen", {"textDocument": {
+                "uri": uri, "languageId": "default", "version": 1, "text": "int a = ;\n",
+            }}, request=False)
+            diagnostics = await client.notification("textDocument/publishDiagnostics")
+            assert diagnostics["params"]["uri"] == uri
+            assert len(diagnostics["params"]["diagnostics"]) == 1
+
+            await client.send("textDocument/didChange", {
+                "textDocument": {"uri": uri, "version": 2},
+                "contentChanges": [{"range": {"start": {"line": 0, "character": 8},
+                                              "end": {"line": 0, "character": 8}}, "text": "1"}],
+            }, request=False)
+            full = await client.send("textDocument/semanticTokens/full", {"textDocument": {"uri": uri}})
+            expected = Document("file:///x.sm", "int a = 1;\n", 1, Lexer()).semantic_tokens()
+            assert full["result"]["data"] == expected
+
+            report = await client.send("textDocument/diagnostic", {"textDocument": {"uri": uri}})
+            assert report["result"]["items"] == []
+
+            unknown = await client.send("textDocument/hover", {})
+            assert unknown["error"]["code"] == METHOD_NOT_FOUND
+
+            assert (await client.send("shutdown"))["result"] is None
+            await client.send("exit", request=False)
+        finally:
+            client.writer.close()
+            tcp.close()
+            await tcp.wait_closed()
+
+    asyncio.run(session())
+
+
+def test_notification_errors_keep_session_alive(server):
+    async def session():
+        tcp = await server.serve_tcp("127.0.0.1", 0)
+        host, port = tcp.sockets[0].getsockname()[:2]
+        client = Client(*await asyncio.open_connection(host, port))
+        try:
+            await client.send("initialize", {"capabilities": {}})
+            # didClose ile yarışan didChange: belge artık açık değil
+            await client.send("textDocument/didChange", {
+                "textDocument": {"uri": "file:///kapali.sm", "version": 2},
+                "contentChanges": [{"text": "x"}],
+            }, request=False)
+            log = await client.notification("window/logMessage")
+            assert "file:///kapali.sm" in log["params"]["message"]
+
+            # Sözlük veya liste kimlikli istekler görev tablosuna anahtar olamaz
+            for request_id in ({"a": 1}, [1], True):
+                client.writer.write(encode_message({"jsonrpc": "2.0", "id": request_id, "method": "shutdown"}))
+                reply = await asyncio.wait_for(read_message(client.reader), 10)
+                assert reply["id"] is None and reply["error"]["code"] == INVALID_REQUEST
+
+            assert (await client.send("shutdown"))["result"] is None
+        finally:
+            client.writer.close()
+            tcp.close()
+            await tcp.wait_closed()
+
+    asyncio.run(session())
@@ -0,0 +1,97 @@
+"""Sıkıştırılmış ikili aralık biçiminin kodlanıp çözüldüğünde aynı aralıkları vermesi"""
+from array import array
+
+import pytest
+
+from src.benchmarks.corpus import PROFILES, generate
+from src.highlighter.highlighter import SyntaxHighlighter
+from src.highlighter.spans import SPAN_WIDTH, decode_spans, encode_spans, span_view, style_table
+from src.lexer.lexer import Lexer, TokenType
+from src.lexer.line_index import LineIndex
+
+IDENTIFIER = TokenType.IDENTIFIER.value
+OPERATOR = TokenType.OPERATOR.value
+WHITESPACE = TokenType.WHITESPACE.value
+LIMIT = 2 ** 32
+
+
+def round_trip(types, starts, ends, line_starts):
+    """Sütunları kodla ve çöz; (kodlanmış veri, (başlangıç, bitiş, tür) listesi) döndür"""
+    data = encode_spans(array('B', types), array('q', starts), array('q', ends), line_starts)
+    return data, decode_spans(data, line_starts)
+
+
+def expected_spans(types, starts, ends):
+    return [(start, end, TokenType(code)) for code, start, end in zip(types, starts, ends) if code != WHITESPACE]
+
+
+def test_empty_stream():
+    data, spans = round_trip([], [], [], [0])
+    assert len(data) == 0 and spans == []
+    assert decode_spans(span_view(b""), [0]) == []
+
+
+def test_adjacent_spans_and_gaps():
+    # "ab+c  d" ve ikinci satırda "e": bitişik token'lar, boşluk ve token'sız boşluklar
+    types = [IDENTIFIER, OPERATOR, IDENTIFIER, WHITESPACE, IDENTIFIER, IDENTIFIER]
+    starts = [0, 2, 3, 4, 6, 20]
+    ends = [2, 3, 4, 6, 7, 21]
+    line_starts = [0, 10, 18]
+    data, spans = round_trip(types, starts, ends, line_starts)
+    assert spans == expected_spans(types, starts, ends)
+    assert list(data[:SPAN_WIDTH]) == [0, 0, 2, IDENTIFIER]
+    assert list(data[SPAN_WIDTH:2 * SPAN_WIDTH]) == [0, 2, 1, OPERATOR]
+    # Boş ikinci satır atlanır: satır farkı 2, sütun satır başına göre
+    assert list(data[-SPAN_WIDTH:]) == [2, 2, 1, IDENTIFIER]
+
+
+def test_multiline_token_keeps_length():
+    text = "a /* x\ny */ b\n"
+    tokens = Lexer().tokenize(text)
+    line_starts = LineIndex(text).starts
+    spans = decode_spans(encode_spans(tokens.types, tokens.starts, tokens.ends, line_starts), line_starts)
+    assert spans == expected_spans(tokens.types, tokens.starts, tokens.ends)
+    assert (2, 11, TokenType.COMMENT) in spans
+
+
+def test_offsets_near_32_bit_limit():
+    # Göreli kodlamada yalnızca satır farkı, sütun ve uzunluk 32 bite sığmalıdır
+    types = [IDENTIFIER, OPERATOR, IDENTIFIER]
+    starts = [LIMIT - 10, LIMIT - 1, LIMIT + 5]
+    ends = [LIMIT - 1, LIMIT, LIMIT + 7]
+    line_starts = [0, LIMIT + 1]
+    data, spans = round_trip(types, starts, ends, line_starts)
+    assert spans == expected_spans(types, starts, ends)
+    assert list(data[SPAN_WIDTH:2 * SPAN_WIDTH]) == [0, 9, 1, OPERATOR]
+
+    data, spans = round_trip([IDENTIFIER], [0], [LIMIT - 1], [0])
+    assert spans == [(0, LIMIT - 1, TokenType.IDENTIFIER)]
+
+    # Sütun veya uzunluk 2**32'ye ulaşırsa sessizce kesilmez
+    with pytest.raises(OverflowError):
+        round_trip([IDENTIFIER], [LIMIT], [LIMIT + 1], [0])
+    with pytest.raises(OverflowError):
+        round_trip([IDENTIFIER], [0], [LIMIT], [0])
+
+
+@pytest.mark.parametrize("profile", sorted(PROFILES))
+def test_highlight_encoded_matches_token_spans(profile):
+    text = generate(profile, 20_000, 1)
+    highlighter = SyntaxHighlighter()
+    data = highlighter.highlight_encoded(text)
+    line_starts = highlighter.line_index(text).starts
+    assert decode_spans(data, line_starts) == highlighter.token_spans(text)
+
+    # Tampon üzerinden kopyasız okuma ve tür başına stil tablosu
+    view = span_view(bytearray(data.tobytes()))
+    assert decode_spans(view, line_starts) == highlighter.token_spans(text)
+    table = style_table(highlighter.highlighting_rules)
+    assert decode_spans(data, line_starts, table) == [
+        (start, end, highlighter.highlighting_rules.get(token_type))
+        for start, end, token_type in highlighter.token_spans(text)
+    ]
+
+
+def test_span_view_rejects_partial_records():
+    with pytest.raises(ValueError):
+        span_view(array('I', [0, 0, 1]).tobytes())
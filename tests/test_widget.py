@@ -0,0 +1,201 @@
+"""Aralık farkıyla etiketlemenin tam yeniden etiketlemeyle aynı etiketleri bırakması"""
+import random
+from array import array
+
+import pytest
+
+from src.benchmarks.corpus import generate
+from src.highlighter.highlighter import SyntaxHighlighter
+from src.highlighter.widget import WidgetHighlighter
+from src.lexer.line_index import LineIndex
+
+
+class TaggingWidget:
+    """
+    Vurgulayıcının kullandığı Text widget çağrılarını uygulayan ve etiketlerin hangi
+    karakterlerde olduğunu tutan sahte widget. Metin Tk Text gibi düzenlenir:
+    silinen karakterlerin etiketleri gider, eklenen karakterler iki komşusunda da
+    olan etiketleri alır. Karşılaştırma paketindeki sayaç widget'ından bağımsızdır.
+    """
+    def __init__(self, text=""):
+        self.text = text
+        self.lines = LineIndex(text)
+        self.tags = {}  # etiket adı -> etiketli karakter konumları
+        self.removes = self.adds = 0
+
+    def _offset(self, index):
+        if index == "end":
+            return len(self.text)
+        line, column = (int(part) for part in index.split("."))
+        starts = self.lines.starts
+        if line > len(starts):
+            return len(self.text)
+        line_end = starts[line] - 1 if line < len(starts) else len(self.text)
+        return min(starts[line - 1] + column, line_end)
+
+    def __str__(self):
+        return ".mock_text"
+
+    def tag_configure(self, tag, **options):
+        pass
+
+    def tag_raise(self, tag):
+        pass
+
+    def tag_remove(self, tag, first, last):
+        self.removes += 1
+        self.tags.get(tag, set()).difference_update(range(self._offset(first), self._offset(last)))
+
+    def tag_add(self, tag, *indices):
+        self.adds += 1
+        tagged = self.tags.setdefault(tag, set())
+        for first, last in zip(indices[::2], indices[1::2]):
+            tagged.update(range(self._offset(first), self._offset(last)))
+
+    def replace(self, start, old_end, inserted):
+        """[start, old_end) karakterlerini değiştir; (başlangıç, eski_bitiş, yeni_bitiş) döndür"""
+        delta = len(inserted) - (old_end - start)
+        new_end = start + len(inserted)
+        for tag, tagged in self.tags.items():
+            kept = {offset if offset < start else offset + delta
+                    for offset in tagged if offset < start or offset >= old_end}
+            # Yeni karakterler, eklenme noktasının iki yanında da olan etiketleri alır
+            if inserted and start - 1 in tagged and old_end in tagged:
+                kept.update(range(start, new_end))
+            self.tags[tag] = kept
+        self.text = self.text[:start] + inserted + self.text[old_end:]
+        self.lines = LineIndex(self.text)
+        return start, old_end, new_end
+
+    def tag_state(self):
+        return {tag: tagged for tag, tagged in self.tags.items() if tagged}
+
+
+def make(text):
+    """(vurgulayıcı, widget) döndür; Tk yazı tipleri yerine yer tutucular kullanılır"""
+    highlighter = SyntaxHighlighter()
+    adapter = highlighter.widget_adapter
+    adapter.normal_font = adapter.bold_font = adapter.italic_font = adapter.bold_italic_font = "mock"
+    return highlighter, TaggingWidget(text)
+
+
+def full_tags(text):
+    """Boş bir widget'ın tam etiketlemeden sonraki etiketleri"""
+    highlighter, widget = make(text)
+    highlighter.apply_highlighting_to_widget(widget, text)
+    return widget.tag_state()
+
+
+def edit_and_apply(highlighter, widget, start, old_end, inserted):
+    edit = widget.replace(start, old_end, inserted)
+    widget.removes = widget.adds = 0
+    highlighter.apply_highlighting_to_widget(widget, widget.text, edit=edit)
+
+
+TEXT = 'class A {\n  int f(x) {\n    return x + 1; // bir\n  }\n}\n/* yorum */\nstring s = "metin";\n'
+
+
+@pytest.mark.parametrize("start, old_end, inserted", [
+    (TEXT.index("return"), TEXT.index("return") + 6, "retur"),   # anahtar kelime tanımlayıcı olur
+    (TEXT.index("/* yorum"), TEXT.index("/* yorum") + 2, ""),    # yorum açılışı silinir
+    (TEXT.index('"metin'), TEXT.index('"metin') + 1, ""),        # dizi kapanmaz
+    (TEXT.index("1;"), TEXT.index("1;"), "23 "),                 # sayı uzar
+    (0, 0, "/*"),                                               # tüm metin yorum olur
+    (len(TEXT), len(TEXT), "x"),
+])
+def test_edit_and_undo_match_full_retag(start, old_end, inserted):
+    highlighter, widget = make(TEXT)
+    highlighter.apply_highlighting_to_widget(widget, TEXT)
+    assert widget.tag_state() == full_tags(TEXT)
+
+    removed_text = TEXT[start:old_end]
+    edit_and_apply(highlighter, widget, start, old_end, inserted)
+    assert widget.tag_state() == full_tags(widget.text)
+
+    edit_and_apply(highlighter, widget, start, start + len(inserted), removed_text)
+    assert widget.text == TEXT
+    assert widget.tag_state() == full_tags(TEXT)
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_random_edits_match_full_retag(seed):
+    rng = random.Random(seed)
+    text = generate("mixed", 1_500, seed)
+    highlighter, widget = make(text)
+    highlighter.apply_highlighting_to_widget(widget, text)
+    fragments = ["x", " ", "\n", "if", "(", '"', "/*", "*/", "//", "42", ";"]
+    for _ in range(25):
+        start = rng.randint(0, len(widget.text))
+        old_end = min(len(widget.text), start + rng.choice((0, 1, 3)))
+        edit_and_apply(highlighter, widget, start, old_end, rng.choice(fragments) * rng.randint(0, 2))
+        assert widget.tag_state() == full_tags(widget.text)
+
+
+def test_edit_makes_bounded_tag_calls():
+    text = generate("mixed", 200_000, 2)
+    highlighter, widget = make(text)
+    highlighter.apply_highlighting_to_widget(widget, text)
+
+    # Belgenin ortasındaki bir tanımlayıcıya tek karakter eklenir
+    position = text.index(" count", len(text) // 2) + 1
+    edit_and_apply(highlighter, widget, position, position, "x")
+    assert widget.removes + widget.adds <= 6
+
+    edit_and_apply(highlighter, widget, position, position + 1, "")
+    assert widget.removes + widget.adds <= 6
+
+
+@pytest.mark.parametrize("start, old_end, inserted", [
+    (TEXT.index("return"), TEXT.index("return") + 6, "retur"),
+    (0, 0, "/*"),
+])
+def test_compacted_record_keeps_diffing(start, old_end, inserted):
+    highlighter, widget = make(TEXT)
+    highlighter.apply_highlighting_to_widget(widget, TEXT)
+    applied = highlighter.widget_adapter._applied[str(widget)][1]
+
+    # Etkin olmayan sekmenin kaydı ikili biçimde tutulur ve aynı aralıklara açılır
+    highlighter.compact_widget(widget)
+    record = highlighter.widget_adapter._applied[str(widget)][1]
+    assert isinstance(record, array) and len(record) * record.itemsize == 16 * len(applied)
+    assert highlighter.widget_adapter._state(str(widget))[1] == applied
+
+    # Düzenleme, sıkıştırılmamış kayıtla aynı Tk çağrılarını yapar
+    twin_highlighter, twin = make(TEXT)
+    twin_highlighter.apply_highlighting_to_widget(twin, TEXT)
+    edit_and_apply(twin_highlighter, twin, start, old_end, inserted)
+    edit_and_apply(highlighter, widget, start, old_end, inserted)
+    assert widget.tag_state() == full_tags(widget.text)
+    assert (widget.removes, widget.adds) == (twin.removes, twin.adds)
+
+    # Satır aralığı temizleme de sıkıştırılmış kayıttan çalışır
+    text = widget.text
+    highlighter.compact_widget(widget)
+    highlighter.clear_highlighting(widget, 2, 3, text)
+    highlighter.apply_highlighting_to_widget(widget, text)
+    assert widget.tag_state() == full_tags(text)
+
+
+def test_diff_spans():
+    old = [(0, 3, "a"), (4, 5, "b"), (6, 8, "c"), (9, 10, "d")]
+    new = [(0, 3, "a"), (4, 5, "x"), (6, 7, "c"), (9, 10, "d"), (11, 12, "e")]
+    removed, added = WidgetHighlighter._diff_spans(old, new)
+    assert removed == [(4, 5, "b"), (6, 8, "c")]
+    assert added == [(4, 5, "x"), (6, 7, "c"), (11, 12, "e")]
+    assert WidgetHighlighter._diff_spans(old, old) == ([], [])
+    assert WidgetHighlighter._diff_spans([], new) == ([], new)
+
+    # Blok karşılaştırması kullanılan uzun ortak önek ve sonek
+    long = [(i * 2, i * 2 + 1, "t") for i in range(5_000)]
+    changed = long[:2_500] + [(5_000, 5_001, "u")] + long[2_501:]
+    assert WidgetHighlighter._diff_spans(long, changed) == ([(5_000, 5_001, "t")], [(5_000, 5_001, "u")])
+
+
+def test_split_spans():
+    spans = [(0, 3, "a"), (4, 10, "b"), (12, 14, "c"), (15, 20, "d")]
+    head, inside, tail = WidgetHighlighter._split_spans(spans, 5, 16)
+    assert head == [(0, 3, "a"), (4, 5, "b")]
+    assert inside == [(5, 10, "b"), (12, 14, "c"), (15, 16, "d")]
+    assert tail == [(16, 20, "d")]
+    assert WidgetHighlighter._split_spans(spans, 0, 100) == ([], spans, [])
+    assert WidgetHighlighter._split_spans(spans, 20, 30) == (spans, [], [])
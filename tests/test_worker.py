@@ -0,0 +1,52 @@
+"""Arka plan analiz işçisi ve dosyadan okuma: sonuçlar, baştan tarama, satır sonları"""
+import queue
+
+import pytest
+
+from src.gui.file_loader import read_mapped_text
+from src.gui.worker import AnalysisWorker
+from src.lexer.lexer import Lexer
+
+
+@pytest.fixture
+def worker():
+    results = queue.Queue()
+    worker = AnalysisWorker(results.put, parse=True)
+    worker.results = results
+    yield worker
+    worker.stop()
+
+
+def test_submit_returns_tokens_and_ast(worker):
+    text = "int a = 1;\nif (a) { a = 2; }\n"
+    worker.submit(1, text, "belge")
+    result = worker.results.get(timeout=10)
+    assert (result.generation, result.document, result.text) == (1, "belge", text)
+    expected = Lexer().tokenize(text)
+    assert (result.tokens.types, result.tokens.starts, result.tokens.ends) == (
+        expected.types, expected.starts, expected.ends)
+    assert result.errors == []
+
+
+def test_reset_rescans_from_scratch(worker):
+    worker.submit(1, "int a = 1;\n", "belge")
+    worker.results.get(timeout=10)
+    # Aynı belgeye yeni açılan dosya: önceki metinle karşılaştırılmadan taranır
+    text = "/* yeni */ string s;\n"
+    worker.submit(2, text, "belge", reset=True)
+    result = worker.results.get(timeout=10)
+    expected = Lexer().tokenize(text)
+    assert (result.generation, result.text) == (2, text)
+    assert (result.tokens.types, result.tokens.starts, result.tokens.ends) == (
+        expected.types, expected.starts, expected.ends)
+
+
+@pytest.mark.parametrize("data", [b"", b"a", b"a\n", b"a\r", b"a\r\nb\r", b"x\r\n", b"\xc4\x9f\xff", b"a\xc4"])
+def test_read_mapped_text(tmp_path, data):
+    path = tmp_path / "a.txt"
+    path.write_bytes(data)
+    expected = data.decode("utf-8", "replace").replace("\r\n", "\n").replace("\r", "\n")
+    assert read_mapped_text(path) == expected
+    # Text widget'ının sona eklediği satır sonu
+    assert read_mapped_text(path, final_newline=True) == expected + "\n"
+    assert read_mapped_text(path, "utf-16", final_newline=True) == read_mapped_text(path, "utf-16") + "\n"